@@ -0,0 +1,47 @@
+"""Compare adding cutting planes incrementally and from scratch.
+
+Run with ``python bench/bench_append_rows.py``.
+"""
+
+import random
+import timeit
+
+import cdd
+import cdd.gmp
+
+
+def main() -> None:
+    rng = random.Random(0)
+    for dim, num_cuts in [(3, 100), (4, 50), (5, 25)]:
+        # cube, cut by random planes that keep the origin feasible
+        cube = [[1] + [-1 if i == j else 0 for j in range(dim)] for i in range(dim)]
+        cube += [[1] + [1 if i == j else 0 for j in range(dim)] for i in range(dim)]
+        cuts = [
+            [rng.randint(50, 100)] + [rng.randint(-99, 99) for _ in range(dim)]
+            for _ in range(num_cuts)
+        ]
+        print(f"dim {dim}, {num_cuts} cuts")
+        for name, mod in [("cdd", cdd), ("cdd.gmp", cdd.gmp)]:
+
+            def append() -> None:
+                poly = mod.polyhedron_from_matrix(
+                    mod.matrix_from_array(cube, rep_type=cdd.RepType.INEQUALITY)
+                )
+                for cut in cuts:
+                    mod.polyhedron_append_rows(poly, mod.matrix_from_array([cut]))
+
+            def recompute() -> None:
+                for i in range(len(cuts)):
+                    mod.polyhedron_from_matrix(
+                        mod.matrix_from_array(
+                            cube + cuts[: i + 1], rep_type=cdd.RepType.INEQUALITY
+                        )
+                    )
+
+            for case, func in [("append", append), ("recompute", recompute)]:
+                seconds = min(timeit.repeat(func, number=1, repeat=3))
+                print(f"{name + ' ' + case:35} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
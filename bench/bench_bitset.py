@@ -0,0 +1,36 @@
+"""Compare incidence output as Python sets and as packed bitsets.
+
+Run with ``python bench/bench_bitset.py``.
+"""
+
+import timeit
+
+import numpy as np
+
+import cdd
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    # random points on the unit sphere in 4 dimensions
+    points = rng.normal(size=(1000, 4))
+    points /= np.linalg.norm(points, axis=1)[:, np.newaxis]
+    array = np.hstack([np.ones((points.shape[0], 1)), points])
+    mat = cdd.matrix_from_array(array, rep_type=cdd.RepType.GENERATOR)
+    poly = cdd.polyhedron_from_matrix(mat)
+    cases = [
+        ("copy_incidence", lambda: cdd.copy_incidence(poly)),
+        ("copy_incidence_bitset", lambda: cdd.copy_incidence_bitset(poly)),
+        ("copy_input_incidence", lambda: cdd.copy_input_incidence(poly)),
+        ("copy_input_incidence_bitset", lambda: cdd.copy_input_incidence_bitset(poly)),
+    ]
+    print(
+        f"{points.shape[0]} vertices, {len(cdd.copy_inequalities(poly).array)} facets"
+    )
+    for name, func in cases:
+        seconds = min(timeit.repeat(func, number=1, repeat=5))
+        print(f"{name:35} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
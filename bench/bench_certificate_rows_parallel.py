@@ -0,0 +1,50 @@
+"""Compare sequential and parallel redundancy checks.
+
+Run with ``python bench/bench_certificate_rows_parallel.py``.
+"""
+
+import math
+import os
+import random
+import timeit
+
+import cdd
+import cdd.gmp
+
+
+def random_polytope(rng: random.Random, dim: int, num_rows: int) -> list[list[float]]:
+    # halfspaces tangent to the unit sphere, or further away
+    array = []
+    for _ in range(num_rows):
+        a = [rng.gauss(0, 1) for _ in range(dim)]
+        norm = math.sqrt(sum(x * x for x in a))
+        b = 1.0 if rng.random() < 0.5 else 1.0 + rng.random()
+        array.append([b] + [-x / norm for x in a])
+    return array
+
+
+def main() -> None:
+    rng = random.Random(0)
+    cpu_count = os.cpu_count() or 1
+    print(f"{cpu_count} processors")
+    for name, mod, num_rows in [("cdd", cdd, 2000), ("cdd.gmp", cdd.gmp, 200)]:
+        mat = mod.matrix_from_array(
+            random_polytope(rng, 6, num_rows),
+            rep_type=cdd.RepType.INEQUALITY,
+            max_denominator=1000,
+        )
+        for func in [mod.redundant_rows, mod.s_redundant_rows]:
+            for max_workers in sorted({1, 2, cpu_count}):
+                seconds = min(
+                    timeit.repeat(
+                        lambda: func(mat, max_workers=max_workers),
+                        number=1,
+                        repeat=3,
+                    )
+                )
+                label = f"{name} {func.__name__} {max_workers}"
+                print(f"{label:35} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Compare canonicalization with and without the duplicate row pre-pass.
+
+Run with ``python bench/bench_dedup.py``.
+"""
+
+import random
+import timeit
+
+import cdd
+import cdd.gmp
+
+
+def main() -> None:
+    rng = random.Random(0)
+    for dim, num_rows, copies in [(3, 50, 4), (4, 40, 5), (5, 30, 8)]:
+        # random inequalities, each repeated several times with a random scale
+        rows = [
+            [rng.randint(1, 9)] + [rng.randint(-9, 9) for _ in range(dim)]
+            for _ in range(num_rows)
+        ]
+        array = [
+            [scale * x for x in row]
+            for row in rows
+            for scale in rng.sample(range(1, 10), copies)
+        ]
+        rng.shuffle(array)
+        print(f"dim {dim}, {len(array)} rows, {num_rows} distinct")
+        for module in [cdd, cdd.gmp]:
+            mat = module.matrix_from_array(array, rep_type=cdd.RepType.INEQUALITY)
+            for dedup in [False, True]:
+
+                def func() -> None:
+                    module.matrix_canonicalize(module.matrix_copy(mat), dedup=dedup)
+
+                name = f"{module.__name__} canonicalize dedup={dedup}"
+                seconds = min(timeit.repeat(func, number=3, repeat=3)) / 3
+                print(f"{name:35} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Compare the face lattice enumeration from incidence bitsets
+with a closure enumeration in pure Python.
+
+Run with ``python bench/bench_face_lattice.py``.
+"""
+
+import timeit
+from collections.abc import Sequence, Set
+
+import numpy as np
+
+import cdd
+
+
+def closure_faces(facets: Sequence[Set[int]], num_vertices: int) -> set[frozenset[int]]:
+    # all intersections of facets, one facet at a time
+    faces = {frozenset(range(num_vertices))}
+    new_faces = set(faces)
+    while new_faces:
+        new_faces = {face & facet for face in new_faces for facet in facets} - faces
+        faces |= new_faces
+    return faces | {frozenset()}
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    # random points on the unit sphere in 4 dimensions, rounded to integers
+    points = rng.normal(size=(100, 4))
+    points /= np.linalg.norm(points, axis=1)[:, np.newaxis]
+    array = np.hstack([np.ones((points.shape[0], 1)), np.round(1000 * points)])
+    mat = cdd.matrix_from_array(array.tolist(), rep_type=cdd.RepType.GENERATOR)
+    poly = cdd.polyhedron_from_matrix(mat)
+    num_vertices = points.shape[0]
+    facets = [frozenset(inc) for inc in cdd.copy_incidence(poly)]
+    print(cdd.f_vector(poly))
+    cases = [
+        ("closure_faces", lambda: closure_faces(facets, num_vertices), 1),
+        ("face_lattice", lambda: list(cdd.face_lattice(poly)), 5),
+        ("face_lattice bitset", lambda: list(cdd.face_lattice(poly, bitset=True)), 5),
+        ("face_lattice max_dim=1", lambda: list(cdd.face_lattice(poly, 1)), 5),
+        ("f_vector", lambda: cdd.f_vector(poly), 5),
+        ("f_vector max_dim=1", lambda: cdd.f_vector(poly, 1), 5),
+    ]
+    for name, func, repeat in cases:
+        seconds = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{name:35} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
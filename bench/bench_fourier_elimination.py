@@ -0,0 +1,47 @@
+"""Compare Fourier elimination of several variables with and without pruning,
+and with block elimination.
+
+Run with ``python bench/bench_fourier_elimination.py``.
+"""
+
+import random
+import timeit
+
+import cdd
+import cdd.gmp
+
+
+def main() -> None:
+    rng = random.Random(0)
+    dim, num_rows, num_elim = 6, 20, 4
+    # random polytope: a box cut by random inequalities
+    array = [
+        [10] + [sign if j == i else 0 for j in range(dim)]
+        for i in range(dim)
+        for sign in (-1, 1)
+    ] + [
+        [rng.randint(5, 20)] + [rng.randint(-5, 5) for _ in range(dim)]
+        for _ in range(num_rows - 2 * dim)
+    ]
+    col_set = set(range(1, num_elim + 1))
+    print(f"dim {dim}, {num_rows} rows, eliminate {num_elim} columns")
+    for module in [cdd, cdd.gmp]:
+        mat = module.matrix_from_array(array, rep_type=cdd.RepType.INEQUALITY)
+        cases = [
+            (
+                f"fourier {prune}",
+                lambda prune=prune: module.fourier_elimination(
+                    mat, col_set, prune=prune
+                ),
+            )
+            for prune in ["none", "lp", "shooting"]
+        ] + [("block", lambda: module.block_elimination(mat, col_set))]
+        for name, func in cases:
+            seconds = min(timeit.repeat(func, number=1, repeat=3))
+            label = f"{module.__name__} {name}"
+            num_rows_out = len(func().array)
+            print(f"{label:35} {seconds * 1000:10.2f} ms {num_rows_out:10} rows")
+
+
+if __name__ == "__main__":
+    main()
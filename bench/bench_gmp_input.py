@@ -0,0 +1,39 @@
+"""Compare importing small and large numbers into exact matrices.
+
+Run with ``python bench/bench_gmp_input.py``.
+"""
+
+import random
+import timeit
+from fractions import Fraction
+
+import cdd.gmp
+
+
+def main() -> None:
+    rng = random.Random(0)
+    shape = (2000, 20)
+
+    def array(func):
+        return [[func() for _ in range(shape[1])] for _ in range(shape[0])]
+
+    cases = [
+        ("small int", array(lambda: rng.randrange(-1000, 1000))),
+        ("small Fraction", array(lambda: Fraction(rng.randrange(1000), 999))),
+        ("Fraction from float", array(lambda: Fraction(rng.uniform(-1, 1)))),
+        ("1000 digit int", array(lambda: rng.randrange(10**1000))),
+        (
+            "1000 digit Fraction",
+            array(lambda: Fraction(rng.randrange(10**1000), rng.randrange(10**1000))),
+        ),
+    ]
+    print(f"shape {shape}")
+    for name, arr in cases:
+        seconds = min(
+            timeit.repeat(lambda: cdd.gmp.matrix_from_array(arr), number=1, repeat=5)
+        )
+        print(f"{name:35} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Compare exporting exact matrices as Fraction and as gmpy2.mpq.
+
+Run with ``python bench/bench_gmp_output.py``.
+"""
+
+import random
+import timeit
+from fractions import Fraction
+
+import gmpy2
+
+import cdd.gmp
+
+
+def main() -> None:
+    rng = random.Random(0)
+    for digits, shape in [(1000, (200, 20)), (5, (20000, 20))]:
+        mat = cdd.gmp.matrix_from_array(
+            [
+                [
+                    Fraction(
+                        rng.randrange(-(10**digits), 10**digits),
+                        rng.randrange(1, 10**digits),
+                    )
+                    for _ in range(shape[1])
+                ]
+                for _ in range(shape[0])
+            ]
+        )
+        print(f"shape {shape}, {digits} digits")
+        for output_type in [Fraction, gmpy2.mpq]:
+            cdd.gmp.set_output_type(output_type)
+            seconds = min(timeit.repeat(lambda: mat.array, number=1, repeat=5))
+            name = f"mat.array as {output_type.__name__}"
+            print(f"{name:35} {seconds * 1000:10.2f} ms")
+        cdd.gmp.set_output_type(Fraction)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Compare the vertex and facet graphs from incidence bitsets
+with cddlib's adjacency and with linear programming.
+
+Run with ``python bench/bench_graph.py``.
+"""
+
+import timeit
+
+import numpy as np
+
+import cdd
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    # random points on the unit sphere in 4 dimensions, rounded to integers
+    # so that linear programming is numerically stable
+    points = rng.normal(size=(300, 4))
+    points /= np.linalg.norm(points, axis=1)[:, np.newaxis]
+    array = np.hstack([np.ones((points.shape[0], 1)), np.round(1000 * points)])
+    mat = cdd.matrix_from_array(array, rep_type=cdd.RepType.GENERATOR)
+    poly = cdd.polyhedron_from_matrix(mat)
+    # compute the incidences once, as they are shared by all cases
+    cdd.copy_incidence(poly)
+    cases = [
+        ("matrix_adjacency", lambda: cdd.matrix_adjacency(mat), 1),
+        ("copy_input_adjacency", lambda: cdd.copy_input_adjacency(poly), 5),
+        ("polyhedron_vertex_graph", lambda: cdd.polyhedron_vertex_graph(poly), 5),
+        ("copy_adjacency", lambda: cdd.copy_adjacency(poly), 5),
+        ("polyhedron_facet_graph", lambda: cdd.polyhedron_facet_graph(poly), 5),
+    ]
+    print(
+        f"{points.shape[0]} vertices, {len(cdd.copy_inequalities(poly).array)} facets"
+    )
+    for name, func, repeat in cases:
+        seconds = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{name:35} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
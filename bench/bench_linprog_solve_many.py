@@ -0,0 +1,37 @@
+"""Compare solving many small linear programs one by one and in a batch.
+
+Run with ``python bench/bench_linprog_solve_many.py``.
+"""
+
+import timeit
+
+import numpy as np
+
+import cdd
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    shape = (10000, 8, 4)
+    # random constraints b + A x >= 0 with b > 0, so x = 0 is feasible,
+    # followed by a random objective function
+    arrays = rng.uniform(-1, 1, size=shape)
+    arrays[:, :-1, 0] = 1
+
+    def one_by_one() -> None:
+        for array in arrays:
+            lp = cdd.linprog_from_array(array, cdd.LPObjType.MAX)
+            cdd.linprog_solve(lp)
+            lp.status, lp.obj_value, lp.primal_solution
+
+    def batch() -> None:
+        cdd.linprog_solve_many(arrays, cdd.LPObjType.MAX)
+
+    print(f"shape {shape}")
+    for name, func in [("one by one", one_by_one), ("linprog_solve_many", batch)]:
+        seconds = min(timeit.repeat(func, number=1, repeat=5))
+        print(f"{name:35} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
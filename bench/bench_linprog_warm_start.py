@@ -0,0 +1,49 @@
+"""Compare cold and warm started solves of support function evaluations,
+i.e. maximizing many different directions over the same polytope.
+
+Run with ``python bench/bench_linprog_warm_start.py``.
+"""
+
+import timeit
+
+import numpy as np
+
+import cdd
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    num_constraints, dim, num_directions = 500, 10, 500
+    # random polytope containing the unit ball: b + A x >= 0
+    normals = rng.normal(size=(num_constraints, dim))
+    normals /= np.linalg.norm(normals, axis=1)[:, np.newaxis]
+    constraints = np.hstack([np.ones((num_constraints, 1)), -normals])
+    # nearby directions, as in a random walk over the sphere
+    directions = np.cumsum(0.05 * rng.normal(size=(num_directions, dim)), axis=0)
+    directions += rng.normal(size=dim)
+    obj_funcs = np.hstack([np.zeros((num_directions, 1)), directions])
+
+    def cold() -> None:
+        for obj_func in obj_funcs:
+            lp = cdd.linprog_from_array(
+                np.vstack([constraints, obj_func]), cdd.LPObjType.MAX
+            )
+            cdd.linprog_solve(lp)
+
+    def warm() -> None:
+        lp = cdd.linprog_from_array(
+            np.vstack([constraints, obj_funcs[0]]), cdd.LPObjType.MAX
+        )
+        cdd.linprog_solve(lp)
+        for obj_func in obj_funcs[1:]:
+            lp.obj_func = obj_func
+            cdd.linprog_solve(lp)
+
+    print(f"{num_directions} directions, {num_constraints} constraints, {dim} dims")
+    for name, func in [("cold", cold), ("warm start", warm)]:
+        seconds = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{name:35} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Compare building matrices from nested lists and from numpy arrays.
+
+Run with ``python bench/bench_matrix_from_array.py``.
+"""
+
+import timeit
+
+import numpy as np
+
+import cdd
+import cdd.gmp
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    shape = (20000, 50)
+    arr = rng.uniform(-1, 1, size=shape)
+    arr_int = rng.integers(-1000, 1000, size=shape)
+    lists = arr.tolist()
+    lists_int = arr_int.tolist()
+    cases = [
+        ("cdd.matrix_from_array, list of lists", cdd.matrix_from_array, lists),
+        ("cdd.matrix_from_array, float64 array", cdd.matrix_from_array, arr),
+        (
+            "cdd.gmp.matrix_from_array, list of lists",
+            cdd.gmp.matrix_from_array,
+            lists_int,
+        ),
+        ("cdd.gmp.matrix_from_array, int64 array", cdd.gmp.matrix_from_array, arr_int),
+    ]
+    print(f"shape {shape}")
+    for name, func, array in cases:
+        seconds = min(timeit.repeat(lambda: func(array), number=1, repeat=5))
+        print(f"{name:45} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Compare reading a cdd file with a Python parser and with matrix_from_file.
+
+Run with ``python bench/bench_matrix_from_file.py``.
+"""
+
+import os
+import tempfile
+import timeit
+
+import numpy as np
+
+import cdd
+import cdd.gmp
+
+
+def python_parse(path: str) -> list[list[float]]:
+    with open(path) as file_:
+        lines = iter(file_)
+        for line in lines:
+            if line.strip() == "begin":
+                break
+        numrows = int(next(lines).split()[0])
+        return [[float(x) for x in next(lines).split()] for _ in range(numrows)]
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    shape = (200000, 11)
+    mat = cdd.matrix_from_array(rng.uniform(-1, 1, size=shape))
+    mat_gmp = cdd.gmp.matrix_from_array(rng.integers(-1000, 1000, size=shape))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "bench.ine")
+        path_gmp = os.path.join(tmpdir, "bench_gmp.ine")
+        with open(path, "w") as file_:
+            file_.write(str(mat))
+        with open(path_gmp, "w") as file_:
+            file_.write(str(mat_gmp))
+        cases = [
+            (
+                "cdd, python parse + matrix_from_array",
+                lambda: cdd.matrix_from_array(python_parse(path)),
+            ),
+            ("cdd, matrix_from_file", lambda: cdd.matrix_from_file(path)),
+            ("cdd.gmp, matrix_from_file", lambda: cdd.gmp.matrix_from_file(path_gmp)),
+        ]
+        print(f"shape {shape}, file size {os.path.getsize(path) / 1e6:.1f} MB")
+        for name, func in cases:
+            seconds = min(timeit.repeat(func, number=1, repeat=3))
+            print(f"{name:40} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Compare writing a matrix to a file through str and with matrix_to_file.
+
+Run with ``python bench/bench_matrix_to_file.py``.
+"""
+
+import os
+import tempfile
+import timeit
+import tracemalloc
+
+import numpy as np
+
+import cdd
+
+
+def write_str(mat: cdd.Matrix, path: str) -> None:
+    with open(path, "w") as file_:
+        file_.write(str(mat))
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    shape = (200000, 11)
+    mat = cdd.matrix_from_array(rng.uniform(-1, 1, size=shape))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "bench.ine")
+        cases = [
+            ("write str(mat)", lambda: write_str(mat, path)),
+            ("matrix_to_file", lambda: cdd.matrix_to_file(mat, path)),
+        ]
+        print(f"shape {shape}")
+        for name, func in cases:
+            seconds = min(timeit.repeat(func, number=1, repeat=3))
+            tracemalloc.start()
+            func()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(
+                f"{name:20} {seconds * 1000:10.2f} ms"
+                f" {peak / 1e6:10.1f} MB peak Python memory"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Compare exporting matrices through nested lists and directly into numpy arrays.
+
+Run with ``python bench/bench_matrix_to_numpy.py``.
+"""
+
+import timeit
+
+import numpy as np
+
+import cdd
+import cdd.gmp
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    shape = (20000, 50)
+    mat = cdd.matrix_from_array(rng.uniform(-1, 1, size=shape))
+    mat_gmp = cdd.gmp.matrix_from_array(rng.integers(-1000, 1000, size=shape))
+    out = np.empty(shape)
+    cases = [
+        ("cdd, np.array(mat.array)", lambda: np.array(mat.array)),
+        ("cdd, matrix_to_numpy(mat)", lambda: cdd.matrix_to_numpy(mat)),
+        ("cdd, matrix_to_numpy(mat, out)", lambda: cdd.matrix_to_numpy(mat, out)),
+        ("cdd.gmp, np.array(mat.array)", lambda: np.array(mat_gmp.array)),
+        ("cdd.gmp, matrix_to_numpy(mat)", lambda: cdd.gmp.matrix_to_numpy(mat_gmp)),
+    ]
+    print(f"shape {shape}")
+    for name, func in cases:
+        seconds = min(timeit.repeat(func, number=1, repeat=5))
+        print(f"{name:35} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
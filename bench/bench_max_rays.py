@@ -0,0 +1,41 @@
+"""Compare a full run of the double description method with runs
+that are stopped by *max_rays*.
+
+Run with ``python bench/bench_max_rays.py``.
+"""
+
+import random
+import timeit
+
+import cdd
+import cdd.gmp
+
+
+def main() -> None:
+    rng = random.Random(0)
+    dim, num_points = 6, 40
+    # random integer points close to a sphere
+    array = [
+        [1] + [round(100 * x / sum(y * y for y in row) ** 0.5) for x in row]
+        for row in ([rng.gauss(0, 1) for _ in range(dim)] for _ in range(num_points))
+    ]
+    bound = cdd.output_size_bound(num_points, dim + 1, cdd.RepType.GENERATOR)
+    print(f"dim {dim}, {num_points} points, output size bound {bound}")
+    for module in [cdd, cdd.gmp]:
+        mat = module.matrix_from_array(array, rep_type=cdd.RepType.GENERATOR)
+        num_rays = len(module.polyhedron_from_matrix(mat).inequalities)
+        for max_rays in [None, 2 * bound, num_rays // 10, num_rays // 100]:
+
+            def run() -> None:
+                try:
+                    module.polyhedron_from_matrix(mat, max_rays=max_rays)
+                except cdd.RayLimitError:
+                    pass
+
+            seconds = min(timeit.repeat(run, number=1, repeat=3))
+            label = f"{module.__name__} max_rays={max_rays}"
+            print(f"{label:35} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
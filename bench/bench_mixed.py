@@ -0,0 +1,39 @@
+"""Compare exact and mixed precision conversion of random polytopes.
+
+Run with ``python bench/bench_mixed.py``.
+"""
+
+import random
+import timeit
+from fractions import Fraction
+
+import cdd
+import cdd.gmp
+
+
+def main() -> None:
+    rng = random.Random(0)
+    for dim, num_points in [(3, 200), (4, 100), (5, 60), (6, 40)]:
+        # random rational points near the unit sphere
+        array = []
+        for _ in range(num_points):
+            point = [rng.gauss(0, 1) for _ in range(dim)]
+            norm = sum(x * x for x in point) ** 0.5
+            array.append([1] + [Fraction(round(1000 * x / norm), 1000) for x in point])
+        mat = cdd.gmp.matrix_from_array(array, rep_type=cdd.RepType.GENERATOR)
+        certified = cdd.gmp.polyhedron_output_mixed(mat)[1]
+        print(f"dim {dim}, {num_points} points, certified {certified}")
+        cases = [
+            (
+                "exact",
+                lambda: cdd.gmp.copy_output(cdd.gmp.polyhedron_from_matrix(mat)),
+            ),
+            ("mixed", lambda: cdd.gmp.polyhedron_output_mixed(mat)),
+        ]
+        for name, func in cases:
+            seconds = min(timeit.repeat(func, number=1, repeat=3))
+            print(f"{name:35} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
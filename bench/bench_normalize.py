@@ -0,0 +1,49 @@
+"""Compare exact outputs with and without row normalization.
+
+Run with ``python bench/bench_normalize.py``.
+"""
+
+import pickle
+import random
+import timeit
+from fractions import Fraction
+
+import cdd
+import cdd.gmp
+
+
+def main() -> None:
+    rng = random.Random(0)
+    for dim, num_points in [(3, 100), (4, 60), (5, 30)]:
+        # random rational points with distinct denominators
+        array = [
+            [Fraction(1)]
+            + [Fraction(rng.randint(-999, 999), rng.randint(1, 99)) for _ in range(dim)]
+            for _ in range(num_points)
+        ]
+        mat = cdd.gmp.matrix_from_array(array, rep_type=cdd.RepType.GENERATOR)
+        poly = cdd.gmp.polyhedron_from_matrix(mat)
+        raw = cdd.gmp.copy_inequalities(poly)
+        normalized = cdd.gmp.copy_inequalities(poly, normalize="primitive_integer")
+        print(
+            f"dim {dim}, {num_points} points, {len(raw.array)} facets, pickle size "
+            f"{len(pickle.dumps(raw))} -> {len(pickle.dumps(normalized))} bytes"
+        )
+        cases = [
+            ("copy_inequalities", lambda: cdd.gmp.copy_inequalities(poly)),
+            (
+                "copy_inequalities normalized",
+                lambda: cdd.gmp.copy_inequalities(poly, normalize="primitive_integer"),
+            ),
+            ("array", lambda: raw.array),
+            ("array normalized", lambda: normalized.array),
+            ("pickle", lambda: pickle.dumps(raw)),
+            ("pickle normalized", lambda: pickle.dumps(normalized)),
+        ]
+        for name, func in cases:
+            seconds = min(timeit.repeat(func, number=10, repeat=3)) / 10
+            print(f"{name:35} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Compare pickling matrices through nested lists and through packed buffers.
+
+Run with ``python bench/bench_pickle.py``.
+"""
+
+import pickle
+import timeit
+from typing import Any, Callable
+
+import numpy as np
+
+import cdd
+import cdd.gmp
+
+
+def dumps_list(mat: Any) -> bytes:
+    # the list based format used before version 3.0.2
+    return pickle.dumps(
+        (mat.array, mat.lin_set, mat.rep_type, mat.obj_type, mat.obj_func),
+        protocol=5,
+    )
+
+
+def dumps_oob(mat: Any) -> bytes:
+    buffers: list[pickle.PickleBuffer] = []
+    data = pickle.dumps(mat, protocol=5, buffer_callback=buffers.append)
+    return data + b"".join(buf.raw() for buf in buffers)
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    shape = (20000, 50)
+    mat = cdd.matrix_from_array(rng.uniform(-1, 1, size=shape))
+    mat_gmp = cdd.gmp.matrix_from_array(rng.integers(-1000, 1000, size=shape))
+    cases: list[tuple[str, Callable[[], bytes]]] = [
+        ("cdd, list based", lambda: dumps_list(mat)),
+        ("cdd, protocol 4", lambda: pickle.dumps(mat, protocol=4)),
+        ("cdd, protocol 5 out-of-band", lambda: dumps_oob(mat)),
+        ("cdd.gmp, list based", lambda: dumps_list(mat_gmp)),
+        ("cdd.gmp, protocol 4", lambda: pickle.dumps(mat_gmp, protocol=4)),
+    ]
+    print(f"shape {shape}")
+    for name, func in cases:
+        seconds = min(timeit.repeat(func, number=1, repeat=5))
+        size = len(func())
+        print(f"{name:35} {seconds * 1000:10.2f} ms {size / 1e6:10.2f} MB")
+    data = pickle.dumps(mat, protocol=5)
+    data_gmp = pickle.dumps(mat_gmp, protocol=5)
+    for name, func in [
+        ("cdd, loads", lambda: pickle.loads(data)),
+        ("cdd.gmp, loads", lambda: pickle.loads(data_gmp)),
+    ]:
+        seconds = min(timeit.repeat(func, number=1, repeat=5))
+        print(f"{name:35} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Compare the double description method with and without progress checks.
+
+Run with ``python bench/bench_progress.py``.
+"""
+
+import random
+import timeit
+
+import cdd
+import cdd.gmp
+
+
+def main() -> None:
+    rng = random.Random(0)
+    for dim, num_points in [(4, 150), (6, 40)]:
+        # random integer points close to a sphere
+        array = [
+            [1] + [round(100 * x / sum(y * y for y in row) ** 0.5) for x in row]
+            for row in (
+                [rng.gauss(0, 1) for _ in range(dim)] for _ in range(num_points)
+            )
+        ]
+        print(f"dim {dim}, {num_points} points")
+        for module in [cdd, cdd.gmp]:
+            mat = module.matrix_from_array(array, rep_type=cdd.RepType.GENERATOR)
+            cases = [
+                ("", {}),
+                (" time_limit", {"time_limit": 3600.0}),
+                (" callback", {"callback": lambda *args: None}),
+            ]
+            for name, kwargs in cases:
+                seconds = min(
+                    timeit.repeat(
+                        lambda: module.polyhedron_from_matrix(mat, **kwargs),
+                        number=1,
+                        repeat=3,
+                    )
+                )
+                label = f"{module.__name__} polyhedron{name}"
+                print(f"{label:35} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Compare exact and bounded-denominator conversion of measured floats.
+
+Run with ``python bench/bench_rationalize.py``.
+"""
+
+import random
+import timeit
+from fractions import Fraction
+
+import numpy as np
+
+import cdd
+import cdd.gmp
+
+
+def main() -> None:
+    rng = random.Random(0)
+    for dim, num_points in [(3, 100), (4, 40), (5, 25)]:
+        # points near the unit sphere, measured to three decimals
+        array = []
+        for _ in range(num_points):
+            point = [rng.gauss(0, 1) for _ in range(dim)]
+            norm = sum(x * x for x in point) ** 0.5
+            array.append([1.0] + [round(x / norm, 3) for x in point])
+        print(f"dim {dim}, {num_points} points")
+
+        def output(mat: cdd.gmp.Matrix) -> None:
+            cdd.gmp.copy_output(cdd.gmp.polyhedron_from_matrix(mat))
+
+        exact = cdd.gmp.matrix_from_array(
+            [[Fraction(x) for x in row] for row in array],
+            rep_type=cdd.RepType.GENERATOR,
+        )
+        bounded = cdd.gmp.matrix_from_array(
+            array, rep_type=cdd.RepType.GENERATOR, max_denominator=1000
+        )
+        scaled = cdd.gmp.matrix_from_array(
+            array,
+            rep_type=cdd.RepType.GENERATOR,
+            max_denominator=1000,
+            scale_rows=True,
+        )
+        cases = [
+            ("exact floats", lambda: output(exact)),
+            ("max_denominator", lambda: output(bounded)),
+            ("max_denominator and scale_rows", lambda: output(scaled)),
+        ]
+        for name, func in cases:
+            seconds = min(timeit.repeat(func, number=1, repeat=3))
+            print(f"{name:35} {seconds * 1000:10.2f} ms")
+    rows = np.random.default_rng(0).random((1000, 50)).round(3)
+    rows_list = rows.tolist()
+    print("import 1000x50 floats")
+    cases = [
+        ("list", lambda: cdd.gmp.matrix_from_array(rows_list, max_denominator=1000)),
+        (
+            "numpy",
+            lambda: cdd.gmp.matrix_from_array(
+                rows, max_denominator=1000  # type: ignore
+            ),
+        ),
+    ]
+    for name, func in cases:
+        seconds = min(timeit.repeat(func, number=1, repeat=5))
+        print(f"{name:35} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
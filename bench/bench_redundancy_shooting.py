@@ -0,0 +1,54 @@
+"""Compare the redundancy detection methods on random polytopes
+with many redundant rows.
+
+Run with ``python bench/bench_redundancy_shooting.py``.
+"""
+
+import math
+import random
+import timeit
+
+import cdd
+import cdd.gmp
+
+
+def random_polytope(rng: random.Random, dim: int, num_rows: int) -> list[list[float]]:
+    # halfspaces tangent to the unit sphere, or further away (mostly redundant)
+    array = []
+    for _ in range(num_rows):
+        a = [rng.gauss(0, 1) for _ in range(dim)]
+        norm = math.sqrt(sum(x * x for x in a))
+        b = 1.0 if rng.random() < 0.1 else 1.0 + rng.random()
+        array.append([b] + [-x / norm for x in a])
+    return array
+
+
+def main() -> None:
+    rng = random.Random(0)
+    for dim, num_rows in [(3, 1000), (5, 500), (8, 200)]:
+        array = random_polytope(rng, dim, num_rows)
+        print(f"dim {dim}, {num_rows} rows")
+        for name, mod in [("cdd", cdd), ("cdd.gmp", cdd.gmp)]:
+            mat = mod.matrix_from_array(
+                array, rep_type=cdd.RepType.INEQUALITY, max_denominator=1000
+            )
+            for method, interior_point in [
+                ("lp", None),
+                ("shooting", None),
+                ("shooting", [0] * dim),
+            ]:
+                label = f"{name} {method}" + (" (point)" if interior_point else "")
+                seconds = min(
+                    timeit.repeat(
+                        lambda: mod.redundant_rows(
+                            mat, method=method, interior_point=interior_point
+                        ),
+                        number=1,
+                        repeat=3,
+                    )
+                )
+                print(f"{label:35} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
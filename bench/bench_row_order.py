@@ -0,0 +1,52 @@
+"""Compare the running time of the double description method
+for each row order, and for the automatically selected row order.
+
+Run with ``python bench/bench_row_order.py``.
+"""
+
+import random
+import timeit
+
+import cdd
+
+
+def main() -> None:
+    rng = random.Random(0)
+    problems = [
+        (
+            "random points on a sphere, dim 6",
+            [
+                [1.0] + [x / sum(y * y for y in row) ** 0.5 for x in row]
+                for row in ([rng.gauss(0, 1) for _ in range(6)] for _ in range(70))
+            ],
+            cdd.RepType.GENERATOR,
+        ),
+        (
+            "random inequalities, dim 5",
+            [[10] + [rng.randint(-9, 9) for _ in range(5)] for _ in range(150)],
+            cdd.RepType.INEQUALITY,
+        ),
+    ]
+    for name, array, rep_type in problems:
+        print(name)
+        mat = cdd.matrix_from_array(array, rep_type=rep_type)
+        for row_order in [*cdd.RowOrderType, "auto"]:
+            polys = []
+            seconds = min(
+                timeit.repeat(
+                    lambda: polys.append(
+                        cdd.polyhedron_from_matrix(mat, row_order=row_order)
+                    ),
+                    number=1,
+                    repeat=3,
+                )
+            )
+            if isinstance(row_order, str):
+                label = f"{row_order} ({polys[0].row_order.name})"
+            else:
+                label = row_order.name
+            print(f"{label:35} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Check that the double description method runs with the GIL released,
+by counting how far a pure Python loop in the main thread gets
+whilst a worker thread runs the double description method.
+
+Run with ``python bench/bench_threads.py``.
+
+cddlib is not reentrant, so calls into the same module are serialized,
+and threads only help when they overlap computations in ``cdd``
+with computations in ``cdd.gmp``, or with other Python code.
+"""
+
+import threading
+import time
+
+import numpy as np
+
+import cdd
+import cdd.gmp
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    array = np.hstack(
+        [np.ones((100, 1), dtype=np.int64), rng.integers(-50, 50, (100, 5))]
+    )
+    mat = cdd.gmp.matrix_from_array(array, rep_type=cdd.RepType.GENERATOR)
+    done = threading.Event()
+
+    def solve() -> None:
+        cdd.gmp.polyhedron_from_matrix(mat)
+        done.set()
+
+    thread = threading.Thread(target=solve)
+    start = time.perf_counter()
+    thread.start()
+    ticks = 0
+    while not done.is_set():
+        ticks += 1
+    thread.join()
+    seconds = time.perf_counter() - start
+    print(f"polyhedron_from_matrix {seconds * 1000:10.2f} ms")
+    print(f"main thread loop iterations meanwhile {ticks:10}")
+
+
+if __name__ == "__main__":
+    main()
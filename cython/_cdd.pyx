@@ -23,6 +23,8 @@ from typing import SupportsFloat
 
 NumberType = float
 SupportsNumberType = SupportsFloat
+# NumberArray in annotations is a numpy array of dtype float64,
+# see the stubs; numpy is only imported when needed
 
 cdef extern from * nogil:
     "#undef GMPRATIONAL"
@@ -34,4 +36,5 @@ include "cdd.pxi"
 cdef dd_NumberType NUMBER_TYPE = dd_Real
 
 include "pyenums.pxi"
+include "pyerrors.pxi"
 include "pycddlib.pxi"
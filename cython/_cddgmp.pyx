@@ -22,10 +22,20 @@
 from fractions import Fraction
 from typing import Union
 
-from cdd import LPObjType, LPSolverType, LPStatusType, RepType
+from cdd import (
+    LPObjType,
+    LPSolverType,
+    LPStatusType,
+    RayLimitError,
+    RepType,
+    RowOrderType,
+    TimeLimitError,
+)
 
 NumberType = Fraction
 SupportsNumberType = Union[Fraction, int]
+# NumberArray in annotations is a numpy array of dtype object,
+# see the stubs; numpy is only imported when needed
 
 cdef extern from * nogil:
     "#define GMPRATIONAL"
@@ -37,3 +47,4 @@ include "cdd.pxi"
 cdef dd_NumberType NUMBER_TYPE = dd_Rational
 
 include "pycddlib.pxi"
+include "mixed.pxi"
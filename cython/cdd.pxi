@@ -287,6 +287,11 @@ cdef extern from "cddlib/cdd.h" nogil:
         dd_CompStatusType CompStatus
         time_t starttime, endtime
 
+    # global variables
+    ##################
+
+    cdef dd_LPSolverType dd_choiceRedcheckAlgorithm
+
     # functions
     ############
 
@@ -312,6 +317,23 @@ cdef extern from "cddlib/cdd.h" nogil:
     cdef void dd_FreeMatrix(dd_MatrixPtr)
     cdef void dd_SetToIdentity(dd_colrange, dd_Bmatrix)
 
+    # arithmetic (some of these are macros from cddmp.h)
+    cdef mytype dd_one
+    cdef mytype dd_purezero
+    cdef void dd_set(mytype, mytype)
+    cdef void dd_add(mytype, mytype, mytype)
+    cdef void dd_sub(mytype, mytype, mytype)
+    cdef void dd_mul(mytype, mytype, mytype)
+    cdef void dd_neg(mytype, mytype)
+    cdef void dd_div(mytype, mytype, mytype)
+    cdef dd_boolean dd_Positive(mytype)
+    cdef dd_boolean dd_Nonzero(mytype)
+    cdef dd_boolean dd_Negative(mytype)
+    cdef dd_boolean dd_Larger(mytype, mytype)
+    cdef dd_boolean dd_Smaller(mytype, mytype)
+    cdef void dd_InnerProduct(mytype, dd_colrange, dd_Arow, dd_Arow)
+    cdef void dd_CopyArow(mytype *, mytype *, dd_colrange)
+
     cdef dd_MatrixPtr dd_CopyInput(dd_PolyhedraPtr)
     cdef dd_MatrixPtr dd_CopyOutput(dd_PolyhedraPtr)
     cdef dd_MatrixPtr dd_CopyInequalities(dd_PolyhedraPtr)
@@ -325,6 +347,15 @@ cdef extern from "cddlib/cdd.h" nogil:
     cdef dd_MatrixPtr dd_PolyFile2Matrix(libc.stdio.FILE *f, dd_ErrorType *)
 
     cdef dd_PolyhedraPtr dd_DDMatrix2Poly(dd_MatrixPtr, dd_ErrorType *)
+    cdef dd_PolyhedraPtr dd_CreatePolyhedraData(dd_rowrange, dd_colrange)
+    cdef dd_ConePtr dd_ConeDataLoad(dd_PolyhedraPtr)
+    cdef void dd_AddRay(dd_ConePtr, mytype *)
+    cdef void dd_AddArtificialRay(dd_ConePtr)
+    cdef void dd_UpdateRowOrderVector(dd_ConePtr, dd_rowset PriorityRows)
+    cdef void dd_FindInitialRays(dd_ConePtr, dd_boolean *)
+    cdef void dd_SelectNextHalfspace(dd_ConePtr, dd_rowset, dd_rowrange *)
+    cdef void dd_AddNewHalfspace1(dd_ConePtr, dd_rowrange)
+    cdef void dd_AddNewHalfspace2(dd_ConePtr, dd_rowrange)
     cdef dd_PolyhedraPtr dd_DDMatrix2Poly2(
         dd_MatrixPtr, dd_RowOrderType, dd_ErrorType *
     )
@@ -369,6 +400,9 @@ cdef extern from "cddlib/cdd.h" nogil:
     cdef dd_MatrixPtr dd_CopyMatrix(dd_MatrixPtr)
     cdef int dd_MatrixAppendTo(dd_MatrixPtr*, dd_MatrixPtr)
     cdef int dd_MatrixRowRemove(dd_MatrixPtr *M, dd_rowrange r)
+    cdef int dd_MatrixRowsRemove2(
+        dd_MatrixPtr *M, dd_rowset delset, dd_rowindex *newpos
+    )
 
     cdef void dd_WriteAmatrix(libc.stdio.FILE *, dd_Amatrix, dd_rowrange, dd_colrange)
     cdef void dd_WriteArow(libc.stdio.FILE *f, dd_Arow a, dd_colrange)
@@ -394,10 +428,37 @@ cdef extern from "cddlib/cdd.h" nogil:
         dd_LPObjectiveType, dd_NumberType, dd_rowrange, dd_colrange
     )
     cdef dd_LPPtr dd_Matrix2LP(dd_MatrixPtr, dd_ErrorType *)
+    cdef dd_LPPtr dd_MakeLPforInteriorFinding(dd_LPPtr)
     cdef dd_boolean dd_LPSolve(dd_LPPtr, dd_LPSolverType, dd_ErrorType *)
     cdef void dd_FreeLPData(dd_LPPtr)
     cdef void dd_WriteLP(libc.stdio.FILE *f, dd_LPPtr lp)
     cdef void dd_WriteLPResult(libc.stdio.FILE *f, dd_LPPtr lp, dd_ErrorType err)
 
+    # linear programming tableau operations
+    cdef void dd_TableauEntry(
+        mytype *, dd_rowrange, dd_colrange, dd_Amatrix, dd_Bmatrix,
+        dd_rowrange, dd_colrange
+    )
+    cdef void dd_GaussianColumnPivot(
+        dd_rowrange, dd_colrange, dd_Amatrix, dd_Bmatrix, dd_rowrange, dd_colrange
+    )
+
     cdef dd_MatrixPtr dd_FourierElimination(dd_MatrixPtr, dd_ErrorType *)
     cdef dd_MatrixPtr dd_BlockElimination(dd_MatrixPtr, dd_colset, dd_ErrorType *)
+
+# functions that cddlib exports, but does not declare in its headers
+cdef extern from * nogil:
+    """
+    void dd_DDInit(dd_ConePtr);
+    void dd_DDMain(dd_ConePtr);
+    void dd_InitialDataSetup(dd_ConePtr);
+    dd_boolean dd_CheckEmptiness(dd_PolyhedraPtr, dd_ErrorType *);
+    dd_LPPtr dd_CreateLP_H_ImplicitLinearity(dd_MatrixPtr);
+    dd_LPPtr dd_CreateLP_V_ImplicitLinearity(dd_MatrixPtr);
+    """
+    cdef void dd_DDInit(dd_ConePtr)
+    cdef void dd_DDMain(dd_ConePtr)
+    cdef void dd_InitialDataSetup(dd_ConePtr)
+    cdef dd_boolean dd_CheckEmptiness(dd_PolyhedraPtr, dd_ErrorType *)
+    cdef dd_LPPtr dd_CreateLP_H_ImplicitLinearity(dd_MatrixPtr)
+    cdef dd_LPPtr dd_CreateLP_V_ImplicitLinearity(dd_MatrixPtr)
@@ -0,0 +1,224 @@
+# pycddlib is a Python wrapper for Komei Fukuda's cddlib
+# Copyright (c) 2008-2024, Matthias C. M. Troffaes
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+# mixed precision conversion: run the double description method in
+# floating point, and certify its result in exact integer arithmetic
+
+import math as _math
+import operator as _operator
+
+import cdd as _cdd
+
+
+# integer row proportional to a row of Fractions
+def _mixed_int_row(row):
+    lcm = _math.lcm(*(x.denominator for x in row))
+    return [x.numerator * (lcm // x.denominator) for x in row]
+
+
+def _mixed_dot(row1, row2):
+    return sum(map(_operator.mul, row1, row2))
+
+
+# row echelon form of rows, by fraction free gaussian elimination,
+# and its pivot columns
+def _mixed_echelon(rows, Py_ssize_t numcols):
+    cdef Py_ssize_t rank = 0
+    cdef Py_ssize_t i, j, col
+    a = [list(row) for row in rows]
+    pivot_cols = []
+    prev = 1
+    for col in range(numcols):
+        for i in range(rank, len(a)):
+            if a[i][col]:
+                break
+        else:
+            continue
+        a[rank], a[i] = a[i], a[rank]
+        pivot = a[rank][col]
+        for i in range(rank + 1, len(a)):
+            factor = a[i][col]
+            for j in range(col + 1, numcols):
+                a[i][j] = (pivot * a[i][j] - factor * a[rank][j]) // prev
+            a[i][col] = 0
+        prev = pivot
+        pivot_cols.append(col)
+        rank += 1
+    return a, pivot_cols
+
+
+# primitive integer vector spanning the null space of rows,
+# or None if the null space is not one dimensional
+def _mixed_null_vector(rows, Py_ssize_t numcols):
+    cdef Py_ssize_t j, k, col
+    a, pivot_cols = _mixed_echelon(rows, numcols)
+    if len(pivot_cols) != numcols - 1:
+        return None
+    # back substitution, with the free column set to one,
+    # scaling the solution so far to keep it integer
+    vec = [0] * numcols
+    vec[next(j for j in range(numcols) if j not in pivot_cols)] = 1
+    for k in reversed(range(len(pivot_cols))):
+        col = pivot_cols[k]
+        value = -_mixed_dot(a[k][col + 1:], vec[col + 1:])
+        pivot = a[k][col]
+        vec = [x * pivot for x in vec]
+        vec[col] = value
+        gcd = _math.gcd(*vec)
+        vec = [x // gcd for x in vec]
+    return vec
+
+
+# rays of the tangent cone {x : rows x >= 0, lin_rows x = 0}, modulo its
+# lineality space, using the exact double description method
+def _mixed_tangent_rays(rows, lin_rows):
+    mat = matrix_from_array(
+        [[0] + row for row in lin_rows] + [[0] + row for row in rows],
+        lin_set=range(len(lin_rows)),
+        rep_type=RepType.INEQUALITY,
+    )
+    gen = copy_generators(polyhedron_from_matrix(mat))
+    lin_set = gen.lin_set
+    return [
+        row[1:] for i, row in enumerate(gen.array) if row[0] == 0 and i not in lin_set
+    ]
+
+
+# exact extreme rays of the homogenized cone of mat, certified from
+# the output of the floating point double description method,
+# or None if the certificate fails
+def _mixed_certify(Matrix mat, row_order):
+    cdef Py_ssize_t i, j, k
+    array = mat.array
+    lin_set = mat.lin_set
+    rep_type = mat.rep_type
+    numcols = mat.dd_mat.colsize
+    try:
+        float_poly = _cdd.polyhedron_from_matrix(
+            _cdd.matrix_from_array(
+                [[float(x) for x in row] for row in array],
+                lin_set=lin_set,
+                rep_type=rep_type,
+            ),
+            row_order=row_order,
+        )
+    except RuntimeError:
+        return None
+    float_out = _cdd.copy_output(float_poly)
+    float_array = float_out.array
+    if float_out.lin_set or not float_array:
+        return None
+    int_rows = [_mixed_int_row(row) for row in array]
+    if rep_type == RepType.INEQUALITY:
+        # homogenizing row, indexed as in cddlib's incidence
+        int_rows.append([1] + [0] * (numcols - 1))
+    lin_rows = [int_rows[i] for i in lin_set]
+    ineq_indices = [i for i in range(len(int_rows)) if i not in lin_set]
+    # reconstruct each ray exactly from its floating point incidence
+    rays = []
+    incidences = []
+    gens_by_row = {i: set() for i in ineq_indices}
+    for k, (float_ray, float_inc) in enumerate(
+        zip(float_array, _cdd.copy_incidence(float_poly))
+    ):
+        ray = _mixed_null_vector(
+            lin_rows + [int_rows[i] for i in float_inc if i not in lin_set],
+            numcols,
+        )
+        if ray is None:
+            return None
+        j = max(range(numcols), key=lambda j: abs(float_ray[j]))
+        if (ray[j] > 0) != (float_ray[j] > 0):
+            ray = [-x for x in ray]
+        if any(_mixed_dot(row, ray) for row in lin_rows):
+            return None
+        inc = set()
+        for i in ineq_indices:
+            value = _mixed_dot(int_rows[i], ray)
+            if value < 0:
+                return None
+            elif value == 0:
+                inc.add(i)
+                gens_by_row[i].add(k)
+        # a ray on all inequalities is in the lineality space
+        if len(inc) == len(ineq_indices):
+            return None
+        rays.append(ray)
+        incidences.append(inc)
+    if len(set(map(tuple, rays))) != len(rays):
+        return None
+    if rep_type == RepType.INEQUALITY and all(ray[0] == 0 for ray in rays):
+        return None
+    # the rays are complete if every two dimensional face through each ray
+    # contains another ray, as the graph of a pointed cone is connected
+    lin_rank = len(_mixed_echelon(lin_rows, numcols)[1])
+    for k, inc in enumerate(incidences):
+        if len(inc) + lin_rank == numcols - 1:
+            faces = [inc - {i} for i in inc]
+        else:
+            inc_list = sorted(inc)
+            faces = [
+                {i for i in inc_list if _mixed_dot(int_rows[i], tangent_ray) == 0}
+                for tangent_ray in _mixed_tangent_rays(
+                    [int_rows[i] for i in inc_list], lin_rows
+                )
+            ]
+        for face in faces:
+            if face:
+                gens = set.intersection(*(gens_by_row[i] for i in face))
+                gens.discard(k)
+                if not gens:
+                    return None
+            elif len(rays) < 2:
+                return None
+    return rays
+
+
+def polyhedron_output_mixed(
+    mat: Matrix, row_order: Optional[Union[RowOrderType, str]] = None
+) -> tuple[Matrix, bool]:
+    """Convert *mat* into its dual representation,
+    like :func:`copy_output` on :func:`polyhedron_from_matrix`,
+    by running the double description method in floating point first.
+    The floating point output and its incidences are then reconstructed and
+    certified in exact arithmetic.
+    If the certificate fails, the double description method is run again
+    in exact arithmetic.
+
+    Returns the exact output matrix, and whether the floating point
+    result could be certified.
+
+    The certificate requires the output to have no linearities,
+    so for instance H-representations of polyhedra that contain a line,
+    and V-representations of polyhedra that are not full dimensional,
+    are always converted in exact arithmetic.
+    The rows of the output are normalized as by :func:`copy_output`,
+    but may be ordered differently.
+
+    .. versionadded:: 3.0.2
+    """
+    rays = _mixed_certify(mat, row_order)
+    if rays is None:
+        return copy_output(polyhedron_from_matrix(mat, row_order=row_order)), False
+    # normalize as cddlib does
+    array = [[Fraction(x, min(abs(y) for y in ray if y)) for x in ray] for ray in rays]
+    if mat.rep_type == RepType.INEQUALITY:
+        array = [[x / row[0] for x in row] if row[0] else row for row in array]
+        rep_type = RepType.GENERATOR
+    else:
+        rep_type = RepType.INEQUALITY
+    return matrix_from_array(array, rep_type=rep_type), True
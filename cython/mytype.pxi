@@ -15,6 +15,12 @@
 # with this program; if not, write to the Free Software Foundation, Inc.,
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
+cimport cpython.buffer
+cimport cpython.bytes
+cimport libc.stdlib
+cimport libc.string
+from libc.stdint cimport uint16_t
+
 from fractions import Fraction
 
 cdef extern from "cddlib/cddmp.h" nogil:
@@ -25,3 +31,181 @@ cdef _get_mytype(mytype target):
 
 cdef _set_mytype(mytype target, value):
     target[0] = value
+
+# set target to num / den
+cdef int _set_mytype_ratio(mytype target, long long num, long long den) except -1:
+    target[0] = <double>num / <double>den
+    return 0
+
+# normalize rows in place, not supported for floats
+cdef int _normalize_rows(
+    mytype **pp, Py_ssize_t numrows, Py_ssize_t numcols, bint leading_unit
+) except -1:
+    raise ValueError("row normalization requires exact arithmetic, use cdd.gmp")
+
+# key of row up to a nonzero factor, along with whether its first nonzero
+# entry is negative, or None for zero rows; tmp must have numcols entries
+cdef _row_key(mytype *row, Py_ssize_t numcols, mytype *tmp):
+    cdef Py_ssize_t j
+    cdef double lead = 0
+    for j in range(numcols):
+        if row[j][0] != 0:
+            lead = row[j][0]
+            break
+    else:
+        return None
+    for j in range(numcols):
+        # adding zero turns negative zero into zero
+        tmp[j][0] = row[j][0] / lead + 0.0
+    return _pack_matrix(&tmp, 1, numcols), lead < 0
+
+# numpy dtype, buffer format, and item size for bulk export
+_EXPORT_DTYPE = "float64"
+cdef const char *_EXPORT_FORMATS = b"d"
+cdef Py_ssize_t _EXPORT_ITEMSIZE = sizeof(double)
+
+# write source into a buffer item of the above format
+cdef int _get_mytype_to_item(mytype source, char *item) except -1:
+    (<double*>item)[0] = source[0]
+    return 0
+
+# buffer format and item size for the fast import path
+cdef const char *_IMPORT_FORMATS = b"d"
+cdef Py_ssize_t _IMPORT_ITEMSIZE = sizeof(double)
+
+# fast path for C-contiguous float64 data, such as numpy arrays
+cdef int _set_matrix_from_data(
+    mytype **pp, Py_ssize_t numrows, Py_ssize_t numcols, const char *data
+) except -1:
+    cdef Py_ssize_t i
+    for i in range(numrows):
+        libc.string.memcpy(
+            pp[i], <const double*>data + i * numcols, numcols * sizeof(double)
+        )
+    return 0
+
+cdef double[23] _POWERS_OF_TEN = [
+    1e0, 1e1, 1e2, 1e3, 1e4, 1e5, 1e6, 1e7, 1e8, 1e9, 1e10, 1e11,
+    1e12, 1e13, 1e14, 1e15, 1e16, 1e17, 1e18, 1e19, 1e20, 1e21, 1e22,
+]
+
+# fast path for decimal strings whose significant digits fit into 53 bits,
+# and whose decimal exponent is at most 22 in magnitude: then both are
+# exact doubles, so a single multiplication or division is correctly
+# rounded (Clinger's algorithm); returns False if not applicable
+cdef bint _fast_strtod(const char *str_, double *result) noexcept nogil:
+    cdef unsigned long long mantissa = 0
+    cdef int exponent = 0
+    cdef int exponent_sign = 1
+    cdef int exponent_value = 0
+    cdef bint negative = False
+    cdef bint has_digits = False
+    if str_[0] == b"-" or str_[0] == b"+":
+        negative = str_[0] == b"-"
+        str_ += 1
+    while b"0" <= str_[0] <= b"9":
+        mantissa = 10 * mantissa + (str_[0] - c'0')
+        if mantissa >= (1ULL << 53):
+            return False
+        has_digits = True
+        str_ += 1
+    if str_[0] == b".":
+        str_ += 1
+        while b"0" <= str_[0] <= b"9":
+            mantissa = 10 * mantissa + (str_[0] - c'0')
+            if mantissa >= (1ULL << 53):
+                return False
+            has_digits = True
+            exponent -= 1
+            str_ += 1
+    if not has_digits:
+        return False
+    if str_[0] == b"e" or str_[0] == b"E":
+        str_ += 1
+        if str_[0] == b"-" or str_[0] == b"+":
+            exponent_sign = -1 if str_[0] == b"-" else 1
+            str_ += 1
+        if not b"0" <= str_[0] <= b"9":
+            return False
+        while b"0" <= str_[0] <= b"9":
+            exponent_value = 10 * exponent_value + (str_[0] - c'0')
+            if exponent_value > 1000:
+                return False
+            str_ += 1
+        exponent += exponent_sign * exponent_value
+    if str_[0] != 0 or not -22 <= exponent <= 22:
+        return False
+    if exponent >= 0:
+        result[0] = <double>mantissa * _POWERS_OF_TEN[exponent]
+    else:
+        result[0] = <double>mantissa / _POWERS_OF_TEN[-exponent]
+    if negative:
+        result[0] = -result[0]
+    return True
+
+# set target from a null terminated integer, decimal, or p/q rational string,
+# as found in cdd files; returns False if the string is not a valid number
+cdef bint _set_mytype_from_str(mytype target, char *str_) noexcept nogil:
+    cdef char *end
+    cdef char *slash = libc.string.strchr(str_, b"/")
+    cdef double den = 1
+    if slash != NULL:
+        slash[0] = 0
+        den = libc.stdlib.strtod(slash + 1, &end)
+        if end == slash + 1 or end[0] != 0 or den == 0:
+            return False
+    if not _fast_strtod(str_, target):
+        target[0] = libc.stdlib.strtod(str_, &end)
+        if end == str_ or end[0] != 0:
+            return False
+    target[0] /= den
+    return True
+
+# pickle data is little-endian float64, row by row
+
+cdef bint _is_little_endian() noexcept nogil:
+    cdef uint16_t one = 1
+    return (<unsigned char*>&one)[0] == 1
+
+cdef void _swap_bytes(char *buf, Py_ssize_t size) noexcept nogil:
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t k
+    cdef Py_ssize_t n = sizeof(double)
+    cdef char tmp
+    while i < size:
+        for k in range(n // 2):
+            tmp = buf[i + k]
+            buf[i + k] = buf[i + n - 1 - k]
+            buf[i + n - 1 - k] = tmp
+        i += n
+
+# pack all values of pp into a bytes object, for pickling
+cdef bytes _pack_matrix(mytype **pp, Py_ssize_t numrows, Py_ssize_t numcols):
+    cdef Py_ssize_t i
+    cdef Py_ssize_t row_size = numcols * sizeof(double)
+    cdef bytes data = cpython.bytes.PyBytes_FromStringAndSize(NULL, numrows * row_size)
+    cdef char *buf = cpython.bytes.PyBytes_AS_STRING(data)
+    for i in range(numrows):
+        libc.string.memcpy(buf + i * row_size, pp[i], row_size)
+    if not _is_little_endian():
+        _swap_bytes(buf, numrows * row_size)
+    return data
+
+# unpack data from _pack_matrix into pp
+cdef int _unpack_matrix(
+    mytype **pp, Py_ssize_t numrows, Py_ssize_t numcols, data
+) except -1:
+    cdef Py_buffer view
+    cdef Py_ssize_t i
+    cdef Py_ssize_t row_size = numcols * sizeof(double)
+    cpython.buffer.PyObject_GetBuffer(data, &view, cpython.buffer.PyBUF_SIMPLE)
+    try:
+        if view.len != numrows * row_size:
+            raise ValueError("pickle data does not match matrix size")
+        for i in range(numrows):
+            libc.string.memcpy(pp[i], <char*>view.buf + i * row_size, row_size)
+            if not _is_little_endian():
+                _swap_bytes(<char*>pp[i], row_size)
+    finally:
+        cpython.buffer.PyBuffer_Release(&view)
+    return 0
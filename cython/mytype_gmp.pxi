@@ -15,8 +15,21 @@
 # with this program; if not, write to the Free Software Foundation, Inc.,
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
+cimport cpython.buffer
 cimport cpython.bytes
+cimport cpython.contextvars
+cimport cpython.long
+cimport cpython.mem
+cimport cpython.number
+cimport libc.stdlib
+cimport libc.string
+cimport cpython.ref
+cimport libc.errno
+from cpython.object cimport PyObject
+from libc.limits cimport LONG_MAX, LONG_MIN
+from libc.stdint cimport int64_t
 
+import contextvars as _contextvars
 from fractions import Fraction
 
 # gmp integer and rational functions
@@ -29,6 +42,26 @@ cdef extern from * nogil:
     int mpz_fits_slong_p(mpz_t op)
     int mpz_fits_ulong_p(mpz_t op)
     size_t mpz_sizeinbase(mpz_t op, int base)
+    int mpz_set_str(mpz_t rop, const char *str, int base)
+    void mpz_ui_pow_ui(mpz_t rop, unsigned long int base, unsigned long int exp)
+    void mpz_mul(mpz_t rop, const mpz_t op1, const mpz_t op2)
+    void mpz_neg(mpz_t rop, const mpz_t op)
+    int mpz_sgn(const mpz_t op)
+    void mpz_set_ui(mpz_t rop, unsigned long int op)
+    void mpz_init(mpz_t x)
+    void mpz_clear(mpz_t x)
+    void mpz_lcm(mpz_t rop, const mpz_t op1, const mpz_t op2)
+    void mpz_gcd(mpz_t rop, const mpz_t op1, const mpz_t op2)
+    void mpz_divexact(mpz_t q, const mpz_t n, const mpz_t d)
+    int mpz_cmp_ui(const mpz_t op1, unsigned long int op2)
+    void *mpz_export(
+        void *rop, size_t *countp, int order, size_t size, int endian,
+        size_t nails, const mpz_t op
+    )
+    void mpz_import(
+        mpz_t rop, size_t count, int order, size_t size, int endian,
+        size_t nails, const void *op
+    )
 
     # note: need to add this internal detail to the header (compilation
     # fails otherwise)
@@ -41,38 +74,431 @@ cdef extern from * nogil:
     char *mpq_get_str(char *str, int base, mpq_t op)
     int mpq_set_str(mpq_t rop, char *str, int base)
     void mpq_set_si(mpq_t, signed long int, unsigned long int)
+    void mpq_canonicalize(mpq_t op)
+    void mpq_init(mpq_t x)
+    void mpq_clear(mpq_t x)
+    void mpq_abs(mpq_t rop, const mpq_t op)
+    void mpq_div(mpq_t quotient, const mpq_t dividend, const mpq_t divisor)
+    int mpq_sgn(const mpq_t op)
+    int mpq_cmp_ui(const mpq_t op1, unsigned long int num2, unsigned long int den2)
 
 cdef extern from "cddlib/cddmp.h" nogil:
     ctypedef mpq_t mytype
 
 
-# get Python Fraction from target
+# type of numbers returned by _get_mytype, see set_output_type;
+# a context variable, so setting it only affects the current thread or task
+_output_type = _contextvars.ContextVar("cdd.gmp.output_type", default=Fraction)
+
+
+def get_output_type() -> type[NumberType]:
+    """Type of the numbers returned by this module in the current context,
+    as set by :func:`set_output_type`.
+
+    .. versionadded:: 3.0.2
+    """
+    return cpython.contextvars.get_value(_output_type)
+
+
+def set_output_type(output_type: type[NumberType]) -> None:
+    """Set the type of the numbers returned by this module.
+    This must be either :class:`~fractions.Fraction` (the default),
+    or :class:`gmpy2.mpq`.
+    Returning :class:`gmpy2.mpq` is considerably faster,
+    especially for large numerators and denominators.
+
+    The setting is stored in a :class:`~contextvars.ContextVar`,
+    so it only applies to the current thread,
+    or to the current :mod:`asyncio` task,
+    and other threads keep getting :class:`~fractions.Fraction` numbers.
+    To limit it to part of your code, run that part with
+    :meth:`contextvars.copy_context().run <contextvars.Context.run>`.
+
+    .. versionadded:: 3.0.2
+    """
+    if output_type is not Fraction:
+        try:
+            import gmpy2
+        except ImportError:
+            raise ValueError(
+                f"output type must be Fraction or gmpy2.mpq, not {output_type!r}"
+            ) from None
+        if output_type is not gmpy2.mpq:
+            raise ValueError(
+                f"output type must be Fraction or gmpy2.mpq, not {output_type!r}"
+            )
+    _output_type.set(output_type)
+
+
+def matrix_normalize(mat: Matrix, mode: str = "primitive_integer") -> None:
+    """Scale every row of *mat* in place by a positive factor.
+    If *mode* is ``"primitive_integer"``,
+    each row is scaled to integers whose greatest common divisor is one.
+    If *mode* is ``"leading_unit"``,
+    each row is scaled so its first nonzero entry is ``1`` or ``-1``.
+    Zero rows, and the objective function, are left unchanged.
+
+    As the scaling factors are positive, the represented polyhedron
+    does not change.
+    Integer rows take less memory, pickle into smaller data,
+    and are faster to convert into Python numbers.
+
+    The same normalization can also be applied directly
+    by passing *normalize* to :func:`copy_input`, :func:`copy_output`,
+    :func:`copy_inequalities`, and :func:`copy_generators`.
+
+    .. versionadded:: 3.0.2
+    """
+    _matrix_normalized(mat, mode)
+
+
+# get Python int from op, by exporting its limbs as bytes
+cdef _get_mpz(mpz_t op):
+    cdef size_t count
+    cdef int sign = mpz_sgn(op)
+    if sign == 0:
+        return 0
+    buf = cpython.bytes.PyBytes_FromStringAndSize(
+        NULL, (mpz_sizeinbase(op, 2) + 7) // 8
+    )
+    mpz_export(cpython.bytes.PyBytes_AS_STRING(buf), &count, -1, 1, 0, 0, op)
+    value = int.from_bytes(buf, "little")
+    return -value if sign < 0 else value
+
+
+# get Python Fraction (or gmpy2.mpq, see set_output_type) from target
 cdef _get_mytype(mytype target):
-    cdef signed long int num
-    cdef unsigned long int den
-    cdef char *buf_ptr
+    output_type = cpython.contextvars.get_value(_output_type)
     if mpz_fits_slong_p(mpq_numref(target)) and mpz_fits_ulong_p(mpq_denref(target)):
-        num = mpz_get_si(mpq_numref(target))
-        den = mpz_get_ui(mpq_denref(target))
-        return Fraction(num, den)
+        return output_type(
+            mpz_get_si(mpq_numref(target)), mpz_get_ui(mpq_denref(target))
+        )
     else:
-        buf = cpython.bytes.PyBytes_FromStringAndSize(
-            NULL,
-            mpz_sizeinbase(mpq_numref(target), 10)
-            + mpz_sizeinbase(mpq_denref(target), 10)
-            + 3,
+        return output_type(
+            _get_mpz(mpq_numref(target)), _get_mpz(mpq_denref(target))
         )
-        buf_ptr = cpython.bytes.PyBytes_AsString(buf)
-        mpq_get_str(buf_ptr, 10, target)
-        # trick: bytes(buf_ptr) removes everything after the null
-        return Fraction(bytes(buf_ptr).decode('ascii'))
 
-# set target to Python Fraction (or any type with numerator and denominator attributes)
+# numpy dtype, buffer format, and item size for bulk export
+_EXPORT_DTYPE = "object"
+cdef const char *_EXPORT_FORMATS = b"O"
+cdef Py_ssize_t _EXPORT_ITEMSIZE = sizeof(PyObject *)
+
+# write source as Python number into a buffer item of the above format
+cdef int _get_mytype_to_item(mytype source, char *item) except -1:
+    cdef PyObject **ptr = <PyObject **>item
+    cdef PyObject *old = ptr[0]
+    value = _get_mytype(source)
+    cpython.ref.Py_INCREF(value)
+    ptr[0] = <PyObject *>value
+    cpython.ref.Py_XDECREF(old)
+    return 0
+
+# set op to Python int value, by importing its bytes as limbs
+cdef int _set_mpz(mpz_t op, value) except -1:
+    value = cpython.number.PyNumber_Index(value)
+    buf = abs(value).to_bytes((value.bit_length() + 7) // 8, "little")
+    mpz_import(
+        op, cpython.bytes.PyBytes_GET_SIZE(buf), -1, 1, 0, 0,
+        cpython.bytes.PyBytes_AS_STRING(buf)
+    )
+    if value < 0:
+        mpz_neg(op, op)
+    return 0
+
+# set target to Python int or Fraction
+# (or any type with numerator and denominator attributes)
 cdef _set_mytype(mytype target, value):
+    cdef int overflow
+    cdef long num
+    cdef long den
+    if cpython.long.PyLong_CheckExact(value):
+        num = cpython.long.PyLong_AsLongAndOverflow(value, &overflow)
+        if overflow:
+            _set_mpz(mpq_numref(target), value)
+            mpz_set_ui(mpq_denref(target), 1)
+        else:
+            mpq_set_si(target, num, 1)
+        return
+    numerator = value.numerator
+    denominator = value.denominator
+    num = cpython.long.PyLong_AsLongAndOverflow(numerator, &overflow)
+    if not overflow:
+        den = cpython.long.PyLong_AsLongAndOverflow(denominator, &overflow)
+    if overflow or den <= 0:
+        _set_mpz(mpq_numref(target), numerator)
+        _set_mpz(mpq_denref(target), denominator)
+        if mpz_sgn(mpq_denref(target)) == 0:
+            raise ZeroDivisionError(f"invalid denominator in {value!r}")
+        elif mpz_sgn(mpq_denref(target)) < 0:
+            mpq_canonicalize(target)
+    else:
+        mpq_set_si(target, num, den)
+
+# set target to num / den, which must be coprime with den positive
+cdef int _set_mytype_ratio(mytype target, long long num, long long den) except -1:
+    # long is only 32 bits on some platforms
+    if LONG_MIN <= num <= LONG_MAX and den <= LONG_MAX:
+        mpq_set_si(target, <signed long int>num, <unsigned long int>den)
+    else:
+        _set_mytype(target, Fraction(num, den))
+    return 0
+
+# scale each row by a positive factor, so it consists of coprime integers
+cdef void _normalize_rows_primitive_integer(
+    mytype **pp, Py_ssize_t numrows, Py_ssize_t numcols
+) noexcept nogil:
+    cdef Py_ssize_t i, j
+    cdef mpz_t factor
+    cdef mpz_t gcd
+    mpz_init(factor)
+    mpz_init(gcd)
+    for i in range(numrows):
+        mpz_set_ui(factor, 1)
+        for j in range(numcols):
+            mpz_lcm(factor, factor, mpq_denref(pp[i][j]))
+        mpz_set_ui(gcd, 0)
+        for j in range(numcols):
+            mpz_divexact(mpq_denref(pp[i][j]), factor, mpq_denref(pp[i][j]))
+            mpz_mul(mpq_numref(pp[i][j]), mpq_numref(pp[i][j]), mpq_denref(pp[i][j]))
+            mpz_set_ui(mpq_denref(pp[i][j]), 1)
+            mpz_gcd(gcd, gcd, mpq_numref(pp[i][j]))
+        if mpz_cmp_ui(gcd, 1) > 0:
+            for j in range(numcols):
+                mpz_divexact(mpq_numref(pp[i][j]), mpq_numref(pp[i][j]), gcd)
+    mpz_clear(factor)
+    mpz_clear(gcd)
+
+# scale each row by a positive factor, so its first nonzero entry is 1 or -1
+cdef void _normalize_rows_leading_unit(
+    mytype **pp, Py_ssize_t numrows, Py_ssize_t numcols
+) noexcept nogil:
+    cdef Py_ssize_t i, j
+    cdef mpq_t scale
+    mpq_init(scale)
+    for i in range(numrows):
+        for j in range(numcols):
+            if mpq_sgn(pp[i][j]) != 0:
+                mpq_abs(scale, pp[i][j])
+                break
+        else:
+            continue
+        if mpq_cmp_ui(scale, 1, 1) != 0:
+            for j in range(numcols):
+                mpq_div(pp[i][j], pp[i][j], scale)
+    mpq_clear(scale)
+
+# normalize rows in place, see matrix_normalize
+cdef int _normalize_rows(
+    mytype **pp, Py_ssize_t numrows, Py_ssize_t numcols, bint leading_unit
+) except -1:
+    with nogil:
+        if leading_unit:
+            _normalize_rows_leading_unit(pp, numrows, numcols)
+        else:
+            _normalize_rows_primitive_integer(pp, numrows, numcols)
+    return 0
+
+# key of row up to a nonzero factor, along with whether its first nonzero
+# entry is negative, or None for zero rows; tmp must have numcols entries
+cdef _row_key(mytype *row, Py_ssize_t numcols, mytype *tmp):
+    cdef Py_ssize_t j
+    cdef Py_ssize_t lead = -1
+    for j in range(numcols):
+        if mpq_sgn(row[j]) != 0:
+            lead = j
+            break
+    else:
+        return None
+    for j in range(numcols):
+        mpq_div(tmp[j], row[j], row[lead])
+    return _pack_matrix(&tmp, 1, numcols), mpq_sgn(row[lead]) < 0
+
+# buffer format and item size for the fast import path
+cdef const char *_IMPORT_FORMATS = b"lq"
+cdef Py_ssize_t _IMPORT_ITEMSIZE = sizeof(int64_t)
+
+# fast path for C-contiguous int64 data, such as numpy arrays
+cdef int _set_matrix_from_data(
+    mytype **pp, Py_ssize_t numrows, Py_ssize_t numcols, const char *data
+) except -1:
+    cdef Py_ssize_t i, j
+    cdef int64_t value
+    for i in range(numrows):
+        for j in range(numcols):
+            value = (<const int64_t*>data)[i * numcols + j]
+            # long is only 32 bits on some platforms
+            if LONG_MIN <= value <= LONG_MAX:
+                mpq_set_si(pp[i][j], <signed long int>value, 1)
+            else:
+                _set_mytype(pp[i][j], value)
+    return 0
+
+# fast path for decimal integers that fit into a long;
+# returns False if not applicable
+cdef bint _fast_strtol(const char *str_, long *result) noexcept nogil:
+    cdef unsigned long value = 0
+    cdef bint negative = False
+    if str_[0] == b"-":
+        negative = True
+        str_ += 1
+    if str_[0] == 0:
+        return False
+    while b"0" <= str_[0] <= b"9":
+        if value > <unsigned long>((LONG_MAX - 9) // 10):
+            return False
+        value = 10 * value + (str_[0] - c'0')
+        str_ += 1
+    if str_[0] != 0:
+        return False
+    result[0] = -<long>value if negative else <long>value
+    return True
+
+# largest exponent accepted in decimals such as 1e1000, as the power of ten
+# is computed exactly, so huge exponents would take huge time and memory
+cdef long _MAX_EXPONENT = 1000
+
+# set target from a null terminated integer, decimal, or p/q rational string,
+# as found in cdd files; decimals are converted exactly;
+# returns False if the string is not a valid number,
+# or if its exponent is out of range
+cdef bint _set_mytype_from_str(mytype target, char *str_) noexcept nogil:
+    cdef char *digits
+    cdef char *src
+    cdef char *dst
+    cdef char *end
+    cdef bint negative = False
+    cdef long exponent = 0
+    cdef long value
+    if str_[0] == b"+":
+        str_ += 1
+    if _fast_strtol(str_, &value):
+        mpq_set_si(target, value, 1)
+        return True
+    if libc.string.strpbrk(str_, b".eE") == NULL:
+        # integer or p/q rational
+        if (
+            str_[0] == 0
+            or libc.string.strchr(str_, b"+") != NULL
+            or mpq_set_str(target, str_, 10) != 0
+            or mpz_sgn(mpq_denref(target)) == 0
+        ):
+            return False
+        mpq_canonicalize(target)
+        return True
+    # decimal: collect all digits in place, and adjust exponent for the
+    # number of digits after the decimal point
+    if str_[0] == b"-":
+        negative = True
+        str_ += 1
+    digits = dst = src = str_
+    while b"0" <= src[0] <= b"9":
+        dst[0] = src[0]
+        dst += 1
+        src += 1
+    if src[0] == b".":
+        src += 1
+        while b"0" <= src[0] <= b"9":
+            dst[0] = src[0]
+            dst += 1
+            src += 1
+            exponent -= 1
+    if dst == digits:
+        return False
+    if src[0] == b"e" or src[0] == b"E":
+        libc.errno.errno = 0
+        value = libc.stdlib.strtol(src + 1, &end, 10)
+        if (
+            end == src + 1
+            or end[0] != 0
+            or libc.errno.errno == libc.errno.ERANGE
+            or not -_MAX_EXPONENT <= value <= _MAX_EXPONENT
+        ):
+            return False
+        exponent += value
+    elif src[0] != 0:
+        return False
+    dst[0] = 0
+    if mpz_set_str(mpq_numref(target), digits, 10) != 0:
+        return False
+    if negative:
+        mpz_neg(mpq_numref(target), mpq_numref(target))
+    if exponent >= 0:
+        mpz_ui_pow_ui(mpq_denref(target), 10, exponent)
+        mpz_mul(mpq_numref(target), mpq_numref(target), mpq_denref(target))
+        mpz_set_ui(mpq_denref(target), 1)
+    else:
+        mpz_ui_pow_ui(mpq_denref(target), 10, -exponent)
+    mpq_canonicalize(target)
+    return True
+
+# pickle data is base 32 strings (which gmp converts in linear time),
+# separated by spaces, row by row
+
+# pack all values of pp into a bytes object, for pickling
+cdef bytes _pack_matrix(mytype **pp, Py_ssize_t numrows, Py_ssize_t numcols):
+    cdef Py_ssize_t i, j
+    cdef size_t size = 0
+    cdef char *buf
+    cdef char *pos
+    for i in range(numrows):
+        for j in range(numcols):
+            size += (
+                mpz_sizeinbase(mpq_numref(pp[i][j]), 32)
+                + mpz_sizeinbase(mpq_denref(pp[i][j]), 32)
+                + 3
+            )
+    buf = <char*>cpython.mem.PyMem_RawMalloc(size + 1)
+    if buf == NULL:
+        raise MemoryError
+    try:
+        pos = buf
+        for i in range(numrows):
+            for j in range(numcols):
+                mpq_get_str(pos, 32, pp[i][j])
+                pos += libc.string.strlen(pos)
+                pos[0] = b" "
+                pos += 1
+        return cpython.bytes.PyBytes_FromStringAndSize(buf, pos - buf)
+    finally:
+        cpython.mem.PyMem_RawFree(buf)
+
+# unpack data from _pack_matrix into pp
+cdef int _unpack_matrix(
+    mytype **pp, Py_ssize_t numrows, Py_ssize_t numcols, data
+) except -1:
+    cdef Py_buffer view
+    cdef Py_ssize_t i, j
+    cdef char *buf = NULL
+    cdef const char *pos
+    cdef const char *end
+    cdef const char *token_end
+    cdef Py_ssize_t token_size
+    cpython.buffer.PyObject_GetBuffer(data, &view, cpython.buffer.PyBUF_SIMPLE)
     try:
-        mpq_set_si(target, value.numerator, value.denominator)
-    except OverflowError:
-        # in case of overflow, set it using mpq_set_str
-        buf = str(f"{value.numerator}/{value.denominator}").encode('ascii')
-        if mpq_set_str(target, buf, 10) == -1:
-            raise ValueError('could not convert %s to mpq_t' % value)
+        # tokens are at most as long as the data
+        buf = <char*>cpython.mem.PyMem_RawMalloc(view.len + 1)
+        if buf == NULL:
+            raise MemoryError
+        pos = <const char*>view.buf
+        end = pos + view.len
+        for i in range(numrows):
+            for j in range(numcols):
+                token_end = <const char*>libc.string.memchr(pos, b" ", end - pos)
+                if token_end == NULL:
+                    raise ValueError("pickle data does not match matrix size")
+                token_size = token_end - pos
+                libc.string.memcpy(buf, pos, token_size)
+                buf[token_size] = 0
+                if (
+                    mpq_set_str(pp[i][j], buf, 32) != 0
+                    or mpz_sgn(mpq_denref(pp[i][j])) == 0
+                ):
+                    raise ValueError("invalid pickle data")
+                mpq_canonicalize(pp[i][j])
+                pos = token_end + 1
+        if pos != end:
+            raise ValueError("pickle data does not match matrix size")
+    finally:
+        cpython.mem.PyMem_RawFree(buf)
+        cpython.buffer.PyBuffer_Release(&view)
+    return 0
@@ -15,15 +15,33 @@
 # with this program; if not, write to the Free Software Foundation, Inc.,
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
-from collections.abc import Container, Sequence, Set
+from collections.abc import Callable, Container, Iterable, Iterator, Sequence, Set
+import itertools as _itertools
+import math as _math
+import multiprocessing as _multiprocessing
+import os as _os
+import time as _time
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
 from contextlib import contextmanager
 from enum import IntEnum
-from typing import Optional
+from typing import Optional, Union
 
+# annotations are not evaluated, so they can refer to numpy as np,
+# and to numpy.typing as npt, as in the stubs;
+# numpy itself is only imported when needed
+
+cimport cpython.buffer
+cimport cpython.exc
+cimport cpython.float
 cimport cpython.mem
+cimport cpython.pythread
 cimport cpython.unicode
 cimport libc.stdio
 cimport libc.stdlib
+cimport libc.string
+from libc.limits cimport LLONG_MAX, LONG_MAX, ULLONG_MAX
+from libc.math cimport fabs, frexp, isfinite, ldexp
+from libc.stdint cimport uint64_t
 
 # windows hack for broken libc.stdio.tmpfile
 
@@ -49,6 +67,73 @@ cdef libc.stdio.FILE *libc_stdio_tmpfile() except NULL:
     _emit_endif()
     return result
 
+# in-memory streams, where available (not on windows)
+
+cdef extern from * nogil:
+    """
+    #ifdef _MSC_VER
+    static FILE *pycddlib_open_memstream(char **ptr, size_t *sizeloc) {
+      return NULL;
+    }
+    #else
+    #define pycddlib_open_memstream open_memstream
+    #endif
+    """
+    libc.stdio.FILE *_open_memstream "pycddlib_open_memstream" (
+        char **ptr, size_t *sizeloc
+    )
+
+# bit counting on the words of set_type, with a portable fallback
+
+cdef extern from * nogil:
+    """
+    #if defined(__GNUC__) || defined(__clang__)
+    #define pycddlib_popcount(x) __builtin_popcountl(x)
+    #define pycddlib_ctz(x) __builtin_ctzl(x)
+    #else
+    static int pycddlib_popcount(unsigned long x) {
+      int n = 0;
+      for (; x; x &= x - 1) n++;
+      return n;
+    }
+    static int pycddlib_ctz(unsigned long x) {
+      int n = 0;
+      for (; !(x & 1); x >>= 1) n++;
+      return n;
+    }
+    #endif
+    """
+    int _popcount "pycddlib_popcount" (unsigned long x)
+    int _ctz "pycddlib_ctz" (unsigned long x)
+
+# monotonic wall clock time in seconds, as time.monotonic(), but without the GIL;
+# unlike clock(), it is not affected by other threads of the process
+cdef extern from * nogil:
+    """
+    #ifdef _MSC_VER
+    #include <windows.h>
+    static double pycddlib_monotonic(void) {
+      LARGE_INTEGER count, freq;
+      QueryPerformanceCounter(&count);
+      QueryPerformanceFrequency(&freq);
+      return (double)count.QuadPart / (double)freq.QuadPart;
+    }
+    #else
+    #include <time.h>
+    static double pycddlib_monotonic(void) {
+      struct timespec ts;
+      clock_gettime(CLOCK_MONOTONIC, &ts);
+      return (double)ts.tv_sec + 1e-9 * (double)ts.tv_nsec;
+    }
+    #endif
+    """
+    double _monotonic "pycddlib_monotonic" ()
+
+cdef inline bint _set_member(long elem, set_type set_) noexcept nogil:
+    # inlined set_member, for elem between 1 and set_[0]
+    cdef long setbits = sizeof(unsigned long) * 8
+    return (set_[(elem - 1) // setbits + 1] >> ((elem - 1) % setbits)) & 1
+
 cdef libc.stdio.FILE *_tmpfile() except NULL:
     cdef libc.stdio.FILE *result
     # libc.stdio.tmpfile() is broken on windows
@@ -57,8 +142,95 @@ cdef libc.stdio.FILE *_tmpfile() except NULL:
         raise RuntimeError("failed to create temporary file")
     return result
 
+# cddlib is not reentrant: its linear programming solvers, its double
+# description implementation, and its adjacency routines keep scratch
+# buffers in static variables, and it updates global statistics counters;
+# so every call into cddlib that may touch this state is done with the GIL
+# released, but whilst holding a module-wide lock
+
+cdef cpython.pythread.PyThread_type_lock _cddlib_lock = (
+    cpython.pythread.PyThread_allocate_lock()
+)
+if _cddlib_lock == NULL:
+    raise MemoryError("failed to allocate cddlib lock")
+
+# the lock is not reentrant, so the thread that holds it is recorded,
+# to raise an error instead of a deadlock if that thread calls into cddlib
+# again, such as from a progress callback; zero if no thread holds the lock
+
+cdef extern from "pythread.h" nogil:
+    unsigned long _thread_ident "PyThread_get_thread_ident" ()
+
+cdef unsigned long _cddlib_owner = 0
+
+cdef inline int _cddlib_acquire() except -1 nogil:
+    global _cddlib_owner
+    cdef unsigned long ident = _thread_ident()
+    if _cddlib_owner == ident:
+        with gil:
+            raise RuntimeError(
+                "cddlib is already in use by this thread, "
+                "for instance from a callback"
+            )
+    cpython.pythread.PyThread_acquire_lock(
+        _cddlib_lock, cpython.pythread.WAIT_LOCK
+    )
+    _cddlib_owner = ident
+    return 0
+
+cdef inline void _cddlib_release() noexcept nogil:
+    global _cddlib_owner
+    _cddlib_owner = 0
+    cpython.pythread.PyThread_release_lock(_cddlib_lock)
+
 # helper functions
 
+# stream for cddlib to write a string into, see _str_stream_open
+cdef struct _StrStream:
+    libc.stdio.FILE *pfile
+    bint in_memory
+    char *buf
+    size_t size
+
+# open an in-memory stream, or a temporary file as fallback
+cdef int _str_stream_open(_StrStream *stream) except -1:
+    stream.buf = NULL
+    stream.size = 0
+    stream.pfile = _open_memstream(&stream.buf, &stream.size)
+    stream.in_memory = stream.pfile != NULL
+    if not stream.in_memory:
+        stream.pfile = _tmpfile()
+    return 0
+
+# close the stream, and return everything written to it
+cdef _str_stream_read(_StrStream *stream):
+    if not stream.in_memory:
+        return _tmpread(stream.pfile)
+    # closing updates buf and size
+    if libc.stdio.fclose(stream.pfile) != 0:
+        libc.stdlib.free(stream.buf)
+        raise MemoryError
+    try:
+        return cpython.unicode.PyUnicode_DecodeUTF8(
+            stream.buf, stream.size, 'strict'
+        )
+    finally:
+        libc.stdlib.free(stream.buf)
+
+# open a file for cddlib to write into
+cdef libc.stdio.FILE *_fopen_write(path) except NULL:
+    cdef libc.stdio.FILE *pfile = libc.stdio.fopen(_os.fsencode(path), "w")
+    if pfile == NULL:
+        cpython.exc.PyErr_SetFromErrnoWithFilenameObject(OSError, path)
+    return pfile
+
+# close a file opened with _fopen_write, raising if any write failed
+cdef int _fclose_write(libc.stdio.FILE *pfile, path) except -1:
+    cdef bint failed = libc.stdio.ferror(pfile)
+    if libc.stdio.fclose(pfile) != 0 or failed:
+        cpython.exc.PyErr_SetFromErrnoWithFilenameObject(OSError, path)
+    return 0
+
 cdef _tmpread(libc.stdio.FILE *pfile):
     cdef size_t length
     cdef size_t num_bytes
@@ -117,18 +289,55 @@ cdef setfam_from_ptr(dd_SetFamilyPtr dd_setfam):
     dd_FreeSetFamily(dd_setfam)
     return result
 
-cdef setfam_from_ptr_with_error(dd_SetFamilyPtr dd_setfam, dd_ErrorType error):
-    if error != dd_NoError:
+cdef void _pack_set(set_type set_, long setsize, uint64_t *row) noexcept nogil:
+    # pack set_ into the zeroed row of (setsize + 63) // 64 words;
+    # bit j of word k is set if and only if element 64 * k + j is in set_
+    cdef unsigned long block
+    cdef unsigned long pos
+    cdef unsigned long setbits = sizeof(unsigned long) * 8
+    # set_type words are unsigned longs, which have 32 bits on some platforms
+    for block in range(set_blocks(setsize) - 1):
+        pos = block * setbits
+        row[pos // 64] |= <uint64_t>set_[block + 1] << (pos % 64)
+    # clear any bits beyond the ground set
+    if setsize % 64 != 0:
+        row[(setsize - 1) // 64] &= (<uint64_t>1 << (setsize % 64)) - 1
+
+cdef bitset_from_ptr(dd_SetFamilyPtr dd_setfam):
+    # create packed uint64 numpy array from dd_SetFamilyPtr, and
+    # free the pointer; bit j of word k in row i is set
+    # if and only if element 64 * k + j is in set i
+    cdef Py_buffer view
+    cdef dd_bigrange i
+    cdef Py_ssize_t numwords
+    if dd_setfam == NULL:
+        raise MemoryError
+    try:
+        import numpy
+        numwords = (dd_setfam.setsize + 63) // 64
+        out = numpy.zeros((dd_setfam.famsize, numwords), dtype=numpy.uint64)
+        cpython.buffer.PyObject_GetBuffer(
+            out, &view, cpython.buffer.PyBUF_C_CONTIGUOUS | cpython.buffer.PyBUF_WRITABLE
+        )
+        with nogil:
+            for i in range(dd_setfam.famsize):
+                _pack_set(
+                    dd_setfam.set[i],
+                    dd_setfam.setsize,
+                    <uint64_t*>view.buf + i * numwords,
+                )
+        cpython.buffer.PyBuffer_Release(&view)
+    finally:
         dd_FreeSetFamily(dd_setfam)
-        _raise_error(error)
-    return setfam_from_ptr(dd_setfam)
+    # fix the byte order so the result can be unpacked with numpy.unpackbits
+    return out.astype("<u8", copy=False)
 
 
 cdef _raise_error(dd_ErrorType error):
-    cdef libc.stdio.FILE *pfile
-    pfile = _tmpfile()
-    dd_WriteErrorMessages(pfile, error)
-    raise RuntimeError(_tmpread(pfile).rstrip('\n'))
+    cdef _StrStream stream
+    _str_stream_open(&stream)
+    dd_WriteErrorMessages(stream.pfile, error)
+    raise RuntimeError(_str_stream_read(&stream).rstrip('\n'))
 
 # extension classes to wrap matrix, linear program, and polyhedron
 
@@ -321,10 +530,10 @@ cdef class Matrix:
             _set_mytype(self.dd_mat.rowvec[colindex], value)
 
     def __str__(self):
-        cdef libc.stdio.FILE *pfile
-        pfile = _tmpfile()
-        dd_WriteMatrix(pfile, self.dd_mat)
-        return _tmpread(pfile).rstrip('\n')
+        cdef _StrStream stream
+        _str_stream_open(&stream)
+        dd_WriteMatrix(stream.pfile, self.dd_mat)
+        return _str_stream_read(&stream).rstrip('\n')
 
     def __init__(self):
         raise TypeError("This class cannot be instantiated directly.")
@@ -333,13 +542,45 @@ cdef class Matrix:
         dd_FreeMatrix(self.dd_mat)
         self.dd_mat = NULL
 
-    def __reduce__(self):
+    def __reduce_ex__(self, protocol):
         return (
-            matrix_from_array,
-            (self.array, self.lin_set, self.rep_type, self.obj_type, self.obj_func),
+            _matrix_from_pickle,
+            (
+                _pickle_buffer(
+                    _pack_matrix(
+                        self.dd_mat.matrix, self.dd_mat.rowsize, self.dd_mat.colsize
+                    ),
+                    protocol,
+                ),
+                self.dd_mat.rowsize,
+                self.dd_mat.colsize,
+                self.lin_set,
+                self.rep_type,
+                self.obj_type,
+                self.obj_func,
+            ),
         )
 
 
+# wrap packed data into a pickle buffer, so it can be sent out-of-band
+cdef _pickle_buffer(bytes data, protocol):
+    if protocol >= 5:
+        import pickle
+        return pickle.PickleBuffer(data)
+    return data
+
+
+def _matrix_from_pickle(data, numrows, numcols, lin_set, rep_type, obj_type, obj_func):
+    # reconstruct a matrix pickled by Matrix.__reduce_ex__
+    cdef Matrix mat = matrix_from_ptr(dd_CreateMatrix(numrows, numcols))
+    _unpack_matrix(mat.dd_mat.matrix, numrows, numcols, data)
+    mat.lin_set = lin_set
+    mat.rep_type = rep_type
+    mat.obj_type = obj_type
+    mat.obj_func = obj_func
+    return mat
+
+
 # wrap pointer into Matrix class
 # https://cython.readthedocs.io/en/latest/src/userguide/extension_types.html#instantiation-from-existing-c-c-pointers
 cdef matrix_from_ptr(dd_MatrixPtr dd_mat):
@@ -373,7 +614,62 @@ cdef _array_shape(array):
         raise ValueError("array too large")
     return shape
 
+# get a C-contiguous buffer with ndim dimensions from array,
+# whose items have the format and size of the fast import path;
+# returns False if array does not expose such a buffer
+cdef bint _get_import_buffer(Py_buffer *view, array, int ndim) except -1:
+    return _get_buffer(view, array, ndim, _IMPORT_FORMATS, _IMPORT_ITEMSIZE)
+
+# get a C-contiguous buffer with ndim dimensions and the given item
+# formats and size from array;
+# returns False if array does not expose such a buffer
+cdef bint _get_buffer(
+    Py_buffer *view, array, int ndim, const char *formats, Py_ssize_t itemsize
+) except -1:
+    if not cpython.buffer.PyObject_CheckBuffer(array):
+        return False
+    try:
+        cpython.buffer.PyObject_GetBuffer(
+            array, view, cpython.buffer.PyBUF_C_CONTIGUOUS | cpython.buffer.PyBUF_FORMAT
+        )
+    except (BufferError, ValueError):
+        return False
+    if view.ndim == ndim and _buffer_has_format(view, formats, itemsize):
+        return True
+    cpython.buffer.PyBuffer_Release(view)
+    return False
+
+# fast path for C-contiguous buffers, such as numpy arrays
+# returns False if array does not expose such a buffer
+cdef bint _set_matrix_from_buffer(mytype **pp, _Shape shape, array) except -1:
+    cdef Py_buffer view
+    if not _get_import_buffer(&view, array, 2):
+        return False
+    try:
+        if view.shape[0] != shape.numrows or view.shape[1] != shape.numcols:
+            return False
+        _set_matrix_from_data(
+            pp, shape.numrows, shape.numcols, <const char*>view.buf
+        )
+    finally:
+        cpython.buffer.PyBuffer_Release(&view)
+    return True
+
+cdef bint _buffer_has_format(Py_buffer *view, const char *formats, Py_ssize_t itemsize):
+    # check if view has a native single item format from formats
+    cdef const char *fmt = view.format
+    if fmt[0] == b"@" or fmt[0] == b"=":
+        fmt += 1
+    return (
+        view.itemsize == itemsize
+        and fmt[0] != 0
+        and fmt[1] == 0
+        and libc.string.strchr(formats, fmt[0]) != NULL
+    )
+
 cdef _set_matrix_from_array(mytype **pp, _Shape shape, array):
+    if _set_matrix_from_buffer(pp, shape, array):
+        return
     for rowindex, row in enumerate(array):
         if len(row) != shape.numcols:
             raise ValueError("rows have different lengths")
@@ -381,6 +677,144 @@ cdef _set_matrix_from_array(mytype **pp, _Shape shape, array):
             _set_mytype(pp[rowindex][colindex], value)
 
 
+# rationalization of floats with bounded denominators
+
+cdef struct _Rationalize:
+    unsigned long long max_denominator
+    double tolerance  # negative if not specified
+
+cdef _Rationalize _rationalize_options(max_denominator, tolerance) except *:
+    cdef _Rationalize options = _Rationalize(ULLONG_MAX, -1)
+    if max_denominator is not None:
+        if max_denominator < 1:
+            raise ValueError("max_denominator must be at least 1")
+        options.max_denominator = min(max_denominator, ULLONG_MAX)
+    if tolerance is not None:
+        if not tolerance >= 0:
+            raise ValueError("tolerance must be non-negative")
+        options.tolerance = tolerance
+    return options
+
+# best rational approximation p/q of x with q at most max_denominator,
+# as Fraction.limit_denominator, stopping early at the first convergent
+# within tolerance; returns False if x is not finite,
+# or if p or q does not fit into a long long
+cdef bint _rationalize(
+    double x, _Rationalize *options, long long *num, long long *den
+) noexcept nogil:
+    cdef int exponent
+    cdef bint negative = x < 0
+    cdef unsigned long long n, d, a, k, denominator
+    cdef unsigned long long p0 = 0, q0 = 1, p1 = 1, q1 = 0, p2, q2
+    if not isfinite(x):
+        return False
+    x = fabs(x)
+    if x == 0:
+        num[0] = 0
+        den[0] = 1
+        return True
+    # x = n / 2 ** exponent exactly, with n odd
+    n = <unsigned long long>ldexp(frexp(x, &exponent), 53)
+    exponent = 53 - exponent
+    while n % 2 == 0 and exponent > 0:
+        n //= 2
+        exponent -= 1
+    if exponent <= 0:
+        if x >= ldexp(1, 63):
+            return False
+        num[0] = -<long long>x if negative else <long long>x
+        den[0] = 1
+        return True
+    if exponent > 62:
+        return False
+    denominator = d = 1ULL << exponent
+    while True:
+        a = n // d
+        if q1 != 0 and a > (options.max_denominator - q0) // q1:
+            # bound reached: pick the closest of p1/q1 and the semiconvergent,
+            # the latter if 2 * d * (q0 + k * q1) > denominator
+            k = (options.max_denominator - q0) // q1
+            if q0 + k * q1 > (denominator // 2) // d:
+                if p1 != 0 and k > (LLONG_MAX - p0) // p1:
+                    return False
+                p1 = p0 + k * p1
+                q1 = q0 + k * q1
+            break
+        if p1 != 0 and a > (LLONG_MAX - p0) // p1:
+            return False
+        p2 = p0 + a * p1
+        q2 = q0 + a * q1
+        p0, q0, p1, q1 = p1, q1, p2, q2
+        n, d = d, n - a * d
+        if d == 0 or (
+            options.tolerance >= 0 and fabs(<double>p1 / q1 - x) <= options.tolerance
+        ):
+            break
+    num[0] = -<long long>p1 if negative else <long long>p1
+    den[0] = <long long>q1
+    return True
+
+# slow version of _rationalize, for values outside its range
+cdef _rationalize_slow(double x, max_denominator, double tolerance):
+    numerator, denominator = abs(x).as_integer_ratio()
+    n, d = numerator, denominator
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    while d:
+        a = n // d
+        q2 = q0 + a * q1
+        if max_denominator is not None and q2 > max_denominator:
+            k = (max_denominator - q0) // q1
+            if 2 * d * (q0 + k * q1) > denominator:
+                p1, q1 = p0 + k * p1, q0 + k * q1
+            break
+        p0, q0, p1, q1 = p1, q1, p0 + a * p1, q2
+        n, d = d, n - a * d
+        if tolerance >= 0 and abs(p1 / q1 - abs(x)) <= tolerance:
+            break
+    return Fraction(-p1 if x < 0 else p1, q1)
+
+cdef int _set_mytype_rationalized(
+    mytype target, value, _Rationalize *options, max_denominator
+) except -1:
+    cdef long long num, den
+    if not cpython.float.PyFloat_Check(value):
+        _set_mytype(target, value)
+    elif _rationalize(value, options, &num, &den):
+        _set_mytype_ratio(target, num, den)
+    else:
+        _set_mytype(
+            target, _rationalize_slow(value, max_denominator, options.tolerance)
+        )
+    return 0
+
+cdef _set_matrix_from_array_rationalized(
+    mytype **pp, _Shape shape, array, _Rationalize *options, max_denominator
+):
+    cdef Py_buffer view
+    cdef Py_ssize_t i, j
+    cdef const double *data
+    if _get_buffer(&view, array, 2, b"d", sizeof(double)):
+        try:
+            if view.shape[0] == shape.numrows and view.shape[1] == shape.numcols:
+                data = <const double*>view.buf
+                for i in range(shape.numrows):
+                    for j in range(shape.numcols):
+                        _set_mytype_rationalized(
+                            pp[i][j], data[i * shape.numcols + j],
+                            options, max_denominator,
+                        )
+                return
+        finally:
+            cpython.buffer.PyBuffer_Release(&view)
+    for rowindex, row in enumerate(array):
+        if len(row) != shape.numcols:
+            raise ValueError("rows have different lengths")
+        for colindex, value in enumerate(row):
+            _set_mytype_rationalized(
+                pp[rowindex][colindex], value, options, max_denominator
+            )
+
+
 cdef _get_array_from_matrix(mytype **pp, _Shape shape):
     cdef dd_rowrange i
     cdef dd_colrange j
@@ -389,6 +823,55 @@ cdef _get_array_from_matrix(mytype **pp, _Shape shape):
         for i in range(shape.numrows)
     ]
 
+# get a writable buffer of the given shape from out, for bulk export;
+# if out is None, then a new numpy array is created and returned
+cdef _get_export_buffer(Py_buffer *view, out, tuple shape):
+    cdef int dim
+    if out is None:
+        import numpy
+        out = numpy.empty(shape, dtype=_EXPORT_DTYPE)
+    try:
+        cpython.buffer.PyObject_GetBuffer(out, view, cpython.buffer.PyBUF_RECORDS)
+    except (BufferError, ValueError, TypeError):
+        pass
+    else:
+        if (
+            view.ndim == len(shape)
+            and all(view.shape[dim] == shape[dim] for dim in range(view.ndim))
+            and _buffer_has_format(view, _EXPORT_FORMATS, _EXPORT_ITEMSIZE)
+        ):
+            return out
+        cpython.buffer.PyBuffer_Release(view)
+    raise ValueError(f"out must be a writable {_EXPORT_DTYPE} array of shape {shape}")
+
+cdef _export_matrix(mytype **pp, _Shape shape, out):
+    # copy all elements of pp into out, see _get_export_buffer
+    cdef Py_buffer view
+    cdef dd_rowrange i
+    cdef dd_colrange j
+    cdef char *row
+    out = _get_export_buffer(&view, out, (shape.numrows, shape.numcols))
+    try:
+        for i in range(shape.numrows):
+            row = <char*>view.buf + i * view.strides[0]
+            for j in range(shape.numcols):
+                _get_mytype_to_item(pp[i][j], row + j * view.strides[1])
+    finally:
+        cpython.buffer.PyBuffer_Release(&view)
+    return out
+
+cdef _export_arow(dd_Arow arow, dd_colrange size, out):
+    # copy the first size elements of arow into out, see _get_export_buffer
+    cdef Py_buffer view
+    cdef dd_colrange j
+    out = _get_export_buffer(&view, out, (size,))
+    try:
+        for j in range(size):
+            _get_mytype_to_item(arow[j], <char*>view.buf + j * view.strides[0])
+    finally:
+        cpython.buffer.PyBuffer_Release(&view)
+    return out
+
 
 # create matrix and wrap into Matrix class
 # https://cython.readthedocs.io/en/latest/src/userguide/extension_types.html#instantiation-from-existing-c-c-pointers
@@ -398,20 +881,60 @@ def matrix_from_array(
     rep_type: RepType = RepType.UNSPECIFIED,
     obj_type: LPObjType = LPObjType.NONE,
     obj_func: Optional[Sequence[SupportsNumberType]] = None,
+    max_denominator: Optional[int] = None,
+    tolerance: Optional[float] = None,
+    scale_rows: bool = False,
 ) -> Matrix:
     """Construct a matrix with the given attributes.
 
     See :attr:`cdd.Matrix.array` for an explanation of how *array* must be laid out.
     This function also accepts 2-dimensional numpy arrays.
+    C-contiguous arrays of 64 bit floats (for :mod:`cdd`)
+    or of 64 bit integers (for :mod:`cdd.gmp`)
+    are copied directly through the buffer protocol,
+    which is much faster than converting every element separately.
+
+    If *max_denominator* or *tolerance* is specified,
+    then every :class:`float` in *array* and *obj_func*
+    (including C-contiguous arrays of 64 bit floats)
+    is replaced by the closest fraction whose denominator is
+    at most *max_denominator*,
+    as with :meth:`fractions.Fraction.limit_denominator`,
+    or by the first convergent of its continued fraction
+    that is within *tolerance*, whichever comes first.
+    For :mod:`cdd.gmp`, this allows floats as input,
+    and avoids the huge denominators of their exact values,
+    which slow down all further computations.
+
+    If *scale_rows* is ``True`` (only supported by :mod:`cdd.gmp`),
+    then every row is multiplied by a positive factor
+    so that it consists of coprime integers.
+    This does not change the polyhedron.
+
+    .. versionchanged:: 3.0.2
+
+        Fast path for C-contiguous numpy arrays,
+        and the *max_denominator*, *tolerance*, and *scale_rows* parameters.
     """
     cdef Py_ssize_t numrows, numcols, rowindex, colindex
     cdef dd_MatrixPtr dd_mat
     cdef _Shape shape = _array_shape(array)
+    cdef bint rationalize = max_denominator is not None or tolerance is not None
+    cdef _Rationalize options
+    if rationalize:
+        options = _rationalize_options(max_denominator, tolerance)
     dd_mat = dd_CreateMatrix(shape.numrows, shape.numcols)
     if dd_mat == NULL:
         raise MemoryError
     try:
-        _set_matrix_from_array(dd_mat.matrix, shape, array)
+        if rationalize:
+            _set_matrix_from_array_rationalized(
+                dd_mat.matrix, shape, array, &options, max_denominator
+            )
+        else:
+            _set_matrix_from_array(dd_mat.matrix, shape, array)
+        if scale_rows:
+            _normalize_rows(dd_mat.matrix, shape.numrows, shape.numcols, False)
         _set_set(dd_mat.linset, lin_set)
         dd_mat.representation = rep_type.value
         dd_mat.objective = obj_type.value
@@ -420,13 +943,289 @@ def matrix_from_array(
                 raise ValueError(
                     "objective function does not match matrix column size")
             for colindex, value in enumerate(obj_func):
-                _set_mytype(dd_mat.rowvec[colindex], value)
+                if rationalize:
+                    _set_mytype_rationalized(
+                        dd_mat.rowvec[colindex], value, &options, max_denominator
+                    )
+                else:
+                    _set_mytype(dd_mat.rowvec[colindex], value)
     except:  # noqa: E722
         dd_FreeMatrix(dd_mat)
         raise
     return matrix_from_ptr(dd_mat)
 
 
+# parser for the cdd file format
+
+cdef struct _Parser:
+    const char *pos  # current position
+    const char *end  # end of data
+    Py_ssize_t line  # current line number
+    const char *token  # last token
+    Py_ssize_t token_size  # size of last token
+    char *buf  # null terminated copy of last token
+    Py_ssize_t buf_size  # allocated size of buf
+    const char *error  # error message
+
+cdef const char *_PARSER_OUT_OF_MEMORY = "out of memory"
+
+cdef inline bint _is_space(char c) noexcept nogil:
+    return c == b" " or c == b"\t" or c == b"\n" or c == b"\r" or c == b"\f" or c == b"\v"
+
+# read next whitespace separated token; returns False at end of data
+cdef bint _parser_next(_Parser *p) noexcept nogil:
+    cdef Py_ssize_t line = p.line
+    while p.pos < p.end and _is_space(p.pos[0]):
+        if p.pos[0] == b"\n":
+            line += 1
+        p.pos += 1
+    if p.pos == p.end:
+        p.token = NULL
+        return False
+    p.line = line
+    p.token = p.pos
+    while p.pos < p.end and not _is_space(p.pos[0]):
+        p.pos += 1
+    p.token_size = p.pos - p.token
+    return True
+
+cdef void _parser_skip_line(_Parser *p) noexcept nogil:
+    while p.pos < p.end and p.pos[0] != b"\n":
+        p.pos += 1
+
+cdef bint _parser_token_is(_Parser *p, const char *word) noexcept nogil:
+    cdef size_t size = libc.string.strlen(word)
+    return (
+        <size_t>p.token_size == size
+        and libc.string.memcmp(p.token, word, size) == 0
+    )
+
+# read next token as null terminated string into p.buf
+cdef bint _parser_next_str(_Parser *p) noexcept nogil:
+    cdef char *buf
+    if not _parser_next(p):
+        p.error = "unexpected end of file"
+        return False
+    if p.token_size >= p.buf_size:
+        buf = <char*>libc.stdlib.realloc(p.buf, p.token_size + 1)
+        if buf == NULL:
+            p.error = _PARSER_OUT_OF_MEMORY
+            return False
+        p.buf = buf
+        p.buf_size = p.token_size + 1
+    libc.string.memcpy(p.buf, p.token, p.token_size)
+    p.buf[p.token_size] = 0
+    return True
+
+cdef bint _parser_next_long(_Parser *p, long *value) noexcept nogil:
+    cdef char *end
+    if not _parser_next_str(p):
+        return False
+    value[0] = libc.stdlib.strtol(p.buf, &end, 10)
+    if end == p.buf or end[0] != 0:
+        p.error = "invalid integer"
+        return False
+    return True
+
+cdef bint _parser_next_mytype(_Parser *p, mytype value) noexcept nogil:
+    if not _parser_next_str(p):
+        return False
+    if not _set_mytype_from_str(value, p.buf):
+        p.error = "invalid number"
+        return False
+    return True
+
+# parse the linearity indices at the current position into dd_mat
+cdef bint _parser_linearity(_Parser *p, dd_MatrixPtr dd_mat) noexcept nogil:
+    cdef long size
+    cdef long k
+    cdef long row
+    if not _parser_next_long(p, &size):
+        return False
+    for k in range(size):
+        if not _parser_next_long(p, &row):
+            return False
+        if not 1 <= row <= dd_mat.rowsize:
+            p.error = "linearity row index out of range"
+            return False
+        set_addelem(dd_mat.linset, row)
+    return True
+
+# parse cdd file data into a new matrix; returns NULL and sets p.error on failure
+cdef dd_MatrixPtr _parse_matrix(_Parser *p) noexcept nogil:
+    cdef dd_MatrixPtr dd_mat = NULL
+    cdef dd_RepresentationType rep = dd_Inequality  # default, as in cddlib
+    cdef dd_NumberType numbtype
+    cdef const char *linearity_pos = NULL
+    cdef Py_ssize_t linearity_line = 0
+    cdef const char *end_pos
+    cdef Py_ssize_t end_line
+    cdef long numrows
+    cdef long numcols
+    cdef long i
+    cdef long j
+    # header
+    while True:
+        if not _parser_next(p):
+            p.error = "begin missing"
+            return NULL
+        if p.token[0] == b"*":  # comment
+            _parser_skip_line(p)
+        elif _parser_token_is(p, "H-representation"):
+            rep = dd_Inequality
+        elif _parser_token_is(p, "V-representation"):
+            rep = dd_Generator
+        elif (
+            _parser_token_is(p, "linearity")
+            or _parser_token_is(p, "equality")
+            or _parser_token_is(p, "partial_enum")
+        ):
+            # parse later, once the matrix exists
+            linearity_pos = p.pos
+            linearity_line = p.line
+            _parser_skip_line(p)
+        elif _parser_token_is(p, "begin"):
+            break
+    if not _parser_next_long(p, &numrows) or not _parser_next_long(p, &numcols):
+        return NULL
+    if numrows < 0 or numcols < 1:
+        p.error = "invalid matrix size"
+        p.token = NULL
+        return NULL
+    if not _parser_next(p):
+        p.error = "unexpected end of file"
+        return NULL
+    if _parser_token_is(p, "real"):
+        numbtype = dd_Real
+    elif _parser_token_is(p, "rational"):
+        numbtype = dd_Rational
+    elif _parser_token_is(p, "integer"):
+        numbtype = dd_Integer
+    else:
+        p.error = "unknown number type"
+        return NULL
+    dd_mat = dd_CreateMatrix(numrows, numcols)
+    if dd_mat == NULL:
+        p.error = _PARSER_OUT_OF_MEMORY
+        return NULL
+    dd_mat.representation = rep
+    dd_mat.numbtype = numbtype
+    # rows
+    for i in range(numrows):
+        for j in range(numcols):
+            if not _parser_next_mytype(p, dd_mat.matrix[i][j]):
+                dd_FreeMatrix(dd_mat)
+                return NULL
+    if not _parser_next(p) or not _parser_token_is(p, "end"):
+        p.error = "end missing"
+        dd_FreeMatrix(dd_mat)
+        return NULL
+    end_pos = p.pos
+    end_line = p.line
+    if linearity_pos != NULL:
+        p.pos = linearity_pos
+        p.line = linearity_line
+        if not _parser_linearity(p, dd_mat):
+            dd_FreeMatrix(dd_mat)
+            return NULL
+        p.pos = end_pos
+        p.line = end_line
+    # trailing commands: only the objective function is relevant
+    while _parser_next(p):
+        if _parser_token_is(p, "maximize") or _parser_token_is(p, "minimize"):
+            dd_mat.objective = (
+                dd_LPmax if _parser_token_is(p, "maximize") else dd_LPmin
+            )
+            for j in range(numcols):
+                if not _parser_next_mytype(p, dd_mat.rowvec[j]):
+                    dd_FreeMatrix(dd_mat)
+                    return NULL
+        else:
+            _parser_skip_line(p)
+    return dd_mat
+
+@contextmanager
+def _open_buffer(path):
+    # memory map the file, falling back to reading it,
+    # as empty files and some special files cannot be mapped
+    import mmap
+    with open(path, "rb") as file_:
+        try:
+            data = mmap.mmap(file_.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            yield file_.read()
+        else:
+            with data:
+                yield data
+
+
+def matrix_from_file(path: Union[str, _os.PathLike]) -> Matrix:
+    """Read a matrix from a file in cdd's ``.ine`` or ``.ext`` format,
+    such as written by ``str(mat)``.
+
+    The file is memory mapped and parsed straight into the matrix,
+    without creating any intermediate Python objects.
+    The representation type (H-representation if not specified),
+    the linearity indices,
+    and a ``maximize`` or ``minimize`` objective function are read as well.
+    For :mod:`cdd.gmp`, decimal numbers are converted exactly into fractions,
+    and their exponent must be between -1000 and 1000.
+
+    A :exc:`ValueError`, stating the offending line number, is raised
+    if the file is not well formed.
+
+    .. versionadded:: 3.0.2
+    """
+    cdef Py_buffer view
+    cdef _Parser p
+    cdef dd_MatrixPtr dd_mat = NULL
+    with _open_buffer(path) as data:
+        cpython.buffer.PyObject_GetBuffer(data, &view, cpython.buffer.PyBUF_SIMPLE)
+        p.pos = <const char*>view.buf
+        p.end = p.pos + view.len
+        p.line = 1
+        p.token = NULL
+        p.token_size = 0
+        p.buf = NULL
+        p.buf_size = 0
+        p.error = NULL
+        try:
+            with nogil:
+                dd_mat = _parse_matrix(&p)
+            if p.error == _PARSER_OUT_OF_MEMORY:
+                raise MemoryError
+            if dd_mat == NULL:
+                message = f"line {p.line}: {p.error.decode('ascii')}"
+                if p.token != NULL:
+                    token = p.token[:min(p.token_size, 40)]
+                    message += f" at {token.decode('utf-8', 'replace')!r}"
+                raise ValueError(message)
+        finally:
+            libc.stdlib.free(p.buf)
+            cpython.buffer.PyBuffer_Release(&view)
+    return matrix_from_ptr(dd_mat)
+
+
+def matrix_to_numpy(
+    mat: Matrix, out: Optional[NumberArray] = None
+) -> "NumberArray":
+    """Copy :attr:`~cdd.Matrix.array` of *mat* into a numpy array,
+    and return that array.
+
+    The array has dtype ``float64`` for :mod:`cdd`,
+    and dtype ``object`` (containing :class:`~fractions.Fraction` values)
+    for :mod:`cdd.gmp`.
+    If *out* is given, then the values are written into *out* instead,
+    which must be a writable array of the right shape and dtype.
+    Unlike :attr:`~cdd.Matrix.array`,
+    this does not create any intermediate Python lists.
+
+    .. versionadded:: 3.0.2
+    """
+    cdef _Shape shape = _Shape(mat.dd_mat.rowsize, mat.dd_mat.colsize)
+    return _export_matrix(mat.dd_mat.matrix, shape, out)
+
+
 def matrix_copy(mat: Matrix) -> Matrix:
     """Return a copy of *mat*."""
     return matrix_from_ptr(dd_CopyMatrix(mat.dd_mat))
@@ -444,6 +1243,21 @@ cdef int _ROW_CHECK_TYPE_REDUNDANT = 0
 cdef int _ROW_CHECK_TYPE_STRONGLY_REDUNDANT = 1
 cdef int _ROW_CHECK_TYPE_IMPLICIT_LINEARITY = 2
 
+# whether row has a certificate, in the sense of row_check_type
+cdef dd_boolean _check_row(
+    dd_MatrixPtr dd_mat,
+    dd_rowrange row,
+    int row_check_type,
+    dd_Arow certificate,
+    dd_ErrorType *error,
+) noexcept nogil:
+    if row_check_type == _ROW_CHECK_TYPE_REDUNDANT:
+        return not dd_Redundant(dd_mat, row, certificate, error)
+    elif row_check_type == _ROW_CHECK_TYPE_STRONGLY_REDUNDANT:
+        return not dd_SRedundant(dd_mat, row, certificate, error)
+    else:
+        return not dd_ImplicitLinearity(dd_mat, row, certificate, error)
+
 # () -> Optional[Sequence[NumberType]]
 cdef _certificate(dd_MatrixPtr dd_mat, int row, int row_check_type):
     """Returns a certificate to prove that *row_check_type* is not satisfied,
@@ -463,19 +1277,19 @@ cdef _certificate(dd_MatrixPtr dd_mat, int row, int row_check_type):
         1 if dd_mat.representation == dd_Generator else 0
     )
     cdef dd_Arow certificate = NULL
-    cdef dd_boolean is_red = 0
+    cdef dd_boolean has_certificate = 0
     cdef dd_rowrange crow = row
     dd_InitializeArow(certificate_size, &certificate)
     try:
-        if row_check_type == _ROW_CHECK_TYPE_REDUNDANT:
-            is_red = dd_Redundant(dd_mat, crow + 1, certificate, &error)
-        elif row_check_type == _ROW_CHECK_TYPE_STRONGLY_REDUNDANT:
-            is_red = dd_SRedundant(dd_mat, crow + 1, certificate, &error)
-        elif row_check_type == _ROW_CHECK_TYPE_IMPLICIT_LINEARITY:
-            is_red = dd_ImplicitLinearity(dd_mat, crow + 1, certificate, &error)
+        with nogil:
+            _cddlib_acquire()
+            has_certificate = _check_row(
+                dd_mat, crow + 1, row_check_type, certificate, &error
+            )
+            _cddlib_release()
         if certificate == NULL or error != dd_NoError:
             _raise_error(error)
-        return _get_arow(certificate_size, certificate) if not is_red else None
+        return _get_arow(certificate_size, certificate) if has_certificate else None
     finally:
         dd_FreeArow(certificate_size, certificate)
 
@@ -601,47 +1415,599 @@ cdef _certificate_rows(dd_MatrixPtr dd_mat, int row_check_type):
     cdef dd_ErrorType error = dd_NoError
     cdef dd_rowset row_set = NULL
     try:
-        if row_check_type == _ROW_CHECK_TYPE_REDUNDANT:
-            row_set = dd_RedundantRows(dd_mat, &error)
-        elif row_check_type == _ROW_CHECK_TYPE_STRONGLY_REDUNDANT:
-            row_set = dd_SRedundantRows(dd_mat, &error)
-        elif row_check_type == _ROW_CHECK_TYPE_IMPLICIT_LINEARITY:
-            row_set = dd_ImplicitLinearityRows(dd_mat, &error)
+        with nogil:
+            _cddlib_acquire()
+            if row_check_type == _ROW_CHECK_TYPE_REDUNDANT:
+                row_set = dd_RedundantRows(dd_mat, &error)
+            elif row_check_type == _ROW_CHECK_TYPE_STRONGLY_REDUNDANT:
+                row_set = dd_SRedundantRows(dd_mat, &error)
+            elif row_check_type == _ROW_CHECK_TYPE_IMPLICIT_LINEARITY:
+                row_set = dd_ImplicitLinearityRows(dd_mat, &error)
+            _cddlib_release()
         if row_set == NULL or error != dd_NoError:
             _raise_error(error)
         return _get_set(row_set)
     finally:
         set_free(row_set)
 
-def redundant_rows(mat: Matrix) -> Set[int]:
+# set row of dd_mat to zero, which is the same as removing it for
+# redundancy and implicit linearity checks, without shifting other rows
+cdef void _set_zero_row(dd_MatrixPtr dd_mat, dd_rowrange row) noexcept nogil:
+    cdef dd_colrange j
+    for j in range(dd_mat.colsize):
+        dd_set(dd_mat.matrix[row - 1][j], dd_purezero)
+
+def _certificate_rows_chunk(
+    mat: Matrix, rows: Sequence[int], removed: Sequence[int], int row_check_type
+) -> list[int]:
+    # run in a worker process by _certificate_rows_parallel:
+    # returns all rows (in decreasing order) that have no certificate,
+    # where each row is checked with the removed rows beyond it set to zero
+    cdef dd_ErrorType error = dd_NoError
+    cdef dd_MatrixPtr dd_mat = NULL
+    cdef dd_colrange certificate_size = mat.dd_mat.colsize + (
+        1 if mat.dd_mat.representation == dd_Generator else 0
+    )
+    cdef dd_Arow certificate = NULL
+    cdef dd_boolean has_certificate = 0
+    cdef dd_rowrange row
+    cdef Py_ssize_t k = 0
+    removed = sorted(removed, reverse=True)
+    result = []
+    dd_mat = dd_CopyMatrix(mat.dd_mat)
+    dd_InitializeArow(certificate_size, &certificate)
+    try:
+        for row in rows:
+            while k < len(removed) and removed[k] > row:
+                _set_zero_row(dd_mat, removed[k] + 1)
+                k += 1
+            with nogil:
+                _cddlib_acquire()
+                has_certificate = _check_row(
+                    dd_mat, row + 1, row_check_type, certificate, &error
+                )
+                _cddlib_release()
+            if error != dd_NoError:
+                _raise_error(error)
+            if not has_certificate:
+                result.append(row)
+        return result
+    finally:
+        dd_FreeArow(certificate_size, certificate)
+        dd_FreeMatrix(dd_mat)
+
+# () -> Set[int]
+cdef _certificate_rows_map(
+    executor, Matrix mat, rows, removed, int row_check_type, Py_ssize_t num_chunks
+):
+    rows = sorted(rows, reverse=True)
+    chunks = [chunk for k in range(num_chunks) if (chunk := rows[k::num_chunks])]
+    return set().union(
+        *executor.map(
+            _certificate_rows_chunk,
+            _itertools.repeat(mat),
+            chunks,
+            _itertools.repeat(removed),
+            _itertools.repeat(row_check_type),
+        )
+    )
+
+# () -> tuple[int, Sequence[int]]
+cdef _implicit_linearity_candidates(dd_MatrixPtr dd_mat):
+    """As dd_FreeOfImplicitLinearity, returns 1 if there is no implicit
+    linearity, -1 if every row is an implicit linearity, 0 if there may be
+    some, along with the rows that still need to be checked in this case.
+    """
+    cdef dd_ErrorType error = dd_NoError
+    cdef dd_LPPtr lp = NULL
+    cdef int answer = -2
+    with nogil:
+        _cddlib_acquire()
+        if dd_mat.representation == dd_Generator:
+            lp = dd_CreateLP_V_ImplicitLinearity(dd_mat)
+        else:
+            lp = dd_CreateLP_H_ImplicitLinearity(dd_mat)
+        dd_LPSolve(lp, dd_choiceRedcheckAlgorithm, &error)
+        _cddlib_release()
+    try:
+        if error != dd_NoError:
+            _raise_error(error)
+        if lp.LPS == dd_Optimal:
+            if dd_Positive(lp.optvalue):
+                answer = 1
+            elif dd_Negative(lp.optvalue):
+                answer = -1
+            else:
+                answer = 0
+        return answer, [
+            i for i in range(dd_mat.rowsize) if not set_member(i + 1, lp.posset_extra)
+        ]
+    finally:
+        dd_FreeLPData(lp)
+
+# () -> Set[int]
+cdef _certificate_rows_resolve(
+    dd_MatrixPtr dd_mat, int row_check_type, candidates, certain
+):
+    """Complete the sequential redundancy check, as done by cddlib,
+    knowing that only *candidates* may be redundant,
+    and that all *certain* rows are redundant.
+    """
+    cdef dd_ErrorType error = dd_NoError
+    cdef dd_MatrixPtr dd_copy = NULL
+    cdef dd_Arow certificate = NULL
+    cdef dd_colrange certificate_size = dd_mat.colsize + (
+        1 if dd_mat.representation == dd_Generator else 0
+    )
+    cdef dd_boolean has_certificate = 0
+    cdef dd_rowrange row
+    result = set()
+    dd_copy = dd_CopyMatrix(dd_mat)
+    dd_InitializeArow(certificate_size, &certificate)
+    try:
+        for row in sorted(candidates, reverse=True):
+            if row not in certain:
+                with nogil:
+                    _cddlib_acquire()
+                    has_certificate = _check_row(
+                        dd_copy, row + 1, row_check_type, certificate, &error
+                    )
+                    _cddlib_release()
+                if error != dd_NoError:
+                    _raise_error(error)
+                if has_certificate:
+                    continue
+            result.add(row)
+            dd_MatrixRowRemove(&dd_copy, row + 1)
+        return result
+    finally:
+        dd_FreeArow(certificate_size, certificate)
+        dd_FreeMatrix(dd_copy)
+
+# () -> Set[int]
+cdef _certificate_rows_parallel(Matrix mat, int row_check_type, max_workers):
+    """As _certificate_rows, checking rows in parallel
+    in a pool of *max_workers* processes.
+    """
+    # cddlib keeps scratch buffers in static variables, so workers
+    # have to be processes rather than threads
+    cdef Py_ssize_t num_chunks = 4 * (max_workers or _os.cpu_count() or 1)
+    with _ProcessPoolExecutor(
+        max_workers, mp_context=_multiprocessing.get_context("spawn")
+    ) as executor:
+        if row_check_type == _ROW_CHECK_TYPE_IMPLICIT_LINEARITY:
+            # rows are checked independently, after one linear program
+            # that excludes most rows
+            answer, candidates = _implicit_linearity_candidates(mat.dd_mat)
+            if answer == -1:
+                return set(range(mat.dd_mat.rowsize))
+            elif answer != 0:
+                return set()
+            return _certificate_rows_map(
+                executor, mat, candidates, (), row_check_type, num_chunks
+            )
+        # cddlib checks rows in decreasing order, removing every redundant
+        # row it finds before checking the next one; a row that is not
+        # redundant for the full matrix remains so after removing rows,
+        # and a row that is redundant once all candidates beyond it are
+        # removed is so as well; the few remaining rows, typically rows
+        # that describe the same facet, are checked sequentially
+        candidates = _certificate_rows_map(
+            executor, mat, range(mat.dd_mat.rowsize), (), row_check_type, num_chunks
+        )
+        certain = _certificate_rows_map(
+            executor, mat, candidates, candidates, row_check_type, num_chunks
+        )
+    return _certificate_rows_resolve(mat.dd_mat, row_check_type, candidates, certain)
+
+cdef bint _parallel(max_workers) except -1:
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    return max_workers != 1
+
+# row of the H-representation dd_mat which is first hit by the ray from the
+# interior point intpt along direction, using tmp (size 4) as workspace;
+# zero if the ray hits no row, and -1 if it hits several rows at once
+cdef dd_rowrange _ray_shoot(
+    dd_MatrixPtr dd_mat, dd_Arow intpt, dd_Arow direction, dd_Arow tmp
+) noexcept nogil:
+    cdef dd_rowrange i
+    cdef dd_rowrange imin = 0
+    cdef bint tie = False
+    for i in range(1, dd_mat.rowsize + 1):
+        dd_InnerProduct(tmp[0], dd_mat.colsize, dd_mat.matrix[i - 1], intpt)
+        dd_InnerProduct(tmp[1], dd_mat.colsize, dd_mat.matrix[i - 1], direction)
+        if not dd_Negative(tmp[1]):
+            continue
+        # the row is hit at step -tmp[0] / tmp[1], minimize tmp[1] / tmp[0]
+        dd_div(tmp[2], tmp[1], tmp[0])
+        if imin == 0 or dd_Smaller(tmp[2], tmp[3]):
+            imin = i
+            tie = False
+            dd_set(tmp[3], tmp[2])
+        elif not dd_Larger(tmp[2], tmp[3]):
+            tie = True
+    return -1 if tie else imin
+
+# redundant rows of the H-representation dd_mat, without linearities,
+# found by shooting rays from the interior point intpt,
+# as in dd_RedundantRowsViaShooting
+# rows are declared nonredundant only if a ray hits them unambiguously,
+# other rows are checked by linear programming
+cdef dd_rowset _redundant_rows_via_shooting(
+    dd_MatrixPtr dd_mat, dd_Arow intpt, dd_ErrorType *error
+) noexcept nogil:
+    cdef dd_rowrange m = dd_mat.rowsize
+    cdef dd_colrange d = dd_mat.colsize
+    cdef dd_rowrange i, ired, k
+    cdef dd_rowrange irow = 0
+    cdef dd_colrange j
+    cdef dd_rowset redset = NULL
+    cdef dd_rowindex rowflag = NULL
+    cdef dd_MatrixPtr M1 = NULL
+    cdef dd_MatrixPtr Mw = NULL
+    cdef dd_Arow direction = NULL
+    cdef dd_Arow cvec = NULL
+    cdef dd_Arow tmp = NULL
+    cdef dd_boolean is_red
+    # rowflag[i] is -1 if row i is redundant, 0 if it is not yet checked,
+    # and k > 0 if it is nonredundant and stored in row k of M1
+    rowflag = <dd_rowindex>libc.stdlib.calloc(m + 1, sizeof(long))
+    if rowflag == NULL:
+        return NULL
+    M1 = dd_CreateMatrix(m, d)
+    M1.rowsize = 0
+    M1.representation = dd_Inequality
+    M1.numbtype = dd_mat.numbtype
+    set_initialize(&redset, m)
+    dd_InitializeArow(d, &direction)
+    dd_InitializeArow(d, &cvec)
+    dd_InitializeArow(4, &tmp)
+    # nonredundant rows hit along the coordinate axes
+    for j in range(1, d):
+        for k in range(2):
+            for i in range(d):
+                dd_set(direction[i], dd_purezero)
+            if k == 0:
+                dd_set(direction[j], dd_one)
+            else:
+                dd_neg(direction[j], dd_one)
+            ired = _ray_shoot(dd_mat, intpt, direction, tmp)
+            if ired > 0 and rowflag[ired] == 0:
+                irow += 1
+                rowflag[ired] = irow
+                dd_CopyArow(M1.matrix[irow - 1], dd_mat.matrix[ired - 1], d)
+    M1.rowsize = irow
+    # check every other row against the nonredundant rows found so far,
+    # in reverse order as in dd_RedundantRows
+    i = m
+    while i >= 1:
+        if rowflag[i] != 0:
+            i -= 1
+            continue
+        dd_CopyArow(M1.matrix[irow], dd_mat.matrix[i - 1], d)
+        M1.rowsize = irow + 1
+        is_red = dd_Redundant(M1, irow + 1, cvec, error)
+        if error[0] != dd_NoError:
+            break
+        if not is_red:
+            # cvec violates row i, so the ray towards it hits a new facet
+            for j in range(d):
+                dd_sub(direction[j], cvec[j], intpt[j])
+            ired = _ray_shoot(dd_mat, intpt, direction, tmp)
+            if ired > 0 and rowflag[ired] == 0:
+                irow += 1
+                rowflag[ired] = irow
+                dd_CopyArow(M1.matrix[irow - 1], dd_mat.matrix[ired - 1], d)
+                M1.rowsize = irow
+                continue
+            # ambiguous hit: check row i against all rows not known to be
+            # redundant, which are kept in Mw
+            if Mw == NULL:
+                Mw = dd_CopyMatrix(dd_mat)
+                for k in range(1, m + 1):
+                    if rowflag[k] < 0:
+                        _set_zero_row(Mw, k)
+            is_red = dd_Redundant(Mw, i, cvec, error)
+            if error[0] != dd_NoError:
+                break
+            if not is_red:
+                irow += 1
+                rowflag[i] = irow
+                M1.rowsize = irow
+                i -= 1
+                continue
+        rowflag[i] = -1
+        set_addelem(redset, i)
+        if Mw != NULL:
+            _set_zero_row(Mw, i)
+        M1.rowsize = irow
+        i -= 1
+    M1.rowsize = m
+    dd_FreeMatrix(M1)
+    dd_FreeMatrix(Mw)
+    dd_FreeArow(d, direction)
+    dd_FreeArow(d, cvec)
+    dd_FreeArow(4, tmp)
+    libc.stdlib.free(rowflag)
+    return redset
+
+# interior point of the H-representation dd_mat found by linear programming,
+# stored in intpt, returns whether it exists
+cdef bint _interior_point(
+    dd_MatrixPtr dd_mat, dd_Arow intpt, dd_ErrorType *error
+) noexcept nogil:
+    cdef dd_LPPtr lp0 = NULL
+    cdef dd_LPPtr lp = NULL
+    cdef bint found = False
+    lp0 = dd_Matrix2LP(dd_mat, error)
+    if lp0 == NULL or error[0] != dd_NoError:
+        dd_FreeLPData(lp0)
+        return False
+    lp = dd_MakeLPforInteriorFinding(lp0)
+    dd_FreeLPData(lp0)
+    dd_LPSolve(lp, dd_DualSimplex, error)
+    if error[0] == dd_NoError and dd_Positive(lp.optvalue):
+        dd_CopyArow(intpt, lp.sol, dd_mat.colsize)
+        found = True
+    dd_FreeLPData(lp)
+    return found
+
+cdef bint _redundancy_use_shooting(
+    dd_MatrixPtr dd_mat, method, interior_point, bint parallel=False
+) except -1:
+    cdef bint shooting
+    if method == "lp":
+        shooting = False
+    elif method == "shooting":
+        if dd_mat.representation != dd_Inequality:
+            raise ValueError("shooting method requires rep_type INEQUALITY")
+        if set_card(dd_mat.linset) > 0:
+            raise ValueError("shooting method requires an empty lin_set")
+        if parallel:
+            raise ValueError("max_workers requires the lp method")
+        shooting = True
+    elif method == "auto":
+        shooting = (
+            not parallel
+            and dd_mat.representation == dd_Inequality
+            and set_card(dd_mat.linset) == 0
+        )
+    else:
+        raise ValueError(
+            f"method must be 'lp', 'shooting', or 'auto', not {method!r}"
+        )
+    if interior_point is not None and not shooting:
+        raise ValueError("interior_point requires the shooting method")
+    return shooting
+
+# redundant rows by ray shooting, the caller must free the result
+cdef dd_rowset _redundant_rows_shooting(
+    dd_MatrixPtr dd_mat, interior_point
+) except NULL:
+    cdef dd_ErrorType error = dd_NoError
+    cdef dd_rowset row_set = NULL
+    cdef dd_colrange d = dd_mat.colsize
+    cdef dd_rowrange i
+    cdef dd_Arow intpt = NULL
+    cdef bint found = interior_point is not None
+    dd_InitializeArow(d + 1, &intpt)
+    try:
+        if found:
+            if len(interior_point) != d - 1:
+                raise ValueError(f"interior_point must have length {d - 1}")
+            dd_set(intpt[0], dd_one)
+            for i, value in enumerate(interior_point):
+                _set_mytype(intpt[i + 1], value)
+            for i in range(dd_mat.rowsize):
+                dd_InnerProduct(intpt[d], d, dd_mat.matrix[i], intpt)
+                if not dd_Positive(intpt[d]):
+                    raise ValueError(
+                        "interior_point must satisfy all inequalities strictly"
+                    )
+        with nogil:
+            _cddlib_acquire()
+            if not found:
+                found = _interior_point(dd_mat, intpt, &error)
+            if error == dd_NoError:
+                if found:
+                    row_set = _redundant_rows_via_shooting(dd_mat, intpt, &error)
+                else:
+                    row_set = dd_RedundantRows(dd_mat, &error)
+            _cddlib_release()
+        if row_set == NULL or error != dd_NoError:
+            set_free(row_set)
+            _raise_error(error)
+        return row_set
+    finally:
+        dd_FreeArow(d + 1, intpt)
+
+def redundant_rows(
+    mat: Matrix,
+    method: str = "lp",
+    interior_point: Optional[Sequence] = None,
+    max_workers: Optional[int] = 1,
+) -> Set[int]:
     """Returns all non-linearity rows that are
     redundant
     for *mat*.
 
+    The *method* is one of:
+
+    * ``"lp"``: check every row by solving a linear program.
+    * ``"shooting"``: shoot rays from an interior point to find
+      nonredundant rows, and check all other rows
+      against the nonredundant rows found so far.
+      Every redundant row then costs a linear program over
+      a much smaller system, which is much faster
+      when most rows are redundant.
+      This requires an H-representation with an empty
+      :attr:`~cdd.Matrix.lin_set`.
+      The interior point can be given as *interior_point*,
+      which must satisfy all inequalities strictly.
+      Otherwise, it is found by linear programming,
+      and if the polyhedron has no interior point,
+      the ``"lp"`` method is used instead.
+    * ``"auto"``: ``"shooting"`` if *mat* satisfies its requirements,
+      and *max_workers* is one, otherwise ``"lp"``.
+
+    In exact arithmetic, both methods find the same redundant rows.
+    In particular, of several rows that describe the same facet,
+    only the first one is kept.
+
+    If *max_workers* is not one, the ``"lp"`` method checks rows in parallel,
+    in a pool of *max_workers* processes
+    (as many as there are processors if ``None``).
+    Each worker process checks every row separately against its own copy
+    of *mat*.
+    Rows that are redundant for the full matrix are checked once more,
+    with all such rows beyond them removed,
+    and any rows that remain undecided
+    (typically rows that describe the same facet)
+    are resolved sequentially, exactly as cddlib does,
+    so the result is the same as with one worker.
+    As redundant rows are checked twice, and starting the pool takes some time,
+    this only pays off for large matrices on several processors.
+    Worker processes are started with the ``"spawn"`` method,
+    so on some platforms, the call must be guarded by
+    ``if __name__ == "__main__":`` in the main script.
+
     .. versionadded:: 3.0.0
+
+    .. versionchanged:: 3.0.2
+        Added the *method*, *interior_point*, and *max_workers* arguments.
     """
-    return _certificate_rows(mat.dd_mat, _ROW_CHECK_TYPE_REDUNDANT)
+    cdef dd_rowset row_set = NULL
+    cdef bint parallel = _parallel(max_workers)
+    if not _redundancy_use_shooting(mat.dd_mat, method, interior_point, parallel):
+        if parallel:
+            return _certificate_rows_parallel(
+                mat, _ROW_CHECK_TYPE_REDUNDANT, max_workers
+            )
+        return _certificate_rows(mat.dd_mat, _ROW_CHECK_TYPE_REDUNDANT)
+    row_set = _redundant_rows_shooting(mat.dd_mat, interior_point)
+    try:
+        return _get_set(row_set)
+    finally:
+        set_free(row_set)
 
-def s_redundant_rows(mat: Matrix) -> Set[int]:
+def s_redundant_rows(mat: Matrix, max_workers: Optional[int] = 1) -> Set[int]:
     """Returns all non-linearity rows that are
     strongly redundant
     for *mat*.
 
+    Rows are checked in parallel if *max_workers* is not one,
+    as in :func:`~cdd.redundant_rows`.
+
     .. versionadded:: 3.0.0
+
+    .. versionchanged:: 3.0.2
+        Added the *max_workers* argument.
     """
+    if _parallel(max_workers):
+        return _certificate_rows_parallel(
+            mat, _ROW_CHECK_TYPE_STRONGLY_REDUNDANT, max_workers
+        )
     return _certificate_rows(mat.dd_mat, _ROW_CHECK_TYPE_STRONGLY_REDUNDANT)
 
-def implicit_linearity_rows(mat: Matrix) -> Set[int]:
+def implicit_linearity_rows(
+    mat: Matrix, max_workers: Optional[int] = 1
+) -> Set[int]:
     """Returns all non-linearity rows that are
     implicitly linear
     for *mat*.
 
+    Rows are checked in parallel if *max_workers* is not one,
+    as in :func:`~cdd.redundant_rows`.
+
     .. versionadded:: 3.0.0
+
+    .. versionchanged:: 3.0.2
+        Added the *max_workers* argument.
     """
+    if _parallel(max_workers):
+        return _certificate_rows_parallel(
+            mat, _ROW_CHECK_TYPE_IMPLICIT_LINEARITY, max_workers
+        )
     return _certificate_rows(mat.dd_mat, _ROW_CHECK_TYPE_IMPLICIT_LINEARITY)
 
+def matrix_dedup(mat: Matrix) -> tuple[Set[int], Sequence[Optional[int]]]:
+    """Remove all rows that are a positive multiple of an earlier row,
+    all linearity rows that are a nonzero multiple
+    of an earlier linearity row,
+    and all non-linearity rows that are a nonzero multiple
+    of a linearity row.
+    Zero rows are kept.
+
+    Returns removed rows as a set of row indices,
+    along with a sequence of new row positions (``None`` for removed rows),
+    as :func:`~cdd.matrix_redundancy_remove` does.
+
+    Rows are compared by hashing them after scaling
+    their first nonzero entry to one,
+    so this takes linear time, and no linear programs are solved.
+    As all removed rows are redundant,
+    this is a cheap way to shrink a matrix
+    before :func:`~cdd.matrix_canonicalize`
+    or :func:`~cdd.matrix_redundancy_remove`,
+    see their *dedup* argument.
+
+    .. warning::
+        In floating point arithmetic, rows are only detected as duplicates
+        if they are exactly equal after scaling.
+
+    .. versionadded:: 3.0.2
+    """
+    cdef dd_MatrixPtr dd_mat = mat.dd_mat
+    cdef dd_Arow tmp = NULL
+    cdef dd_rowset rowset = NULL
+    cdef dd_rowrange i
+    dd_InitializeArow(dd_mat.colsize, &tmp)
+    try:
+        keys = [
+            _row_key(dd_mat.matrix[i], dd_mat.colsize, tmp)
+            for i in range(dd_mat.rowsize)
+        ]
+    finally:
+        dd_FreeArow(dd_mat.colsize, tmp)
+    lin_set = _get_set(dd_mat.linset)
+    removed = set()
+    # linearities first, as they also remove later non-linearity rows
+    lin_keys = set()
+    for i in sorted(lin_set):
+        if keys[i] is not None:
+            if keys[i][0] in lin_keys:
+                removed.add(i)
+            else:
+                lin_keys.add(keys[i][0])
+    ineq_keys = set()
+    for i in range(dd_mat.rowsize):
+        if keys[i] is not None and i not in lin_set:
+            if keys[i][0] in lin_keys or keys[i] in ineq_keys:
+                removed.add(i)
+            else:
+                ineq_keys.add(keys[i])
+    set_initialize(&rowset, dd_mat.rowsize)
+    try:
+        _set_set(rowset, removed)
+        return _matrix_rows_remove(&mat.dd_mat, rowset)
+    finally:
+        set_free(rowset)
+
+# () -> tuple[Sequence[Set[int]], Sequence[Optional[int]]]
+cdef _dedup_compose(dedup_result, row_sets, newpos):
+    """Translate *row_sets* and *newpos*, found on a matrix that was
+    deduplicated with *dedup_result*, back to the original rows.
+    """
+    removed, dedup_newpos = dedup_result
+    original = {pos: i for i, pos in enumerate(dedup_newpos) if pos is not None}
+    return (
+        [{original[i] for i in rows} for rows in row_sets],
+        [None if pos is None else newpos[pos] for pos in dedup_newpos],
+    )
+
 def matrix_canonicalize(
-    mat: Matrix
+    mat: Matrix, dedup: bool = False
 ) -> tuple[Set[int], Set[int], Sequence[Optional[int]]]:
     """Transform to canonical representation by recognizing all
     implicit linearities and all redundancies. These are returned
@@ -652,22 +2018,39 @@ def matrix_canonicalize(
     :func:`~cdd.matrix_canonicalize_linearity` followed by
     :func:`~cdd.matrix_redundancy_remove`.
 
+    If *dedup* is ``True``, then :func:`~cdd.matrix_dedup` is called first,
+    and the rows that it removes are returned as redundant rows.
+
     .. versionadded:: 1.0.3
 
     .. versionchanged:: 3.0.0
         Also return new row positions.
+
+    .. versionchanged:: 3.0.2
+        Added the *dedup* argument.
     """
+    if dedup:
+        dedup_result = matrix_dedup(mat)
+        impl_lin, red, positions = matrix_canonicalize(mat)
+        (impl_lin, red), positions = _dedup_compose(
+            dedup_result, [impl_lin, red], positions
+        )
+        return impl_lin, red | dedup_result[0], positions
     cdef dd_rowset impl_linset = NULL
     cdef dd_rowset redset = NULL
     cdef dd_rowindex newpos = NULL
     cdef dd_ErrorType error = dd_NoError
     cdef dd_rowrange original_rowsize = mat.dd_mat.rowsize
+    cdef dd_MatrixPtr *dd_mat = &mat.dd_mat
     cdef dd_boolean success
     if mat.dd_mat.representation == dd_Unspecified:
         raise ValueError("rep_type unspecified")
-    success = dd_MatrixCanonicalize(
-        &mat.dd_mat, &impl_linset, &redset, &newpos, &error
-    )
+    with nogil:
+        _cddlib_acquire()
+        success = dd_MatrixCanonicalize(
+            dd_mat, &impl_linset, &redset, &newpos, &error
+        )
+        _cddlib_release()
     try:
         if (
             not success
@@ -699,17 +2082,20 @@ cdef _matrix_canonicalize_something(dd_MatrixPtr *dd_mat, int something):
     cdef dd_rowindex newpos = NULL
     cdef dd_ErrorType error = dd_NoError
     cdef dd_rowrange original_rowsize = dd_mat[0].rowsize
-    cdef dd_boolean success
+    cdef dd_boolean success = 0
     if dd_mat[0].representation == dd_Unspecified:
         raise ValueError("rep_type unspecified")
-    if something == _CANONICALIZE_LINEARITY:
-        success = dd_MatrixCanonicalizeLinearity(
-            dd_mat, &rowset, &newpos, &error
-        )
-    elif something == _CANONICALIZE_REDUNDANCY:
-        success = dd_MatrixRedundancyRemove(
-            dd_mat, &rowset, &newpos, &error
-        )
+    with nogil:
+        _cddlib_acquire()
+        if something == _CANONICALIZE_LINEARITY:
+            success = dd_MatrixCanonicalizeLinearity(
+                dd_mat, &rowset, &newpos, &error
+            )
+        elif something == _CANONICALIZE_REDUNDANCY:
+            success = dd_MatrixRedundancyRemove(
+                dd_mat, &rowset, &newpos, &error
+            )
+        _cddlib_release()
     try:
         if (
             not success
@@ -744,8 +2130,32 @@ def matrix_canonicalize_linearity(
     """
     return _matrix_canonicalize_something(&mat.dd_mat, _CANONICALIZE_LINEARITY)
 
+# () -> tuple[Set[int], Sequence[Optional[int]]]
+cdef _matrix_rows_remove(dd_MatrixPtr *dd_mat, dd_rowset rowset):
+    cdef dd_rowindex newpos = NULL
+    cdef dd_rowrange original_rowsize = dd_mat[0].rowsize
+    try:
+        with nogil:
+            _cddlib_acquire()
+            dd_MatrixRowsRemove2(dd_mat, rowset, &newpos)
+            _cddlib_release()
+        if newpos == NULL:
+            raise MemoryError
+        return (
+            _get_set(rowset),
+            [
+                pos - 1 if (pos := newpos[i + 1]) > 0 else None
+                for i in range(original_rowsize)
+            ],
+        )
+    finally:
+        libc.stdlib.free(newpos)
+
 def matrix_redundancy_remove(
-    mat: Matrix
+    mat: Matrix,
+    method: str = "lp",
+    interior_point: Optional[Sequence] = None,
+    dedup: bool = False,
 ) -> tuple[Set[int], Sequence[Optional[int]]]:
     """Remove all redundant non-linearity rows
     (e.g. everything outside of :attr:`~cdd.Matrix.lin_set`).
@@ -753,9 +2163,56 @@ def matrix_redundancy_remove(
     Returns redundant rows as a set of row indices,
     along with a sequence of new row positions (``None`` for removed rows).
 
+    The *method* and *interior_point* are as in :func:`~cdd.redundant_rows`.
+    The ``"lp"`` method also removes duplicate rows first,
+    and sorts the remaining rows,
+    whilst the ``"shooting"`` method keeps the remaining rows in order.
+
+    If *dedup* is ``True``, then :func:`~cdd.matrix_dedup` is called first,
+    and the rows that it removes are returned as redundant rows.
+
     .. versionadded:: 3.0.0
+
+    .. versionchanged:: 3.0.2
+        Added the *method*, *interior_point*, and *dedup* arguments.
     """
-    return _matrix_canonicalize_something(&mat.dd_mat, _CANONICALIZE_REDUNDANCY)
+    cdef dd_rowset rowset = NULL
+    if dedup:
+        dedup_result = matrix_dedup(mat)
+        red, positions = matrix_redundancy_remove(mat, method, interior_point)
+        (red,), positions = _dedup_compose(dedup_result, [red], positions)
+        return red | dedup_result[0], positions
+    if not _redundancy_use_shooting(mat.dd_mat, method, interior_point):
+        return _matrix_canonicalize_something(
+            &mat.dd_mat, _CANONICALIZE_REDUNDANCY
+        )
+    rowset = _redundant_rows_shooting(mat.dd_mat, interior_point)
+    try:
+        return _matrix_rows_remove(&mat.dd_mat, rowset)
+    finally:
+        set_free(rowset)
+
+cdef int _ADJACENCY = 0
+cdef int _WEAK_ADJACENCY = 1
+
+cdef dd_SetFamilyPtr _matrix_adjacency_something(
+    dd_MatrixPtr dd_mat, int something
+) except NULL:
+    cdef dd_ErrorType error = dd_NoError
+    cdef dd_SetFamilyPtr dd_setfam = NULL
+    with nogil:
+        _cddlib_acquire()
+        if something == _ADJACENCY:
+            dd_setfam = dd_Matrix2Adjacency(dd_mat, &error)
+        elif something == _WEAK_ADJACENCY:
+            dd_setfam = dd_Matrix2WeakAdjacency(dd_mat, &error)
+        _cddlib_release()
+    if error != dd_NoError:
+        dd_FreeSetFamily(dd_setfam)
+        _raise_error(error)
+    if dd_setfam == NULL:
+        raise MemoryError
+    return dd_setfam
 
 def matrix_adjacency(mat: Matrix) -> Sequence[Set[int]]:
     """Generate the input adjacency of the polyhedron represented by *mat*.
@@ -778,9 +2235,7 @@ def matrix_adjacency(mat: Matrix) -> Sequence[Set[int]]:
 
     .. versionadded:: 3.0.0
     """
-    cdef dd_ErrorType error = dd_NoError
-    cdef dd_SetFamilyPtr dd_setfam = dd_Matrix2Adjacency(mat.dd_mat, &error)
-    return setfam_from_ptr_with_error(dd_setfam, error)
+    return setfam_from_ptr(_matrix_adjacency_something(mat.dd_mat, _ADJACENCY))
 
 def matrix_weak_adjacency(mat: Matrix) -> Sequence[Set[int]]:
     """Generate the weak input adjacency of the polyhedron represented by *mat*.
@@ -803,9 +2258,33 @@ def matrix_weak_adjacency(mat: Matrix) -> Sequence[Set[int]]:
 
     .. versionadded:: 3.0.0
     """
-    cdef dd_ErrorType error = dd_NoError
-    cdef dd_SetFamilyPtr dd_setfam = dd_Matrix2WeakAdjacency(mat.dd_mat, &error)
-    return setfam_from_ptr_with_error(dd_setfam, error)
+    return setfam_from_ptr(_matrix_adjacency_something(mat.dd_mat, _WEAK_ADJACENCY))
+
+
+def matrix_adjacency_bitset(mat: Matrix) -> npt.NDArray[np.uint64]:
+    """Like :func:`~cdd.matrix_adjacency`, but without creating Python sets.
+
+    Returns the sets packed as bits in a numpy array
+    of dtype ``uint64`` and of shape ``(n, (m + 63) // 64)``,
+    where *n* is the number of sets and *m* is the size of the ground set.
+    Bit ``j % 64`` of word ``j // 64`` of row ``i`` is set
+    if and only if ``j`` is in set ``i``.
+    The words are always stored in little-endian order, so
+    ``numpy.unpackbits(bits.view(numpy.uint8), axis=1, count=m, bitorder="little")``
+    gives the equivalent boolean matrix.
+
+    .. versionadded:: 3.0.2
+    """
+    return bitset_from_ptr(_matrix_adjacency_something(mat.dd_mat, _ADJACENCY))
+
+
+def matrix_weak_adjacency_bitset(mat: Matrix) -> npt.NDArray[np.uint64]:
+    """Like :func:`~cdd.matrix_weak_adjacency`, but without creating Python sets.
+    See :func:`~cdd.matrix_adjacency_bitset` for the output format.
+
+    .. versionadded:: 3.0.2
+    """
+    return bitset_from_ptr(_matrix_adjacency_something(mat.dd_mat, _WEAK_ADJACENCY))
 
 
 def matrix_rank(
@@ -816,6 +2295,7 @@ def matrix_rank(
 
     .. versionadded:: 3.0.0
     """
+    cdef dd_MatrixPtr dd_mat = NULL
     cdef set_type dd_ignored_rows = NULL
     cdef set_type dd_ignored_cols = NULL
     cdef set_type rowbasis = NULL
@@ -829,9 +2309,13 @@ def matrix_rank(
         try:
             if ignored_cols:
                 _set_set(dd_ignored_cols, ignored_cols)
-            rank = dd_MatrixRank(
-                mat.dd_mat, dd_ignored_rows, dd_ignored_cols, &rowbasis, &colbasis
-            )
+            dd_mat = mat.dd_mat
+            with nogil:
+                _cddlib_acquire()
+                rank = dd_MatrixRank(
+                    dd_mat, dd_ignored_rows, dd_ignored_cols, &rowbasis, &colbasis
+                )
+                _cddlib_release()
             try:
                 result = (_get_set(rowbasis), _get_set(colbasis), rank)
             finally:
@@ -847,9 +2331,11 @@ def matrix_rank(
 cdef class LinProg:
     """A linear program: a set of inequalities and an objective function to optimize."""
     cdef dd_LPPtr dd_lp
+    cdef bint obj_func_changed
     __annotations__ = dict(
         array=Sequence[Sequence[NumberType]],
         dual_solution=Sequence[tuple[int, NumberType]],
+        obj_func=Sequence[NumberType],
         obj_type=LPObjType,
         obj_value=NumberType,
         primal_solution=Sequence[NumberType],
@@ -876,12 +2362,40 @@ cdef class LinProg:
         return _get_array_from_matrix(self.dd_lp.A, shape)
 
     @property
-    def obj_type(self):
-        """Whether we are minimizing or maximizing."""
-        return LPObjType(self.dd_lp.objective)
+    def obj_func(self):
+        r"""The objective function :math:`(\gamma, c)`,
+        i.e. the last row of :attr:`~cdd.LinProg.array`.
 
-    @obj_type.setter
-    def obj_type(self, dd_LPObjectiveType value):
+        The objective function can be replaced in place.
+        If the linear program was solved before,
+        the next call to :func:`~cdd.linprog_solve`
+        then starts from the previous basis, rather than from scratch.
+        This is much faster when the same constraints are optimized
+        over many objective functions that are close to each other.
+
+        .. versionadded:: 3.0.2
+        """
+        cdef dd_colrange colindex
+        return [_get_mytype(self.dd_lp.A[self.dd_lp.objrow - 1][colindex])
+                for colindex in range(self.dd_lp.d)]
+
+    @obj_func.setter
+    def obj_func(self, obj_func):
+        cdef Py_ssize_t colindex
+        if len(obj_func) != self.dd_lp.d:
+            raise ValueError(
+                "objective function does not match linear program column size")
+        for colindex, value in enumerate(obj_func):
+            _set_mytype(self.dd_lp.A[self.dd_lp.objrow - 1][colindex], value)
+        self.obj_func_changed = True
+
+    @property
+    def obj_type(self):
+        """Whether we are minimizing or maximizing."""
+        return LPObjType(self.dd_lp.objective)
+
+    @obj_type.setter
+    def obj_type(self, dd_LPObjectiveType value):
         self.dd_lp.objective = value
 
     @property
@@ -923,13 +2437,12 @@ cdef class LinProg:
         ]
 
     def __str__(self):
-        cdef libc.stdio.FILE *pfile
-        # open file for writing the data
-        pfile = _tmpfile()
+        cdef _StrStream stream
+        _str_stream_open(&stream)
         # note: if lp has an error, then exception is raised
         # so pass dd_NoError
-        dd_WriteLPResult(pfile, self.dd_lp, dd_NoError)
-        return _tmpread(pfile).rstrip('\n')
+        dd_WriteLPResult(stream.pfile, self.dd_lp, dd_NoError)
+        return _str_stream_read(&stream).rstrip('\n')
 
     def __init__(self):
         raise TypeError("This class cannot be instantiated directly.")
@@ -938,8 +2451,18 @@ cdef class LinProg:
         dd_FreeLPData(self.dd_lp)
         self.dd_lp = NULL
 
-    def __reduce__(self):
-        return linprog_from_array, (self.array, self.obj_type)
+    def __reduce_ex__(self, protocol):
+        return (
+            _linprog_from_pickle,
+            (
+                _pickle_buffer(
+                    _pack_matrix(self.dd_lp.A, self.dd_lp.m, self.dd_lp.d), protocol
+                ),
+                self.dd_lp.m,
+                self.dd_lp.d,
+                self.obj_type,
+            ),
+        )
 
 
 cdef linprog_from_ptr(dd_LPPtr dd_lp):
@@ -950,6 +2473,15 @@ cdef linprog_from_ptr(dd_LPPtr dd_lp):
     return lp
 
 
+def _linprog_from_pickle(data, numrows, numcols, obj_type):
+    # reconstruct a linear program pickled by LinProg.__reduce_ex__
+    cdef LinProg lp = linprog_from_ptr(
+        dd_CreateLPData(obj_type, NUMBER_TYPE, numrows, numcols)
+    )
+    _unpack_matrix(lp.dd_lp.A, numrows, numcols, data)
+    return lp
+
+
 def linprog_from_matrix(mat: Matrix) -> LinProg:
     """Convert *mat* into a linear program.
     Note that *mat* must have the H-representation,
@@ -968,46 +2500,422 @@ def linprog_from_matrix(mat: Matrix) -> LinProg:
 
 
 def linprog_from_array(
-    array: Sequence[Sequence[SupportsNumberType]], obj_type: LPObjType
+    array: Sequence[Sequence[SupportsNumberType]],
+    obj_type: LPObjType,
+    max_denominator: Optional[int] = None,
+    tolerance: Optional[float] = None,
+    scale_rows: bool = False,
 ) -> LinProg:
     """Construct a linear program from *array*.
 
     See :attr:`cdd.LinProg.array` for an explanation of how *array* must be laid out.
-    This function also accepts 2-dimensional numpy arrays.
+    This function also accepts 2-dimensional numpy arrays,
+    with the same fast path as :func:`~cdd.matrix_from_array`.
+    The *max_denominator*, *tolerance*, and *scale_rows* parameters
+    are as for :func:`~cdd.matrix_from_array`,
+    except that *scale_rows* leaves the objective function unchanged.
 
     .. versionadded:: 3.0.0
+
+    .. versionchanged:: 3.0.2
+
+        Fast path for C-contiguous numpy arrays,
+        and the *max_denominator*, *tolerance*, and *scale_rows* parameters.
     """
     if obj_type != dd_LPmax and obj_type != dd_LPmin:
         raise ValueError("obj_type must be MIN or MAX")
     cdef _Shape shape = _array_shape(array)
+    cdef bint rationalize = max_denominator is not None or tolerance is not None
+    cdef _Rationalize options
+    if rationalize:
+        options = _rationalize_options(max_denominator, tolerance)
     cdef dd_LPPtr dd_lp = dd_CreateLPData(
         obj_type, NUMBER_TYPE, shape.numrows, shape.numcols
     )
     if dd_lp == NULL:
         raise MemoryError
     try:
-        _set_matrix_from_array(dd_lp.A, shape, array)
+        if rationalize:
+            _set_matrix_from_array_rationalized(
+                dd_lp.A, shape, array, &options, max_denominator
+            )
+        else:
+            _set_matrix_from_array(dd_lp.A, shape, array)
+        if scale_rows and shape.numrows > 0:
+            _normalize_rows(dd_lp.A, shape.numrows - 1, shape.numcols, False)
     except:  # noqa: E722
         dd_FreeLPData(dd_lp)
         raise
     return linprog_from_ptr(dd_lp)
 
 
+def linprog_to_numpy(
+    lp: LinProg, out: Optional[NumberArray] = None
+) -> "NumberArray":
+    """Copy :attr:`~cdd.LinProg.array` of *lp* into a numpy array,
+    and return that array.
+    See :func:`~cdd.matrix_to_numpy` for details.
+
+    .. versionadded:: 3.0.2
+    """
+    cdef _Shape shape = _Shape(lp.dd_lp.m, lp.dd_lp.d)
+    return _export_matrix(lp.dd_lp.A, shape, out)
+
+
+def linprog_primal_solution_to_numpy(
+    lp: LinProg, out: Optional[NumberArray] = None
+) -> "NumberArray":
+    """Copy :attr:`~cdd.LinProg.primal_solution` of *lp* into a numpy array,
+    and return that array.
+    See :func:`~cdd.matrix_to_numpy` for details.
+
+    .. versionadded:: 3.0.2
+    """
+    # first element of sol is the constant term, so skip it
+    return _export_arow(lp.dd_lp.sol + 1, lp.dd_lp.d - 1, out)
+
+
+def linprog_dual_solution_to_numpy(
+    lp: LinProg, out: Optional[NumberArray] = None
+) -> "NumberArray":
+    """Copy :attr:`~cdd.LinProg.dual_solution` of *lp* into a numpy array,
+    and return that array.
+    Unlike :attr:`~cdd.LinProg.dual_solution`,
+    the array has one element for every constraint
+    (i.e. every row of :attr:`~cdd.LinProg.array` except the last one),
+    with zero for the basic components.
+    See :func:`~cdd.matrix_to_numpy` for details.
+
+    .. versionadded:: 3.0.2
+    """
+    cdef Py_buffer view
+    cdef dd_colrange colindex
+    cdef dd_rowrange rowindex
+    cdef dd_Arow zero = NULL
+    out = _get_export_buffer(&view, out, (lp.dd_lp.m - 1,))
+    dd_InitializeArow(1, &zero)
+    try:
+        for rowindex in range(lp.dd_lp.m - 1):
+            _get_mytype_to_item(zero[0], <char*>view.buf + rowindex * view.strides[0])
+        for colindex in range(1, lp.dd_lp.d):
+            rowindex = lp.dd_lp.nbindex[colindex + 1] - 1
+            if 0 <= rowindex < lp.dd_lp.m - 1:
+                _get_mytype_to_item(
+                    lp.dd_lp.dsol[colindex],
+                    <char*>view.buf + rowindex * view.strides[0],
+                )
+    finally:
+        dd_FreeArow(1, zero)
+        cpython.buffer.PyBuffer_Release(&view)
+    return out
+
+
+# negate the objective row of lp, to turn minimization into maximization
+cdef void _linprog_negate_obj_func(dd_LPPtr lp) noexcept nogil:
+    cdef dd_colrange j
+    for j in range(lp.d):
+        dd_neg(lp.A[lp.objrow - 1][j], lp.A[lp.objrow - 1][j])
+
+# run the primal simplex method on lp, starting from the basis of
+# a previous solve; this basis is still primal feasible after the objective
+# function has changed, so typically only few pivots are needed
+# returns False if lp has no such basis, or if too many pivots are
+# needed, in which case lp must be solved from scratch
+cdef bint _linprog_warm_solve(dd_LPPtr lp) noexcept nogil:
+    cdef dd_rowrange i, r
+    cdef dd_colrange j, s
+    cdef long pivots = 0
+    cdef long maxpivots = 100 * lp.d
+    cdef dd_rowindex bflag = NULL
+    # val[0]: tableau entry, val[1]: right hand side, val[2]: ratio, val[3]: best
+    cdef dd_Arow val = NULL
+    if lp.LPS != dd_Optimal and lp.LPS != dd_DualInconsistent:
+        return False
+    if lp.nbindex[lp.rhscol] != 0:
+        return False
+    for j in range(1, lp.d + 1):
+        if j != lp.rhscol and not 1 <= lp.nbindex[j] <= lp.m:
+            return False
+    bflag = <dd_rowindex>libc.stdlib.calloc(lp.m + 1, sizeof(long))
+    if bflag == NULL:
+        return False
+    dd_InitializeArow(4, &val)
+    if lp.objective == dd_LPmin:
+        _linprog_negate_obj_func(lp)
+    try:
+        # as dd_ResetTableau: -1 for basic rows, column index for nonbasic rows
+        for i in range(1, lp.m + 1):
+            bflag[i] = -1
+        bflag[lp.objrow] = 0
+        for j in range(1, lp.d + 1):
+            if lp.nbindex[j] > 0:
+                bflag[lp.nbindex[j]] = j
+        for i in range(1, lp.m + 1):
+            if bflag[i] == -1 and i != lp.objrow:
+                dd_TableauEntry(&val[0], lp.m, lp.d, lp.A, lp.B, i, lp.rhscol)
+                if dd_Negative(val[0]):
+                    return False
+        while True:
+            # entering column: largest reduced cost, equalities stay nonbasic
+            s = 0
+            for j in range(1, lp.d + 1):
+                if j != lp.rhscol and not set_member(lp.nbindex[j], lp.equalityset):
+                    dd_TableauEntry(&val[0], lp.m, lp.d, lp.A, lp.B, lp.objrow, j)
+                    if dd_Positive(val[0]) and (s == 0 or dd_Larger(val[0], val[3])):
+                        s = j
+                        dd_set(val[3], val[0])
+            if s == 0:
+                lp.LPS = dd_Optimal
+                break
+            # leaving row: minimum ratio test
+            r = 0
+            for i in range(1, lp.m + 1):
+                if bflag[i] == -1 and i != lp.objrow:
+                    dd_TableauEntry(&val[0], lp.m, lp.d, lp.A, lp.B, i, s)
+                    if dd_Negative(val[0]):
+                        dd_TableauEntry(&val[1], lp.m, lp.d, lp.A, lp.B, i, lp.rhscol)
+                        dd_div(val[2], val[1], val[0])
+                        dd_neg(val[2], val[2])
+                        if r == 0 or dd_Smaller(val[2], val[3]):
+                            r = i
+                            dd_set(val[3], val[2])
+            if r == 0:
+                lp.LPS = dd_DualInconsistent
+                lp.se = s
+                break
+            if pivots >= maxpivots:
+                return False
+            # as dd_GaussianColumnPivot2
+            dd_GaussianColumnPivot(lp.m, lp.d, lp.A, lp.B, r, s)
+            bflag[lp.nbindex[s]] = -1
+            bflag[r] = s
+            lp.nbindex[s] = r
+            pivots += 1
+        # as dd_SetSolutions
+        lp.re = 0
+        for j in range(1, lp.d + 1):
+            if lp.LPS == dd_Optimal:
+                dd_set(lp.sol[j - 1], lp.B[j - 1][lp.rhscol - 1])
+            else:
+                dd_set(lp.sol[j - 1], lp.B[j - 1][lp.se - 1])
+            dd_TableauEntry(&val[0], lp.m, lp.d, lp.A, lp.B, lp.objrow, j)
+            dd_neg(lp.dsol[j - 1], val[0])
+        if lp.LPS == dd_Optimal:
+            dd_TableauEntry(
+                &lp.optvalue, lp.m, lp.d, lp.A, lp.B, lp.objrow, lp.rhscol
+            )
+        for i in range(5):
+            lp.pivots[i] = 0
+        lp.pivots[2] = pivots
+        lp.total_pivots = pivots
+        if lp.objective == dd_LPmin:
+            if lp.LPS == dd_Optimal:
+                dd_neg(lp.optvalue, lp.optvalue)
+            for j in range(lp.d):
+                dd_neg(lp.dsol[j], lp.dsol[j])
+        return True
+    finally:
+        if lp.objective == dd_LPmin:
+            _linprog_negate_obj_func(lp)
+        dd_FreeArow(4, val)
+        libc.stdlib.free(bflag)
+
+
 def linprog_solve(
     lp: LinProg, solver: LPSolverType = LPSolverType.DUAL_SIMPLEX
 ) -> None:
-    """Solve the linear program *lp* using *solver*."""
+    """Solve the linear program *lp* using *solver*.
+
+    If the objective function of *lp* was replaced through
+    :attr:`~cdd.LinProg.obj_func` since it was last solved,
+    then the primal simplex method is run from the previous basis instead,
+    which is still feasible.
+    Only when there is no such basis, *lp* is solved from scratch using *solver*.
+
+    .. versionchanged:: 3.0.2
+
+        Warm start after changing the objective function.
+    """
     cdef dd_ErrorType error = dd_NoError
-    dd_LPSolve(lp.dd_lp, solver, &error)
+    cdef dd_LPPtr dd_lp = lp.dd_lp
+    cdef dd_LPSolverType dd_solver = solver
+    cdef bint warm_start = lp.obj_func_changed
+    cdef bint solved = False
+    lp.obj_func_changed = False
+    with nogil:
+        _cddlib_acquire()
+        if warm_start:
+            solved = _linprog_warm_solve(dd_lp)
+            if solved:
+                dd_lp.solver = dd_solver
+        if not solved:
+            dd_LPSolve(dd_lp, dd_solver, &error)
+        _cddlib_release()
     if error != dd_NoError:
         _raise_error(error)
 
 
+def linprog_solve_many(
+    arrays: Iterable[Sequence[Sequence[SupportsNumberType]]],
+    obj_type: LPObjType,
+    solver: LPSolverType = LPSolverType.DUAL_SIMPLEX,
+) -> tuple[npt.NDArray[np.int64], NumberArray, NumberArray]:
+    """Construct and solve a linear program for every array in *arrays*,
+    using *obj_type* and *solver*,
+    and return the statuses, the optimal values, and the primal solutions,
+    stacked into three numpy arrays.
+
+    This gives the same results as calling
+    :func:`~cdd.linprog_from_array` and :func:`~cdd.linprog_solve`
+    for every array, but it avoids creating a :class:`~cdd.LinProg`,
+    enums, and lists, for every linear program.
+    *arrays* can be a 3-dimensional numpy array,
+    or a sequence of 2-dimensional arrays, each laid out
+    as explained in :attr:`~cdd.LinProg.array`.
+    Their number of rows can differ,
+    but all of them must have the same number of columns.
+    A C-contiguous 3-dimensional array
+    (of dtype float64 for :mod:`cdd`, or int64 for :mod:`cdd.gmp`)
+    is copied directly, as in :func:`~cdd.matrix_from_array`.
+
+    The statuses are returned as an integer array,
+    whose elements can be compared to :class:`~cdd.LPStatusType` members.
+    The primal solutions are returned as an array with one row per linear program.
+
+    .. note::
+
+        Every linear program is solved with the GIL released.
+        However, as explained in the thread safety section,
+        cddlib cannot solve linear programs in parallel,
+        so there is no point in splitting *arrays*
+        over multiple threads.
+
+    .. versionadded:: 3.0.2
+    """
+    import numpy
+    if obj_type != dd_LPmax and obj_type != dd_LPmin:
+        raise ValueError("obj_type must be MIN or MAX")
+    cdef dd_LPSolverType dd_solver = solver
+    cdef dd_ErrorType error = dd_NoError
+    cdef Py_ssize_t i
+    cdef Py_ssize_t num_lps
+    cdef dd_colrange j
+    cdef dd_colrange numcols
+    cdef _Shape shape = _Shape(0, 0)
+    cdef Py_buffer view
+    cdef Py_buffer obj_view
+    cdef Py_buffer primal_view
+    cdef bint has_buffer
+    cdef dd_LPPtr dd_lp
+    cdef char *row
+    # fast path for 3-dimensional C-contiguous buffers, such as numpy arrays
+    has_buffer = _get_import_buffer(&view, arrays, 3)
+    try:
+        if has_buffer:
+            num_lps = view.shape[0]
+            shape = _Shape(<dd_rowrange>view.shape[1], <dd_colrange>view.shape[2])
+            if shape.numrows != view.shape[1] or shape.numcols != view.shape[2]:
+                raise ValueError("array too large")
+        else:
+            if getattr(arrays, "ndim", None) == 3:
+                shape.numcols = arrays.shape[2]
+            arrays = list(arrays)
+            num_lps = len(arrays)
+            if num_lps > 0:
+                shape = _array_shape(arrays[0])
+        numcols = shape.numcols
+        statuses = numpy.empty(num_lps, dtype=numpy.int64)
+        obj_values = _get_export_buffer(&obj_view, None, (num_lps,))
+        try:
+            # first element of sol is the constant term, so skip it
+            primal_solutions = _get_export_buffer(
+                &primal_view, None, (num_lps, max(numcols - 1, 0))
+            )
+            try:
+                # create, solve, and free every linear program in turn,
+                # so memory is recycled whilst it is still in the cache
+                for i in range(num_lps):
+                    if not has_buffer:
+                        shape = _array_shape(arrays[i])
+                        if shape.numcols != numcols:
+                            raise ValueError(
+                                "all arrays must have the same number of columns"
+                            )
+                    dd_lp = dd_CreateLPData(
+                        obj_type, NUMBER_TYPE, shape.numrows, shape.numcols
+                    )
+                    if dd_lp == NULL:
+                        raise MemoryError
+                    try:
+                        if has_buffer:
+                            _set_matrix_from_data(
+                                dd_lp.A,
+                                shape.numrows,
+                                shape.numcols,
+                                <const char*>view.buf + i * view.strides[0],
+                            )
+                        else:
+                            _set_matrix_from_array(dd_lp.A, shape, arrays[i])
+                        with nogil:
+                            _cddlib_acquire()
+                            dd_LPSolve(dd_lp, dd_solver, &error)
+                            _cddlib_release()
+                        if error != dd_NoError:
+                            _raise_error(error)
+                        statuses[i] = dd_lp.LPS
+                        _get_mytype_to_item(
+                            dd_lp.optvalue,
+                            <char*>obj_view.buf + i * obj_view.strides[0],
+                        )
+                        row = <char*>primal_view.buf + i * primal_view.strides[0]
+                        for j in range(numcols - 1):
+                            _get_mytype_to_item(
+                                dd_lp.sol[j + 1], row + j * primal_view.strides[1]
+                            )
+                    finally:
+                        dd_FreeLPData(dd_lp)
+            finally:
+                cpython.buffer.PyBuffer_Release(&primal_view)
+        finally:
+            cpython.buffer.PyBuffer_Release(&obj_view)
+    finally:
+        if has_buffer:
+            cpython.buffer.PyBuffer_Release(&view)
+    return statuses, obj_values, primal_solutions
+
+
 cdef class Polyhedron:
-    """Representation of a polyhedron."""
+    """Representation of a polyhedron.
+
+    The :attr:`~cdd.Polyhedron.generators`, :attr:`~cdd.Polyhedron.inequalities`,
+    adjacency, and incidence properties are computed on first access,
+    and cached for later accesses as immutable Python objects.
+    Use :func:`~cdd.polyhedron_clear_cache` to release the cached results.
+
+    .. versionchanged:: 3.0.2
+
+        Added cached properties.
+    """
     cdef dd_PolyhedraPtr dd_poly
+    cdef tuple _generators
+    cdef frozenset _generators_lin_set
+    cdef tuple _inequalities
+    cdef frozenset _inequalities_lin_set
+    cdef tuple _adjacency
+    cdef tuple _input_adjacency
+    cdef tuple _incidence
+    cdef tuple _input_incidence
     __annotations__ = dict(
+        adjacency=Sequence[Set[int]],
+        generators=Sequence[Sequence[NumberType]],
+        generators_lin_set=Set[int],
+        incidence=Sequence[Set[int]],
+        inequalities=Sequence[Sequence[NumberType]],
+        inequalities_lin_set=Set[int],
+        input_adjacency=Sequence[Set[int]],
+        input_incidence=Sequence[Set[int]],
         rep_type=RepType,
+        row_order=RowOrderType,
     )
 
     @property
@@ -1015,11 +2923,125 @@ cdef class Polyhedron:
         """Representation type of the input."""
         return RepType(self.dd_poly.representation)
 
+    @property
+    def row_order(self):
+        """Row order used by the double description method,
+        for instance the order chosen by
+        :func:`~cdd.polyhedron_from_matrix` with ``"auto"``.
+
+        .. versionadded:: 3.0.2
+        """
+        return RowOrderType(self.dd_poly.child.HalfspaceOrder)
+
+    @property
+    def generators(self):
+        """Cached V-representation of all the generators,
+        as the array of :func:`~cdd.copy_generators`,
+        but as a tuple of tuples.
+        Use :func:`~cdd.copy_generators` for a matrix that can be modified.
+
+        .. versionadded:: 3.0.2
+        """
+        if self._generators is None:
+            self._cache_generators()
+        return self._generators
+
+    @property
+    def generators_lin_set(self):
+        """Cached rows of linearity of :attr:`~cdd.Polyhedron.generators`,
+        as a frozen set.
+
+        .. versionadded:: 3.0.2
+        """
+        if self._generators_lin_set is None:
+            self._cache_generators()
+        return self._generators_lin_set
+
+    @property
+    def inequalities(self):
+        """Cached H-representation of all the inequalities,
+        as the array of :func:`~cdd.copy_inequalities`,
+        but as a tuple of tuples.
+        Use :func:`~cdd.copy_inequalities` for a matrix that can be modified.
+
+        .. versionadded:: 3.0.2
+        """
+        if self._inequalities is None:
+            self._cache_inequalities()
+        return self._inequalities
+
+    @property
+    def inequalities_lin_set(self):
+        """Cached rows of linearity of :attr:`~cdd.Polyhedron.inequalities`,
+        as a frozen set.
+
+        .. versionadded:: 3.0.2
+        """
+        if self._inequalities_lin_set is None:
+            self._cache_inequalities()
+        return self._inequalities_lin_set
+
+    cdef _cache_generators(self):
+        cdef Matrix mat = copy_generators(self)
+        self._generators = _frozen_array(mat)
+        self._generators_lin_set = frozenset(mat.lin_set)
+
+    cdef _cache_inequalities(self):
+        cdef Matrix mat = copy_inequalities(self)
+        self._inequalities = _frozen_array(mat)
+        self._inequalities_lin_set = frozenset(mat.lin_set)
+
+    @property
+    def adjacency(self):
+        """Cached adjacencies, as returned by :func:`~cdd.copy_adjacency`,
+        but as a tuple of frozen sets.
+
+        .. versionadded:: 3.0.2
+        """
+        if self._adjacency is None:
+            self._adjacency = _frozen_setfam(copy_adjacency(self))
+        return self._adjacency
+
+    @property
+    def input_adjacency(self):
+        """Cached input adjacencies,
+        as returned by :func:`~cdd.copy_input_adjacency`,
+        but as a tuple of frozen sets.
+
+        .. versionadded:: 3.0.2
+        """
+        if self._input_adjacency is None:
+            self._input_adjacency = _frozen_setfam(copy_input_adjacency(self))
+        return self._input_adjacency
+
+    @property
+    def incidence(self):
+        """Cached incidences, as returned by :func:`~cdd.copy_incidence`,
+        but as a tuple of frozen sets.
+
+        .. versionadded:: 3.0.2
+        """
+        if self._incidence is None:
+            self._incidence = _frozen_setfam(copy_incidence(self))
+        return self._incidence
+
+    @property
+    def input_incidence(self):
+        """Cached input incidences,
+        as returned by :func:`~cdd.copy_input_incidence`,
+        but as a tuple of frozen sets.
+
+        .. versionadded:: 3.0.2
+        """
+        if self._input_incidence is None:
+            self._input_incidence = _frozen_setfam(copy_input_incidence(self))
+        return self._input_incidence
+
     def __str__(self):
-        cdef libc.stdio.FILE *pfile
-        pfile = _tmpfile()
-        dd_WritePolyFile(pfile, self.dd_poly)
-        return _tmpread(pfile).rstrip('\n')
+        cdef _StrStream stream
+        _str_stream_open(&stream)
+        dd_WritePolyFile(stream.pfile, self.dd_poly)
+        return _str_stream_read(&stream).rstrip('\n')
 
     def __init__(self):
         raise TypeError("This class cannot be instantiated directly.")
@@ -1028,6 +3050,18 @@ cdef class Polyhedron:
         dd_FreePolyhedra(self.dd_poly)
         self.dd_poly = NULL
 
+cdef tuple _frozen_setfam(setfam):
+    return tuple(frozenset(set_) for set_ in setfam)
+
+cdef tuple _frozen_array(Matrix mat):
+    cdef dd_rowrange i
+    cdef dd_colrange j
+    cdef mytype **pp = mat.dd_mat.matrix
+    return tuple([
+        tuple([_get_mytype(pp[i][j]) for j in range(mat.dd_mat.colsize)])
+        for i in range(mat.dd_mat.rowsize)
+    ])
+
 cdef polyhedron_from_ptr(dd_PolyhedraPtr dd_poly):
     if dd_poly == NULL:
         raise MemoryError  # assume malloc failed
@@ -1036,15 +3070,402 @@ cdef polyhedron_from_ptr(dd_PolyhedraPtr dd_poly):
     return poly
 
 
+# progress checks of a double description run, before each row is added:
+# always for signals such as Ctrl-C, and if the callback and time_limit
+# arguments are given, also for those
+cdef class _Monitor:
+    cdef object callback
+    cdef double time_limit
+    cdef bint progress
+    cdef double start
+    cdef object exc
+
+    def __cinit__(self, callback=None, time_limit=None):
+        if time_limit is not None and time_limit < 0:
+            raise ValueError("time_limit must be non-negative")
+        self.callback = callback
+        self.time_limit = float("inf") if time_limit is None else time_limit
+        self.progress = callback is not None or time_limit is not None
+        self.start = _time.monotonic()
+        self.exc = None
+
+    cdef int check(self, long iteration, long num_rows, long num_rays) except -1:
+        cpython.exc.PyErr_CheckSignals()
+        if not self.progress:
+            return 0
+        elapsed = _time.monotonic() - self.start
+        if self.callback is not None:
+            self.callback(iteration, num_rows, num_rays, elapsed)
+        # not strict, so a time limit of zero always stops, also if the
+        # clock did not advance yet, as happens on platforms with a coarse
+        # monotonic clock
+        if elapsed >= self.time_limit:
+            raise TimeLimitError(
+                iteration, num_rows, num_rays, elapsed, self.time_limit
+            )
+        return 0
+
+    def raise_exc(self):
+        if self.exc is not None:
+            exc = self.exc
+            self.exc = None
+            raise exc
+
+
+# check the progress of cone for monitor (a _Monitor);
+# returns whether to continue; if not, the exception is stored in monitor
+cdef bint _monitor_check(void *monitor, dd_ConePtr cone) noexcept nogil:
+    with gil:
+        try:
+            (<_Monitor>monitor).check(
+                cone.Iteration - 1, cone.m, cone.RayCount
+            )
+        except BaseException as exc:
+            (<_Monitor>monitor).exc = exc
+            return False
+    return True
+
+
+# polyhedron of dd_mat, with its cone loaded and its initial rays found,
+# as dd_DDMatrix2Poly2 does before the iterations of dd_DDMain,
+# but with rseed as seed for the random row permutation
+cdef dd_PolyhedraPtr _dd_start(
+    dd_MatrixPtr dd_mat,
+    dd_RowOrderType row_order,
+    unsigned int rseed,
+    dd_ErrorType *error,
+) noexcept nogil:
+    cdef dd_rowrange i
+    cdef dd_colrange j
+    cdef dd_boolean found = False
+    cdef dd_ConePtr cone
+    cdef dd_PolyhedraPtr dd_poly = dd_CreatePolyhedraData(
+        dd_mat.rowsize, dd_mat.colsize
+    )
+    if dd_poly == NULL:
+        return NULL
+    dd_poly.representation = dd_mat.representation
+    dd_poly.homogeneous = True
+    for i in range(dd_mat.rowsize):
+        if set_member(i + 1, dd_mat.linset):
+            dd_poly.EqualityIndex[i + 1] = 1
+        for j in range(dd_mat.colsize):
+            dd_set(dd_poly.A[i][j], dd_mat.matrix[i][j])
+        if dd_Nonzero(dd_mat.matrix[i][0]):
+            dd_poly.homogeneous = False
+    cone = dd_ConeDataLoad(dd_poly)
+    cone.HalfspaceOrder = row_order
+    cone.rseed = rseed
+    dd_DDInit(cone)
+    if dd_poly.representation == dd_Generator and dd_poly.m <= 0:
+        error[0] = dd_EmptyVrepresentation
+        cone.Error = error[0]
+        return dd_poly
+    dd_CheckEmptiness(dd_poly, error)
+    if cone.CompStatus != dd_AllFound:
+        dd_FindInitialRays(cone, &found)
+        if found:
+            dd_InitialDataSetup(cone)
+    return dd_poly
+
+
+# dd_FreePolyhedra, also for a polyhedron whose double description method
+# stopped early: dd_FreeDDMemory0 does not free the edges that are stored
+# for the iterations that did not run yet
+cdef void _dd_free(dd_PolyhedraPtr dd_poly) noexcept nogil:
+    cdef dd_ConePtr cone = dd_poly.child if dd_poly != NULL else NULL
+    cdef dd_AdjacencyPtr edge
+    cdef dd_AdjacencyPtr next_edge
+    cdef dd_rowrange i
+    if cone != NULL and cone.Edges != NULL:
+        for i in range(cone.m_alloc):
+            edge = cone.Edges[i]
+            while edge != NULL:
+                next_edge = edge.Next
+                libc.stdlib.free(edge)
+                edge = next_edge
+            cone.Edges[i] = NULL
+    dd_FreePolyhedra(dd_poly)
+
+
+# number of rays whilst the next row is added to cone,
+# that is, the current rays and the new rays from the edges stored for
+# this iteration, before the negative rays are deleted;
+# the cutoff orders only find their edges whilst adding the row,
+# so for these, this is just the current number of rays
+cdef long _dd_peak_ray_count(dd_ConePtr cone) noexcept nogil:
+    cdef long count = cone.RayCount
+    cdef dd_AdjacencyPtr edge
+    if cone.PreOrderedRun and cone.Iteration <= cone.m:
+        edge = cone.Edges[cone.Iteration]
+        while edge != NULL:
+            count += 1
+            edge = edge.Next
+    return count
+
+
+# iterations of dd_DDMain, stopping early once _monotonic() passes deadline
+# (a negative deadline never stops), once monitor says so,
+# or once the number of rays would exceed max_rays (if non-negative);
+# returns 1 if all rows are added, 0 at the deadline, -1 if interrupted,
+# and -2 at the ray limit
+cdef int _dd_main(
+    dd_ConePtr cone, double deadline, void *monitor, long max_rays
+) noexcept nogil:
+    cdef dd_rowrange hh, itemp, otemp
+    if cone.d <= 0:
+        cone.Iteration = cone.m
+        cone.FeasibleRayCount = 0
+        cone.CompStatus = dd_AllFound
+    else:
+        while cone.Iteration <= cone.m:
+            if deadline >= 0 and _monotonic() > deadline:
+                return 0
+            if not _monitor_check(monitor, cone):
+                return -1
+            if 0 <= max_rays < _dd_peak_ray_count(cone):
+                return -2
+            dd_SelectNextHalfspace(cone, cone.WeaklyAddedHalfspaces, &hh)
+            if set_member(hh, cone.NonequalitySet):
+                set_addelem(cone.WeaklyAddedHalfspaces, hh)
+            else:
+                if cone.PreOrderedRun:
+                    dd_AddNewHalfspace2(cone, hh)
+                elif cone.FirstRay == NULL:
+                    # dd_AddNewHalfspace1 crashes without rays,
+                    # whereas dd_AddNewHalfspace2 stops
+                    cone.CompStatus = dd_AllFound
+                else:
+                    dd_AddNewHalfspace1(cone, hh)
+                set_addelem(cone.AddedHalfspaces, hh)
+                set_addelem(cone.WeaklyAddedHalfspaces, hh)
+            if not cone.PreOrderedRun:
+                # store the dynamic ordering in the order vector
+                itemp = 1
+                while cone.OrderVector[itemp] != hh:
+                    itemp += 1
+                otemp = cone.OrderVector[cone.Iteration]
+                cone.OrderVector[cone.Iteration] = hh
+                cone.OrderVector[itemp] = otemp
+            if cone.CompStatus == dd_AllFound or cone.CompStatus == dd_RegionEmpty:
+                set_addelem(cone.AddedHalfspaces, hh)
+                break
+            cone.Iteration += 1
+        if 0 <= max_rays < cone.RayCount:
+            return -2
+    if cone.d <= 0 or cone.newcol[1] == 0:
+        cone.parent.n = cone.LinearityDim + cone.FeasibleRayCount - 1
+        cone.parent.ldim = cone.LinearityDim - 1
+    else:
+        cone.parent.n = cone.LinearityDim + cone.FeasibleRayCount
+        cone.parent.ldim = cone.LinearityDim
+    return 1
+
+
+# continue the double description method on a polyhedron from _dd_start
+# until deadline; returns as _dd_main
+cdef int _dd_run(
+    dd_PolyhedraPtr dd_poly,
+    double deadline,
+    void *monitor,
+    long max_rays,
+    dd_ErrorType *error,
+) noexcept nogil:
+    cdef dd_ConePtr cone = dd_poly.child
+    cdef int status
+    if error[0] != dd_NoError or cone.CompStatus == dd_AllFound:
+        return 1
+    status = _dd_main(cone, deadline, monitor, max_rays)
+    if status == 1 and cone.FeasibleRayCount != cone.RayCount:
+        error[0] = dd_NumericallyInconsistent
+    return status
+
+
+# row orders raced by row_order="auto", the default order first
+cdef dd_RowOrderType[8] _RACE_ROW_ORDERS = [
+    dd_LexMin,
+    dd_MaxIndex,
+    dd_MinIndex,
+    dd_MinCutoff,
+    dd_MaxCutoff,
+    dd_MixCutoff,
+    dd_LexMax,
+    dd_RandomRow,
+]
+
+# seconds for which each order runs in the first round of the race
+cdef double _RACE_SECONDS = 0.01
+
+
+# run the double description method with each order of _RACE_ROW_ORDERS
+# for a short time, keep the half that added the most rows,
+# and repeat with twice the time, until an order finishes or one is left;
+# orders that hit max_rays are dropped first;
+# status is set as for _dd_run (returns NULL if interrupted by monitor)
+cdef dd_PolyhedraPtr _dd_race(
+    dd_MatrixPtr dd_mat,
+    unsigned int rseed,
+    void *monitor,
+    long max_rays,
+    dd_ErrorType *error,
+    int *status,
+) noexcept nogil:
+    cdef dd_PolyhedraPtr[8] polys
+    cdef double[8] costs
+    cdef Py_ssize_t num_polys = 8
+    cdef Py_ssize_t i, j, k
+    cdef double seconds = _RACE_SECONDS
+    cdef dd_PolyhedraPtr dd_poly
+    cdef dd_ConePtr cone
+    status[0] = 1
+    for i in range(num_polys):
+        polys[i] = _dd_start(dd_mat, _RACE_ROW_ORDERS[i], rseed, error)
+        if polys[i] == NULL or error[0] != dd_NoError:
+            for k in range(i):
+                _dd_free(polys[k])
+            return polys[i]
+    while num_polys > 1:
+        for i in range(num_polys):
+            # an order that hit max_rays returns at once
+            status[0] = _dd_run(
+                polys[i], _monotonic() + seconds, monitor, max_rays, error
+            )
+            if status[0] == 1 or status[0] == -1:
+                dd_poly = polys[i] if status[0] == 1 else NULL
+                for k in range(num_polys):
+                    if polys[k] != dd_poly:
+                        _dd_free(polys[k])
+                return dd_poly
+            # remaining rows, with fewer current rays breaking ties,
+            # and worse than any remaining rows at the ray limit
+            cone = polys[i].child
+            if status[0] == -2:
+                costs[i] = cone.m + 1.0
+            else:
+                costs[i] = (
+                    cone.m - cone.Iteration + cone.RayCount / (cone.RayCount + 1.0)
+                )
+        # drop the worst half, keeping the order of the survivors
+        for k in range(num_polys // 2):
+            i = 0
+            for j in range(1, num_polys):
+                if costs[j] >= costs[i]:
+                    i = j
+            _dd_free(polys[i])
+            num_polys -= 1
+            for j in range(i, num_polys):
+                polys[j] = polys[j + 1]
+                costs[j] = costs[j + 1]
+        seconds *= 2
+    status[0] = _dd_run(polys[0], -1, monitor, max_rays, error)
+    if status[0] == -1:
+        _dd_free(polys[0])
+        return NULL
+    return polys[0]
+
+
+# how far a double description run got when it hit max_rays
+cdef struct _RayLimit:
+    bint exceeded
+    long iteration
+    long num_rows
+    long num_rays
+
+
+cdef void _ray_limit_record(_RayLimit *limit, dd_ConePtr cone) noexcept nogil:
+    limit.exceeded = True
+    limit.iteration = cone.Iteration - 1
+    limit.num_rows = cone.m
+    limit.num_rays = _dd_peak_ray_count(cone)
+
+
+cdef int _ray_limit_raise(_RayLimit *limit, long max_rays) except -1:
+    if limit.exceeded:
+        raise RayLimitError(
+            limit.iteration, limit.num_rows, limit.num_rays, max_rays
+        )
+    return 0
+
+
+cdef long _max_rays(max_rays) except -2:
+    if max_rays is None:
+        return -1
+    if max_rays < 0:
+        raise ValueError("max_rays must be non-negative")
+    return max_rays
+
+
 def polyhedron_from_matrix(
-    mat: Matrix, row_order: Optional[RowOrderType] = None
+    mat: Matrix,
+    row_order: Optional[Union[RowOrderType, str]] = None,
+    seed: Optional[int] = None,
+    callback: Optional[Callable[[int, int, int, float], object]] = None,
+    time_limit: Optional[Union[int, float]] = None,
+    max_rays: Optional[int] = None,
 ) -> Polyhedron:
     """Run the double description method to convert *mat* into a polyhedron,
     using *row_order* if specified.
 
+    The running time can depend a lot on the row order.
+    If *row_order* is ``"auto"``,
+    the method is started with every :class:`~cdd.RowOrderType`,
+    and each is run for a hundredth of a second of wall clock time,
+    as measured by a monotonic clock.
+    The half that added the most rows in that time
+    (breaking ties by the number of current rays)
+    is continued for twice as long, and so on,
+    until an order finishes or only one order is left,
+    which is then run to completion.
+    This typically costs a few tenths of a second,
+    and is only worth it for hard problems.
+    The order that was used is recorded in
+    :attr:`~cdd.Polyhedron.row_order`.
+
+    The *seed* (between 0 and 4294967295) seeds the random permutation
+    of the rows for :attr:`~cdd.RowOrderType.RANDOM_ROW`.
+    The other orders, apart from the index orders,
+    use this permutation to break ties.
+    If not specified, cddlib's fixed seed is used.
+
+    If *callback* or *time_limit* is specified,
+    the progress is checked before each row is added:
+    *callback* is called with the number of rows added so far,
+    the total number of rows (including the homogenizing row
+    of an H-representation), the current number of rays,
+    and the elapsed wall clock time in seconds.
+    If it raises an exception, the method is stopped,
+    all memory used by cddlib is released,
+    and the exception is propagated.
+    The callback runs whilst cddlib is in use, so if it calls a function
+    of the same module that uses cddlib, a :exc:`RuntimeError` is raised.
+    If the elapsed time reaches *time_limit* seconds,
+    a :exc:`~cdd.TimeLimitError` is raised in the same way.
+    Signals are checked before each row is added in any case,
+    so Ctrl-C stops the method with a :exc:`KeyboardInterrupt`,
+    also if neither *callback* nor *time_limit* is specified.
+    Note that a single row can take long to add if there are many rays.
+
+    If *max_rays* is specified, the method is stopped with a
+    :exc:`~cdd.RayLimitError` as soon as the number of rays
+    held in memory would exceed it, releasing all memory used by cddlib.
+    Whilst a row is added, the rays that it cuts off are only deleted
+    after the new rays are created, and both count.
+    Except for the cutoff orders, which select the next row
+    whilst adding it, the rays that the next row creates are known in advance,
+    so the method stops before allocating them.
+    For the cutoff orders, the number of rays is checked after each row.
+    With ``row_order="auto"``, orders that hit the limit are dropped,
+    and the error is only raised if all orders hit it.
+    See :func:`~cdd.output_size_bound` for how many rays there can be.
+
     .. versionadded:: 3.0.0
 
         The *row_order* parameter.
+
+    .. versionchanged:: 3.0.2
+
+        Added ``"auto"`` for *row_order*,
+        and the *seed*, *callback*, *time_limit*, and *max_rays* parameters.
     """
     if (
         mat.dd_mat.representation != dd_Inequality
@@ -1052,25 +3473,318 @@ def polyhedron_from_matrix(
     ):
         raise ValueError("rep_type must be INEQUALITY or GENERATOR")
     cdef dd_ErrorType error = dd_NoError
-    if row_order is None:
-        dd_poly = dd_DDMatrix2Poly(mat.dd_mat, &error)
-    else:
-        dd_poly = dd_DDMatrix2Poly2(mat.dd_mat, row_order, &error)
+    cdef dd_MatrixPtr dd_mat = mat.dd_mat
+    cdef dd_PolyhedraPtr dd_poly = NULL
+    cdef dd_RowOrderType dd_row_order = dd_LexMin
+    cdef bint auto_row_order = False
+    cdef unsigned int rseed = 1
+    cdef _Monitor monitor = _Monitor(callback, time_limit)
+    cdef long dd_max_rays = _max_rays(max_rays)
+    cdef int status = 1
+    cdef _RayLimit limit = _RayLimit(False, 0, 0, 0)
+    if isinstance(row_order, str):
+        if row_order != "auto":
+            raise ValueError(
+                f"row_order must be a RowOrderType or 'auto', not {row_order!r}"
+            )
+        auto_row_order = True
+    elif row_order is not None:
+        dd_row_order = row_order
+    if seed is not None:
+        if not 0 <= seed <= 4294967295:
+            raise ValueError("seed must be between 0 and 4294967295")
+        rseed = seed
+    with nogil:
+        _cddlib_acquire()
+        if auto_row_order:
+            dd_poly = _dd_race(
+                dd_mat, rseed, <void *>monitor, dd_max_rays, &error, &status
+            )
+        else:
+            dd_poly = _dd_start(dd_mat, dd_row_order, rseed, &error)
+            if dd_poly != NULL:
+                status = _dd_run(dd_poly, -1, <void *>monitor, dd_max_rays, &error)
+        if dd_poly != NULL and status != 1:
+            if status == -2:
+                _ray_limit_record(&limit, dd_poly.child)
+            _dd_free(dd_poly)
+            dd_poly = NULL
+        _cddlib_release()
+    monitor.raise_exc()
+    _ray_limit_raise(&limit, dd_max_rays)
     if error != dd_NoError:
         dd_FreePolyhedra(dd_poly)
         _raise_error(error)
     return polyhedron_from_ptr(dd_poly)
 
 
-def copy_input(poly: Polyhedron) -> Matrix:
+# upper bound theorem: maximal number of facets of a d-polytope
+# with n vertices, or of vertices of a d-polytope with n facets,
+# attained by the cyclic polytopes
+def _upper_bound_theorem(n, d):
+    if d == 0:
+        return 1
+    return _math.comb(n - (d + 1) // 2, d // 2) + _math.comb(
+        n - d // 2 - 1, (d + 1) // 2 - 1
+    )
+
+
+def output_size_bound(num_rows: int, num_cols: int, rep_type: RepType) -> int:
+    """Upper bound on the number of rows of the output of
+    :func:`~cdd.polyhedron_from_matrix`,
+    for any matrix with *num_rows* rows, *num_cols* columns,
+    and representation *rep_type*,
+    without running the double description method.
+
+    The bound follows from McMullen's upper bound theorem,
+    applied to the homogenized cone,
+    for each possible dimension of its lineality space.
+    It is attained by cyclic polytopes,
+    but is typically far too large for other inputs.
+    As the method works with cones defined by fewer rows,
+    it also bounds the number of rays after each row is added.
+    Whilst a row is added, the old and the new rays are held at once,
+    so twice this bound is enough for *max_rays*.
+
+    .. versionadded:: 3.0.2
+    """
+    if num_rows < 0 or num_cols < 0:
+        raise ValueError("num_rows and num_cols must be non-negative")
+    if rep_type == RepType.INEQUALITY:
+        num_rows += 1  # homogenizing row
+    elif rep_type != RepType.GENERATOR:
+        raise ValueError("rep_type must be INEQUALITY or GENERATOR")
+    # a pointed cone of dimension k needs at least k rows,
+    # and its lineality space adds num_cols - k rows to the output
+    return max(
+        (0 if k == 0 else _upper_bound_theorem(num_rows, k - 1)) + num_cols - k
+        for k in range(min(num_rows, num_cols) + 1)
+    )
+
+
+def polyhedron_clear_cache(poly: Polyhedron) -> None:
+    """Release all results cached by the properties of *poly*.
+    They are recomputed on their next access.
+
+    .. versionadded:: 3.0.2
+    """
+    poly._generators = None
+    poly._generators_lin_set = None
+    poly._inequalities = None
+    poly._inequalities_lin_set = None
+    poly._adjacency = None
+    poly._input_adjacency = None
+    poly._incidence = None
+    poly._input_incidence = None
+
+
+# input of dd_poly with the rows of dd_mat appended
+cdef dd_MatrixPtr _polyhedron_input_append(
+    dd_PolyhedraPtr dd_poly, dd_MatrixPtr dd_mat
+) noexcept nogil:
+    cdef dd_rowrange i
+    cdef dd_colrange j
+    cdef dd_rowrange m = dd_poly.m
+    cdef dd_MatrixPtr result = dd_CreateMatrix(m + dd_mat.rowsize, dd_poly.d)
+    if result == NULL:
+        return NULL
+    result.representation = dd_poly.representation
+    for i in range(m):
+        if dd_poly.EqualityIndex[i + 1] == 1:
+            set_addelem(result.linset, i + 1)
+        for j in range(dd_poly.d):
+            dd_set(result.matrix[i][j], dd_poly.A[i][j])
+    for i in range(dd_mat.rowsize):
+        if set_member(i + 1, dd_mat.linset):
+            set_addelem(result.linset, m + i + 1)
+        for j in range(dd_poly.d):
+            dd_set(result.matrix[m + i][j], dd_mat.matrix[i][j])
+    return result
+
+
+# continue the double description method of dd_poly with the rows of dd_mat,
+# starting from the extreme rays of its cone;
+# returns NULL if dd_poly's cone cannot be reused;
+# status is set as for _dd_run
+cdef dd_PolyhedraPtr _polyhedron_append(
+    dd_PolyhedraPtr dd_poly,
+    dd_MatrixPtr dd_mat,
+    void *monitor,
+    dd_ErrorType *error,
+    int *status,
+) noexcept nogil:
+    cdef dd_ConePtr cone = dd_poly.child
+    cdef dd_ConePtr new_cone
+    cdef dd_PolyhedraPtr new_poly
+    cdef dd_RayPtr ray
+    cdef dd_rowrange i
+    cdef dd_colrange j
+    cdef dd_rowrange m = dd_poly.m
+    status[0] = 1
+    # the cone must be fully computed and pointed, without column reduction,
+    # and linearities would need a new initial basis
+    if (
+        cone == NULL
+        or cone.CompStatus != dd_AllFound
+        or cone.Error != dd_NoError
+        or cone.ColReduced
+        or cone.LinearityDim != 0
+        or cone.FirstRay == NULL
+        or dd_poly.IsEmpty == 1
+        or dd_poly.RelaxedEnumeration
+        or set_card(dd_mat.linset) > 0
+    ):
+        return NULL
+    new_poly = dd_CreatePolyhedraData(m + dd_mat.rowsize, dd_poly.d)
+    new_poly.representation = dd_poly.representation
+    new_poly.homogeneous = dd_poly.homogeneous
+    for i in range(m):
+        new_poly.EqualityIndex[i + 1] = dd_poly.EqualityIndex[i + 1]
+        for j in range(dd_poly.d):
+            dd_set(new_poly.A[i][j], dd_poly.A[i][j])
+    for i in range(dd_mat.rowsize):
+        for j in range(dd_poly.d):
+            dd_set(new_poly.A[m + i][j], dd_mat.matrix[i][j])
+        if dd_Nonzero(dd_mat.matrix[i][0]):
+            new_poly.homogeneous = False
+    new_cone = dd_ConeDataLoad(new_poly)
+    new_cone.HalfspaceOrder = cone.HalfspaceOrder
+    new_cone.rseed = cone.rseed
+    dd_DDInit(new_cone)
+    if new_poly.representation == dd_Inequality:
+        dd_CheckEmptiness(new_poly, error)
+    if new_cone.CompStatus == dd_AllFound:
+        return new_poly
+    # the old extreme rays span the cone of the old rows, so all old rows
+    # count as added, and only the new rows are iterated over;
+    # the new rows have no stored edges, so use the dynamic iteration
+    new_cone.PreOrderedRun = False
+    new_cone.LinearityDim = 0
+    dd_AddArtificialRay(new_cone)
+    ray = cone.FirstRay
+    while ray != NULL:
+        dd_AddRay(new_cone, ray.Ray)
+        ray = ray.Next
+    for i in range(1, m + 1):
+        set_addelem(new_cone.AddedHalfspaces, i)
+    if cone.m > m:
+        # homogenizing row, which is always the last row of the cone
+        set_addelem(new_cone.AddedHalfspaces, new_cone.m)
+    set_copy(new_cone.WeaklyAddedHalfspaces, new_cone.AddedHalfspaces)
+    set_copy(new_cone.InitialHalfspaces, new_cone.AddedHalfspaces)
+    dd_UpdateRowOrderVector(new_cone, new_cone.AddedHalfspaces)
+    new_cone.Iteration = set_card(new_cone.AddedHalfspaces) + 1
+    status[0] = _dd_main(new_cone, -1, monitor, -1)
+    if status[0] == 1 and new_cone.FeasibleRayCount != new_cone.RayCount:
+        error[0] = dd_NumericallyInconsistent
+    return new_poly
+
+
+def polyhedron_append_rows(poly: Polyhedron, mat: Matrix) -> None:
+    """Append the rows of *mat* to the input of *poly*,
+    and update its output.
+
+    Rather than running the double description method from scratch,
+    the iteration continues from the extreme rays of the current output,
+    and only the new rows are processed.
+    For instance, for an H-representation, adding a few cutting planes
+    only requires cutting the current vertices and rays.
+    If this is not possible, because the input or the new rows
+    have linearities, or the polyhedron contains a line,
+    the double description method is run again on all rows.
+
+    A :exc:`ValueError` is raised if the column sizes are unequal,
+    or if *mat* has a different representation type
+    (an unspecified representation type is allowed).
+    Unless *mat* is empty,
+    the results cached by the properties of *poly* are cleared.
+
+    .. versionadded:: 3.0.2
+    """
+    cdef dd_ErrorType error = dd_NoError
+    cdef dd_PolyhedraPtr dd_poly = poly.dd_poly
+    cdef dd_MatrixPtr dd_mat = mat.dd_mat
+    cdef dd_PolyhedraPtr new_poly = NULL
+    cdef dd_MatrixPtr dd_input = NULL
+    cdef dd_RowOrderType row_order = dd_LexMin
+    cdef unsigned int rseed = 1
+    cdef _Monitor monitor = _Monitor()
+    cdef int status = 1
+    if dd_mat.rowsize == 0:
+        return
+    if dd_mat.colsize != dd_poly.d:
+        raise ValueError("cannot append because column sizes differ")
+    if (
+        dd_mat.representation != dd_Unspecified
+        and dd_mat.representation != dd_poly.representation
+    ):
+        raise ValueError("cannot append because representation types differ")
+    if dd_poly.child != NULL:
+        row_order = dd_poly.child.HalfspaceOrder
+        rseed = dd_poly.child.rseed
+    with nogil:
+        _cddlib_acquire()
+        new_poly = _polyhedron_append(
+            dd_poly, dd_mat, <void *>monitor, &error, &status
+        )
+        if new_poly == NULL:
+            dd_input = _polyhedron_input_append(dd_poly, dd_mat)
+            if dd_input != NULL:
+                new_poly = _dd_start(dd_input, row_order, rseed, &error)
+                if new_poly != NULL:
+                    status = _dd_run(new_poly, -1, <void *>monitor, -1, &error)
+                dd_FreeMatrix(dd_input)
+        if new_poly != NULL and status != 1:
+            _dd_free(new_poly)
+            new_poly = NULL
+        _cddlib_release()
+    monitor.raise_exc()
+    if new_poly == NULL:
+        raise MemoryError  # assume malloc failed
+    if error != dd_NoError:
+        dd_FreePolyhedra(new_poly)
+        _raise_error(error)
+    dd_FreePolyhedra(poly.dd_poly)
+    poly.dd_poly = new_poly
+    polyhedron_clear_cache(poly)
+
+
+# whether mode is leading_unit rather than primitive_integer
+cdef bint _normalize_leading_unit(mode) except -1:
+    if mode == "primitive_integer":
+        return False
+    elif mode == "leading_unit":
+        return True
+    raise ValueError(
+        f"mode must be 'primitive_integer' or 'leading_unit', not {mode!r}"
+    )
+
+
+cdef Matrix _matrix_normalized(Matrix mat, normalize):
+    if normalize is not None:
+        _normalize_rows(
+            mat.dd_mat.matrix,
+            mat.dd_mat.rowsize,
+            mat.dd_mat.colsize,
+            _normalize_leading_unit(normalize),
+        )
+    return mat
+
+
+def copy_input(poly: Polyhedron, normalize: Optional[str] = None) -> Matrix:
     """Returns the original matrix that the polyhedron was constructed from.
 
     .. versionadded:: 3.0.0
+
+    .. versionchanged:: 3.0.2
+
+        The *normalize* parameter, see :func:`~cdd.gmp.matrix_normalize`
+        (only supported by :mod:`cdd.gmp`).
     """
-    return matrix_from_ptr(dd_CopyInput(poly.dd_poly))
+    return _matrix_normalized(matrix_from_ptr(dd_CopyInput(poly.dd_poly)), normalize)
 
 
-def copy_output(poly: Polyhedron) -> Matrix:
+def copy_output(poly: Polyhedron, normalize: Optional[str] = None) -> Matrix:
     """Returns the dual representation of the original matrix.
     If the original was a H-representation, this will return its V-representation,
     and vice versa.
@@ -1082,18 +3796,62 @@ def copy_output(poly: Polyhedron) -> Matrix:
         Use :func:`~cdd.matrix_canonicalize` on the output to remove redundancies.
 
     .. versionadded:: 3.0.0
+
+    .. versionchanged:: 3.0.2
+
+        The *normalize* parameter, see :func:`~cdd.gmp.matrix_normalize`
+        (only supported by :mod:`cdd.gmp`).
+    """
+    return _matrix_normalized(matrix_from_ptr(dd_CopyOutput(poly.dd_poly)), normalize)
+
+
+def copy_inequalities(poly: Polyhedron, normalize: Optional[str] = None) -> Matrix:
+    """Copy a H-representation of the inequalities.
+
+    .. versionchanged:: 3.0.2
+
+        The *normalize* parameter, see :func:`~cdd.gmp.matrix_normalize`
+        (only supported by :mod:`cdd.gmp`).
     """
-    return matrix_from_ptr(dd_CopyOutput(poly.dd_poly))
+    return _matrix_normalized(
+        matrix_from_ptr(dd_CopyInequalities(poly.dd_poly)), normalize
+    )
+
 
+def copy_generators(poly: Polyhedron, normalize: Optional[str] = None) -> Matrix:
+    """Copy a V-representation of all the generators.
 
-def copy_inequalities(poly: Polyhedron) -> Matrix:
-    """Copy a H-representation of the inequalities."""
-    return matrix_from_ptr(dd_CopyInequalities(poly.dd_poly))
+    .. versionchanged:: 3.0.2
+
+        The *normalize* parameter, see :func:`~cdd.gmp.matrix_normalize`
+        (only supported by :mod:`cdd.gmp`).
+    """
+    return _matrix_normalized(
+        matrix_from_ptr(dd_CopyGenerators(poly.dd_poly)), normalize
+    )
 
 
-def copy_generators(poly: Polyhedron) -> Matrix:
-    """Copy a V-representation of all the generators."""
-    return matrix_from_ptr(dd_CopyGenerators(poly.dd_poly))
+cdef int _COPY_ADJACENCY = 0
+cdef int _COPY_INPUT_ADJACENCY = 1
+cdef int _COPY_INCIDENCE = 2
+cdef int _COPY_INPUT_INCIDENCE = 3
+
+cdef dd_SetFamilyPtr _copy_something(dd_PolyhedraPtr dd_poly, int something) except NULL:
+    cdef dd_SetFamilyPtr dd_setfam = NULL
+    with nogil:
+        _cddlib_acquire()
+        if something == _COPY_ADJACENCY:
+            dd_setfam = dd_CopyAdjacency(dd_poly)
+        elif something == _COPY_INPUT_ADJACENCY:
+            dd_setfam = dd_CopyInputAdjacency(dd_poly)
+        elif something == _COPY_INCIDENCE:
+            dd_setfam = dd_CopyIncidence(dd_poly)
+        elif something == _COPY_INPUT_INCIDENCE:
+            dd_setfam = dd_CopyInputIncidence(dd_poly)
+        _cddlib_release()
+    if dd_setfam == NULL:
+        raise MemoryError
+    return dd_setfam
 
 
 def copy_adjacency(poly: Polyhedron) -> Sequence[Set[int]]:
@@ -1104,7 +3862,7 @@ def copy_adjacency(poly: Polyhedron) -> Sequence[Set[int]]:
 
     .. versionadded:: 2.1.1
     """
-    return setfam_from_ptr(dd_CopyAdjacency(poly.dd_poly))
+    return setfam_from_ptr(_copy_something(poly.dd_poly, _COPY_ADJACENCY))
 
 
 def copy_input_adjacency(poly: Polyhedron) -> Sequence[Set[int]]:
@@ -1121,7 +3879,7 @@ def copy_input_adjacency(poly: Polyhedron) -> Sequence[Set[int]]:
 
     .. versionadded:: 2.1.1
     """
-    return setfam_from_ptr(dd_CopyInputAdjacency(poly.dd_poly))
+    return setfam_from_ptr(_copy_something(poly.dd_poly, _COPY_INPUT_ADJACENCY))
 
 
 def copy_incidence(poly: Polyhedron) -> Sequence[Set[int]]:
@@ -1132,7 +3890,7 @@ def copy_incidence(poly: Polyhedron) -> Sequence[Set[int]]:
 
     .. versionadded:: 2.1.1
     """
-    return setfam_from_ptr(dd_CopyIncidence(poly.dd_poly))
+    return setfam_from_ptr(_copy_something(poly.dd_poly, _COPY_INCIDENCE))
 
 
 def copy_input_incidence(poly: Polyhedron) -> Sequence[Set[int]]:
@@ -1143,11 +3901,952 @@ def copy_input_incidence(poly: Polyhedron) -> Sequence[Set[int]]:
 
     .. versionadded:: 2.1.1
     """
-    return setfam_from_ptr(dd_CopyInputIncidence(poly.dd_poly))
+    return setfam_from_ptr(_copy_something(poly.dd_poly, _COPY_INPUT_INCIDENCE))
 
 
-def fourier_elimination(mat: Matrix) -> Matrix:
-    """Eliminate the last variable from the system of linear inequalities *mat*.
+def copy_adjacency_bitset(poly: Polyhedron) -> npt.NDArray[np.uint64]:
+    """Like :func:`~cdd.copy_adjacency`, but without creating Python sets.
+    See :func:`~cdd.matrix_adjacency_bitset` for the output format.
+
+    .. versionadded:: 3.0.2
+    """
+    return bitset_from_ptr(_copy_something(poly.dd_poly, _COPY_ADJACENCY))
+
+
+def copy_input_adjacency_bitset(poly: Polyhedron) -> npt.NDArray[np.uint64]:
+    """Like :func:`~cdd.copy_input_adjacency`, but without creating Python sets.
+    See :func:`~cdd.matrix_adjacency_bitset` for the output format.
+
+    .. versionadded:: 3.0.2
+    """
+    return bitset_from_ptr(_copy_something(poly.dd_poly, _COPY_INPUT_ADJACENCY))
+
+
+def copy_incidence_bitset(poly: Polyhedron) -> npt.NDArray[np.uint64]:
+    """Like :func:`~cdd.copy_incidence`, but without creating Python sets.
+    See :func:`~cdd.matrix_adjacency_bitset` for the output format.
+
+    .. versionadded:: 3.0.2
+    """
+    return bitset_from_ptr(_copy_something(poly.dd_poly, _COPY_INCIDENCE))
+
+
+def copy_input_incidence_bitset(poly: Polyhedron) -> npt.NDArray[np.uint64]:
+    """Like :func:`~cdd.copy_input_incidence`, but without creating Python sets.
+    See :func:`~cdd.matrix_adjacency_bitset` for the output format.
+
+    .. versionadded:: 3.0.2
+    """
+    return bitset_from_ptr(_copy_something(poly.dd_poly, _COPY_INPUT_INCIDENCE))
+
+
+cdef struct _Edges:
+    Py_ssize_t *data
+    Py_ssize_t size
+    Py_ssize_t capacity
+
+
+cdef bint _edges_append(_Edges *edges, Py_ssize_t i, Py_ssize_t j) noexcept nogil:
+    # append edge (i, j), returns False if out of memory
+    cdef Py_ssize_t *data
+    if edges.size + 2 > edges.capacity:
+        data = <Py_ssize_t *>libc.stdlib.realloc(
+            edges.data, (2 * edges.capacity + 64) * sizeof(Py_ssize_t)
+        )
+        if data == NULL:
+            return False
+        edges.data = data
+        edges.capacity = 2 * edges.capacity + 64
+    edges.data[edges.size] = i
+    edges.data[edges.size + 1] = j
+    edges.size += 2
+    return True
+
+
+cdef bint _combinatorial_adjacent(
+    dd_SetFamilyPtr inc,
+    dd_SetFamilyPtr tr,
+    set_type valid,
+    long valid_blocks,
+    long *common,
+    long i,
+    long j,
+    long min_common,
+) noexcept nogil:
+    # elements i and j of valid are adjacent if their common incidences
+    # have at least min_common elements, and if no other element of valid
+    # is incident to all of them; common is scratch space
+    cdef long block, r, num_common, count
+    cdef long setbits = sizeof(unsigned long) * 8
+    cdef long trblocks = set_blocks(tr.famsize)
+    cdef unsigned long word
+    num_common = 0
+    for block in range(1, trblocks):
+        num_common += _popcount(inc.set[i - 1][block] & inc.set[j - 1][block])
+    if num_common < min_common:
+        return False
+    num_common = 0
+    for block in range(1, trblocks):
+        word = inc.set[i - 1][block] & inc.set[j - 1][block]
+        while word:
+            common[num_common] = (block - 1) * setbits + _ctz(word)
+            num_common += 1
+            word &= word - 1
+    # intersect the transposed sets of the common incidences a word at a
+    # time, stopping as soon as an element other than i and j is found
+    count = 0
+    for block in range(1, valid_blocks):
+        word = valid[block]
+        for r in range(num_common):
+            word &= tr.set[common[r]][block]
+        count += _popcount(word)
+        if count > 2:
+            return False
+    return True
+
+
+cdef bint _combinatorial_edges(
+    dd_SetFamilyPtr inc,
+    dd_SetFamilyPtr tr,
+    set_type eligible,
+    set_type universal,
+    long min_common,
+    _Edges *edges,
+) noexcept nogil:
+    # edges of the graph on the elements of inc, where element i has
+    # incidence set inc.set[i - 1], and tr is the transpose of inc;
+    # elements of universal are adjacent to all other eligible elements,
+    # and other eligible elements are adjacent as by _combinatorial_adjacent;
+    # edges (i, j) with i < j are appended in lexicographic order,
+    # with indexing starting at 0; returns False if out of memory
+    cdef long i, j
+    cdef set_type valid
+    cdef long *common = <long *>libc.stdlib.malloc((tr.famsize + 1) * sizeof(long))
+    cdef bint result = common != NULL
+    cdef long valid_blocks = set_blocks(inc.famsize)
+    cdef bint i_universal
+    set_initialize(&valid, inc.famsize)
+    set_diff(valid, eligible, universal)
+    for i in range(1, inc.famsize + 1):
+        if not result:
+            break
+        if not _set_member(i, eligible):
+            continue
+        i_universal = _set_member(i, universal)
+        for j in range(i + 1, inc.famsize + 1):
+            if not _set_member(j, eligible):
+                continue
+            if (
+                i_universal
+                or _set_member(j, universal)
+                or _combinatorial_adjacent(
+                    inc, tr, valid, valid_blocks, common, i, j, min_common
+                )
+            ):
+                if not _edges_append(edges, i - 1, j - 1):
+                    result = False
+                    break
+    set_free(valid)
+    libc.stdlib.free(common)
+    return result
+
+
+cdef _csr_from_edges(_Edges *edges, Py_ssize_t num_nodes):
+    # compressed sparse row numpy arrays of an undirected graph,
+    # from its edges (i, j) with i < j in lexicographic order,
+    # so that the neighbours of each node come out sorted
+    cdef Py_buffer indptr_view
+    cdef Py_buffer indices_view
+    cdef Py_ssize_t *indptr
+    cdef Py_ssize_t *indices
+    cdef Py_ssize_t *pos
+    cdef Py_ssize_t k, node
+    import numpy
+    indptr_out = numpy.zeros(num_nodes + 1, dtype=numpy.intp)
+    indices_out = numpy.empty(edges.size, dtype=numpy.intp)
+    cpython.buffer.PyObject_GetBuffer(
+        indptr_out, &indptr_view,
+        cpython.buffer.PyBUF_C_CONTIGUOUS | cpython.buffer.PyBUF_WRITABLE
+    )
+    try:
+        cpython.buffer.PyObject_GetBuffer(
+            indices_out, &indices_view,
+            cpython.buffer.PyBUF_C_CONTIGUOUS | cpython.buffer.PyBUF_WRITABLE
+        )
+        try:
+            pos = <Py_ssize_t *>cpython.mem.PyMem_Malloc(
+                (num_nodes + 1) * sizeof(Py_ssize_t)
+            )
+            if pos == NULL:
+                raise MemoryError
+            indptr = <Py_ssize_t *>indptr_view.buf
+            indices = <Py_ssize_t *>indices_view.buf
+            with nogil:
+                for k in range(edges.size):
+                    indptr[edges.data[k] + 1] += 1
+                for node in range(num_nodes):
+                    indptr[node + 1] += indptr[node]
+                    pos[node] = indptr[node]
+                # node i gets its neighbours j < i from the edges (j, i),
+                # which come before the edges (i, j) with j > i
+                for k in range(0, edges.size, 2):
+                    indices[pos[edges.data[k]]] = edges.data[k + 1]
+                    pos[edges.data[k]] += 1
+                    indices[pos[edges.data[k + 1]]] = edges.data[k]
+                    pos[edges.data[k + 1]] += 1
+            cpython.mem.PyMem_Free(pos)
+        finally:
+            cpython.buffer.PyBuffer_Release(&indices_view)
+    finally:
+        cpython.buffer.PyBuffer_Release(&indptr_view)
+    return indptr_out, indices_out
+
+
+cdef _polyhedron_graph(dd_PolyhedraPtr dd_poly, bint output):
+    # graph of the output (if output is True) or of the input,
+    # as by dd_CopyAdjacency or dd_CopyInputAdjacency, but without self loops
+    cdef dd_SetFamilyPtr dd_inc = _copy_something(dd_poly, _COPY_INCIDENCE)
+    cdef dd_SetFamilyPtr dd_input_inc = NULL
+    cdef dd_SetFamilyPtr inc
+    cdef dd_SetFamilyPtr tr
+    cdef set_type eligible = NULL
+    cdef set_type universal = NULL
+    cdef long min_common
+    cdef long k
+    cdef _Edges edges = _Edges(NULL, 0, 0)
+    cdef bint ok
+    try:
+        dd_input_inc = _copy_something(dd_poly, _COPY_INPUT_INCIDENCE)
+        if output:
+            inc, tr = dd_inc, dd_input_inc
+            min_common = dd_poly.child.d - 2
+        else:
+            inc, tr = dd_input_inc, dd_inc
+            min_common = 0
+        set_initialize(&eligible, inc.famsize)
+        set_initialize(&universal, inc.famsize)
+        if output:
+            set_compl(eligible, eligible)
+        else:
+            # redundant rows are adjacent to none
+            set_compl(eligible, dd_poly.Ared)
+        # linearity generators and rows that are active everywhere are
+        # incident to all, and adjacent to all; this does not rely on
+        # dd_poly.ldim, which is not set if no rows needed to be added
+        for k in range(1, inc.famsize + 1):
+            if set_member(k, eligible) and set_card(inc.set[k - 1]) == tr.famsize:
+                set_addelem(universal, k)
+        with nogil:
+            ok = _combinatorial_edges(inc, tr, eligible, universal, min_common, &edges)
+        if not ok:
+            raise MemoryError
+        return _csr_from_edges(&edges, inc.famsize)
+    finally:
+        dd_FreeSetFamily(dd_inc)
+        if dd_input_inc != NULL:
+            dd_FreeSetFamily(dd_input_inc)
+        if eligible != NULL:
+            set_free(eligible)
+        if universal != NULL:
+            set_free(universal)
+        libc.stdlib.free(edges.data)
+
+
+def polyhedron_vertex_graph(
+    poly: Polyhedron,
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """Get the graph of the vertices and extreme rays of *poly*,
+    as a pair ``(indptr, indices)`` of numpy arrays
+    in compressed sparse row format:
+    the neighbours of vertex ``i`` are ``indices[indptr[i]:indptr[i + 1]]``,
+    in increasing order.
+    For use with scipy, call
+    ``scipy.sparse.csr_array((numpy.ones(len(indices)), indices, indptr))``.
+
+    The vertices are numbered as the rows of the generators,
+    so this is the same graph as
+    :func:`~cdd.copy_adjacency` for H-representations
+    and :func:`~cdd.copy_input_adjacency` for V-representations,
+    but without self loops.
+    Generators of the lineality space, if any, are adjacent to all others,
+    and redundant generators of a V-representation to none.
+    It is found from the incidences only,
+    by intersecting bitsets a word at a time,
+    which is much faster than the pairwise checks of cddlib,
+    and than the linear programs of :func:`~cdd.matrix_adjacency`.
+
+    .. versionadded:: 3.0.2
+    """
+    return _polyhedron_graph(
+        poly.dd_poly, poly.dd_poly.representation == dd_Inequality
+    )
+
+
+def polyhedron_facet_graph(
+    poly: Polyhedron,
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """Get the graph of the facets of *poly*,
+    in the same format as :func:`~cdd.polyhedron_vertex_graph`.
+
+    The facets are numbered as the rows of the inequalities,
+    so this is the same graph as
+    :func:`~cdd.copy_input_adjacency` for H-representations
+    (including the row added by cddlib for the infinity inequality
+    if the polyhedron is not homogeneous),
+    and :func:`~cdd.copy_adjacency` for V-representations,
+    but without self loops.
+    Equalities, and inequalities that hold with equality everywhere,
+    are adjacent to all others,
+    and redundant inequalities of an H-representation to none.
+
+    .. versionadded:: 3.0.2
+    """
+    return _polyhedron_graph(
+        poly.dd_poly, poly.dd_poly.representation != dd_Inequality
+    )
+
+
+# faces for face_lattice are bitsets of a fixed number of words,
+# without the size header of set_type
+
+cdef inline bint _words_subset(
+    const unsigned long *a, const unsigned long *b, long numwords
+) noexcept nogil:
+    cdef long w
+    for w in range(numwords):
+        if a[w] & ~b[w]:
+            return False
+    return True
+
+
+cdef inline bint _words_empty(const unsigned long *a, long numwords) noexcept nogil:
+    cdef long w
+    for w in range(numwords):
+        if a[w]:
+            return False
+    return True
+
+
+cdef void _words_maximal_flags(
+    const unsigned long *faces, long num, long numwords, char *keep
+) noexcept nogil:
+    # flag the inclusion maximal faces, and only the first of duplicate faces
+    cdef long a, b
+    for a in range(num):
+        keep[a] = True
+        for b in range(num):
+            if b != a and _words_subset(
+                faces + a * numwords, faces + b * numwords, numwords
+            ):
+                if b < a or not _words_subset(
+                    faces + b * numwords, faces + a * numwords, numwords
+                ):
+                    keep[a] = False
+                    break
+
+
+cdef long _words_maximal(
+    unsigned long *faces, long num, long numwords, char *keep
+) noexcept nogil:
+    # keep the faces flagged by _words_maximal_flags, compacting them
+    # in place; returns how many are kept
+    cdef long a, w
+    cdef long num_kept = 0
+    _words_maximal_flags(faces, num, numwords, keep)
+    for a in range(num):
+        if keep[a]:
+            if num_kept != a:
+                for w in range(numwords):
+                    faces[num_kept * numwords + w] = faces[a * numwords + w]
+            num_kept += 1
+    return num_kept
+
+
+cdef struct _FaceLevel:
+    unsigned long *faces
+    long num
+    long capacity
+    long pos
+    long num_visited
+
+
+cdef class _FaceIterator:
+    # depth first iterator over the faces of a top face, given its facets,
+    # after Kliem and Stump: the facets of a face are the maximal ones
+    # among its intersections with its siblings, and a face is skipped if it
+    # is contained in a face that was visited before, so each face is found
+    # exactly once, whilst only the siblings along the current path are stored
+    cdef long numwords
+    cdef long max_depth
+    cdef unsigned long *top
+    cdef _FaceLevel *levels
+    cdef long num_levels
+    cdef long depth
+    cdef bint top_done
+    cdef unsigned long **visited
+    cdef long num_visited
+    cdef long visited_capacity
+    cdef char *keep
+    cdef const unsigned long *face
+
+    def __cinit__(self, long numwords, long num_coatoms, long max_depth):
+        # the faces at each level are fewer than at the level above,
+        # so there are at most num_coatoms + 1 levels
+        self.numwords = numwords
+        self.max_depth = max_depth
+        self.num_levels = num_coatoms + 1
+        self.top = <unsigned long *>libc.stdlib.calloc(
+            numwords + 1, sizeof(unsigned long)
+        )
+        self.levels = <_FaceLevel *>libc.stdlib.calloc(
+            self.num_levels, sizeof(_FaceLevel)
+        )
+        self.keep = <char *>libc.stdlib.malloc(num_coatoms + 1)
+        if (
+            self.top == NULL
+            or self.levels == NULL
+            or self.keep == NULL
+            or not self._reserve(0, num_coatoms + 1)
+        ):
+            raise MemoryError
+
+    def __dealloc__(self):
+        cdef long i
+        if self.levels != NULL:
+            for i in range(self.num_levels):
+                libc.stdlib.free(self.levels[i].faces)
+        libc.stdlib.free(self.levels)
+        libc.stdlib.free(self.top)
+        libc.stdlib.free(self.visited)
+        libc.stdlib.free(self.keep)
+
+    cdef bint _reserve(self, long level, long num) noexcept nogil:
+        # room for num faces at level, returns False if out of memory
+        cdef _FaceLevel *lev = &self.levels[level]
+        cdef unsigned long *faces
+        if num > lev.capacity:
+            faces = <unsigned long *>libc.stdlib.realloc(
+                lev.faces, (num * self.numwords + 1) * sizeof(unsigned long)
+            )
+            if faces == NULL:
+                return False
+            lev.faces = faces
+            lev.capacity = num
+        return True
+
+    cdef bint _visit(self, const unsigned long *face) noexcept nogil:
+        # mark face as visited, returns False if out of memory
+        cdef unsigned long **visited
+        if self.num_visited == self.visited_capacity:
+            visited = <unsigned long **>libc.stdlib.realloc(
+                self.visited,
+                (2 * self.visited_capacity + 16) * sizeof(unsigned long *),
+            )
+            if visited == NULL:
+                return False
+            self.visited = visited
+            self.visited_capacity = 2 * self.visited_capacity + 16
+        self.visited[self.num_visited] = <unsigned long *>face
+        self.num_visited += 1
+        return True
+
+    cdef void start(self) noexcept nogil:
+        # (re)start at the top face; the facets of the top face must have
+        # been stored at level 0, reduced to their maximal elements
+        cdef _FaceLevel *lev = &self.levels[0]
+        cdef long w
+        if lev.num == 0 and not _words_empty(self.top, self.numwords):
+            # a single point, whose only proper face is the empty face
+            for w in range(self.numwords):
+                lev.faces[w] = 0
+            lev.num = 1
+        self.depth = 0
+        self.top_done = False
+        self.num_visited = 0
+        lev.pos = 0
+        lev.num_visited = 0
+
+    cdef int next(self) noexcept nogil:
+        # advance to the next face, and return its depth below the top face,
+        # -1 if there are no more faces, or -2 if out of memory
+        cdef _FaceLevel *lev
+        cdef _FaceLevel *child
+        cdef const unsigned long *face
+        cdef const unsigned long *sibling
+        cdef long v, k, w
+        cdef long numwords = self.numwords
+        if not self.top_done:
+            self.top_done = True
+            if self.max_depth < 0:
+                self.depth = -1
+                return -1
+            if self.max_depth == 0:
+                self.depth = -1
+            self.face = self.top
+            return 0
+        while self.depth >= 0:
+            lev = &self.levels[self.depth]
+            if lev.pos == lev.num:
+                # all faces at this level are done, back to their parent
+                self.num_visited = lev.num_visited
+                self.depth -= 1
+                if self.depth >= 0:
+                    lev = &self.levels[self.depth]
+                    if not self._visit(lev.faces + lev.pos * numwords):
+                        return -2
+                    lev.pos += 1
+                continue
+            face = lev.faces + lev.pos * numwords
+            for v in range(self.num_visited):
+                if _words_subset(face, self.visited[v], numwords):
+                    lev.pos += 1
+                    break
+            else:
+                self.face = face
+                if (
+                    self.depth + 2 <= self.max_depth
+                    and lev.num > 1
+                    and not _words_empty(face, numwords)
+                ):
+                    # store the facets of face one level down, and go there
+                    if not self._reserve(self.depth + 1, lev.num - 1):
+                        return -2
+                    child = &self.levels[self.depth + 1]
+                    child.num = 0
+                    for k in range(lev.num):
+                        if k != lev.pos:
+                            sibling = lev.faces + k * numwords
+                            for w in range(numwords):
+                                child.faces[child.num * numwords + w] = (
+                                    face[w] & sibling[w]
+                                )
+                            child.num += 1
+                    child.num = _words_maximal(
+                        child.faces, child.num, numwords, self.keep
+                    )
+                    child.pos = 0
+                    child.num_visited = self.num_visited
+                    self.depth += 1
+                    return self.depth
+                if not self._visit(face):
+                    return -2
+                lev.pos += 1
+                return self.depth + 1
+        return -1
+
+
+cdef _FaceIterator _face_iterator(
+    dd_SetFamilyPtr coatoms, set_type top, set_type valid, long max_depth
+):
+    # iterator over the faces of top, whose facets are the maximal sets
+    # of coatoms that are in valid, intersected with top
+    cdef long numwords = set_blocks(coatoms.setsize) - 1
+    cdef _FaceIterator it = _FaceIterator(numwords, set_card(valid), max_depth)
+    cdef _FaceLevel *lev = &it.levels[0]
+    cdef unsigned long *face
+    cdef long i, w
+    with nogil:
+        for w in range(numwords):
+            it.top[w] = top[w + 1]
+        for i in range(coatoms.famsize):
+            if _set_member(i + 1, valid):
+                face = lev.faces + lev.num * numwords
+                for w in range(numwords):
+                    face[w] = coatoms.set[i][w + 1] & it.top[w]
+                # the top face is not a facet of itself
+                if not _words_subset(it.top, face, numwords):
+                    lev.num += 1
+        lev.num = _words_maximal(lev.faces, lev.num, numwords, it.keep)
+        it.start()
+    return it
+
+
+cdef _face_bitset(set_type set_):
+    # set_ as a packed uint64 numpy array, as a row of bitset_from_ptr
+    cdef Py_buffer view
+    cdef long setsize = set_groundsize(set_)
+    import numpy
+    out = numpy.zeros((setsize + 63) // 64, dtype=numpy.uint64)
+    cpython.buffer.PyObject_GetBuffer(
+        out, &view, cpython.buffer.PyBUF_C_CONTIGUOUS | cpython.buffer.PyBUF_WRITABLE
+    )
+    _pack_set(set_, setsize, <uint64_t*>view.buf)
+    cpython.buffer.PyBuffer_Release(&view)
+    return out.astype("<u8", copy=False)
+
+
+cdef _face_indices(set_type set_):
+    # elements of set_ as a sorted numpy array of indices, starting at 0
+    cdef Py_buffer view
+    cdef Py_ssize_t *indices
+    cdef long block, k
+    cdef unsigned long word
+    cdef long setbits = sizeof(unsigned long) * 8
+    import numpy
+    out = numpy.empty(set_card(set_), dtype=numpy.intp)
+    cpython.buffer.PyObject_GetBuffer(
+        out, &view, cpython.buffer.PyBUF_C_CONTIGUOUS | cpython.buffer.PyBUF_WRITABLE
+    )
+    indices = <Py_ssize_t*>view.buf
+    k = 0
+    for block in range(<long>set_blocks(set_groundsize(set_)) - 1):
+        word = set_[block + 1]
+        while word:
+            indices[k] = block * setbits + _ctz(word)
+            word &= word - 1
+            k += 1
+    cpython.buffer.PyBuffer_Release(&view)
+    return out
+
+
+cdef class _FaceLattice:
+    # the incidences of a polytope for face_lattice:
+    # gens has the facets of each generator, facets has the generators
+    # of each facet, valid_gens are the generators that are vertices, and
+    # valid_facets are the facets, one inequality for each, without
+    # redundant inequalities and without those that hold everywhere
+    # with equality; dim is the dimension of the polytope
+    cdef dd_SetFamilyPtr gens
+    cdef dd_SetFamilyPtr facets
+    cdef set_type valid_gens
+    cdef set_type valid_facets
+    cdef long dim
+
+    def __dealloc__(self):
+        if self.gens != NULL:
+            dd_FreeSetFamily(self.gens)
+        if self.facets != NULL:
+            dd_FreeSetFamily(self.facets)
+        if self.valid_gens != NULL:
+            set_free(self.valid_gens)
+        if self.valid_facets != NULL:
+            set_free(self.valid_facets)
+
+    cdef _FaceIterator primal(self):
+        # faces as sets of vertices, top down from the polytope,
+        # at depth dim - k for faces of dimension k
+        return _face_iterator(
+            self.facets, self.valid_gens, self.valid_facets, LONG_MAX
+        )
+
+    cdef _FaceIterator dual(self, long max_dim):
+        # faces as sets of facets, bottom up from the empty face,
+        # at depth k + 1 for faces of dimension k, up to max_dim
+        return _face_iterator(
+            self.gens, self.valid_facets, self.valid_gens, max_dim + 1
+        )
+
+    cdef void dual_vertices(
+        self, const unsigned long *face, set_type vertices
+    ) noexcept nogil:
+        # vertices of a face from the dual iterator
+        cdef long block, w, f
+        cdef long numwords = set_blocks(self.gens.famsize) - 1
+        cdef unsigned long word
+        set_copy(vertices, self.valid_gens)
+        for block in range(<long>set_blocks(self.facets.famsize) - 1):
+            word = face[block]
+            while word:
+                f = block * sizeof(unsigned long) * 8 + _ctz(word)
+                word &= word - 1
+                for w in range(numwords):
+                    vertices[w + 1] &= self.facets.set[f][w + 1]
+
+
+cdef _FaceLattice _face_lattice(Polyhedron poly):
+    cdef dd_PolyhedraPtr dd_poly = poly.dd_poly
+    cdef _FaceLattice lattice = _FaceLattice()
+    cdef dd_SetFamilyPtr dd_inc = _copy_something(dd_poly, _COPY_INCIDENCE)
+    cdef dd_SetFamilyPtr dd_input_inc
+    cdef unsigned long *faces
+    cdef char *keep
+    cdef long *rows
+    cdef long numwords, num, i, w
+    cdef _FaceIterator it
+    cdef int depth
+    cdef Matrix out
+    try:
+        dd_input_inc = _copy_something(dd_poly, _COPY_INPUT_INCIDENCE)
+    except MemoryError:
+        dd_FreeSetFamily(dd_inc)
+        raise
+    # generators are the output of H-representations, and the input otherwise
+    if dd_poly.representation == dd_Inequality:
+        lattice.gens, lattice.facets = dd_inc, dd_input_inc
+    else:
+        lattice.gens, lattice.facets = dd_input_inc, dd_inc
+    set_initialize(&lattice.valid_gens, lattice.gens.famsize)
+    set_initialize(&lattice.valid_facets, lattice.facets.famsize)
+    if dd_poly.representation == dd_Inequality:
+        out = copy_output(poly)
+        for i in range(out.dd_mat.rowsize):
+            if not dd_Nonzero(out.dd_mat.matrix[i][0]):
+                raise ValueError("polyhedron must be bounded")
+        set_compl(lattice.valid_gens, lattice.valid_gens)
+    else:
+        for i in range(dd_poly.m):
+            if dd_poly.EqualityIndex[i + 1] != 0 or not dd_Nonzero(dd_poly.A[i][0]):
+                raise ValueError("polyhedron must be bounded")
+        # redundant generators are not vertices
+        set_compl(lattice.valid_gens, dd_poly.Ared)
+    # the facets are the maximal sets of vertices of the inequalities,
+    # other than the empty set and the set of all vertices
+    numwords = set_blocks(lattice.gens.famsize) - 1
+    num = lattice.facets.famsize
+    faces = <unsigned long *>cpython.mem.PyMem_Malloc(
+        (num + 1) * numwords * sizeof(unsigned long)
+    )
+    keep = <char *>cpython.mem.PyMem_Malloc(num + 1)
+    rows = <long *>cpython.mem.PyMem_Malloc((num + 1) * sizeof(long))
+    try:
+        if faces == NULL or keep == NULL or rows == NULL:
+            raise MemoryError
+        with nogil:
+            num = 0
+            for i in range(lattice.facets.famsize):
+                for w in range(numwords):
+                    faces[num * numwords + w] = (
+                        lattice.facets.set[i][w + 1] & lattice.valid_gens[w + 1]
+                    )
+                # skip the sets with no vertices, or with all vertices
+                if not _words_empty(
+                    faces + num * numwords, numwords
+                ) and not _words_subset(
+                    lattice.valid_gens + 1, faces + num * numwords, numwords
+                ):
+                    rows[num] = i
+                    num += 1
+            _words_maximal_flags(faces, num, numwords, keep)
+            for i in range(num):
+                if keep[i]:
+                    set_addelem(lattice.valid_facets, rows[i] + 1)
+    finally:
+        cpython.mem.PyMem_Free(faces)
+        cpython.mem.PyMem_Free(keep)
+        cpython.mem.PyMem_Free(rows)
+    # the dimension is the length of any path down to the empty face
+    it = lattice.primal()
+    depth = it.next()
+    while depth >= 0 and not _words_empty(it.face, it.numwords):
+        depth = it.next()
+    if depth == -2:
+        raise MemoryError
+    lattice.dim = depth - 1
+    return lattice
+
+
+def face_lattice(
+    poly: Polyhedron, max_dim: Optional[int] = None, bitset: bool = False
+) -> Iterator[tuple[int, npt.NDArray[Union[np.intp, np.uint64]]]]:
+    """Generate the faces of the polytope *poly*,
+    from the empty face up to *poly* itself,
+    or only those of dimension at most *max_dim* if it is given.
+
+    Yields a pair ``(dim, vertices)`` for each face,
+    where *dim* is the dimension of the face and *vertices* is a numpy array
+    with the indices of its vertices, in increasing order.
+    The vertices are numbered as the rows of the generators,
+    as for :func:`~cdd.polyhedron_vertex_graph`.
+    If *bitset* is ``True``, *vertices* is a packed bitset instead,
+    in the format of the rows of :func:`~cdd.copy_incidence_bitset`.
+    The faces are yielded in no particular order.
+
+    The faces are enumerated from the incidences of the vertices and facets
+    only, as intersections of facets, closed under inclusion,
+    in a depth first search that keeps just the faces along the current path,
+    after Kliem and Stump, "A face iterator for polyhedra and more" (2019).
+    The search goes down from *poly* through its facets,
+    unless *max_dim* is less than the dimension of *poly*,
+    in which case it goes up from the empty face through the vertices,
+    so higher dimensional faces are never visited.
+
+    Raises :exc:`ValueError` if *poly* is not bounded.
+
+    .. seealso::
+
+        :func:`~cdd.f_vector`, to count the faces of each dimension.
+
+    .. versionadded:: 3.0.2
+    """
+    cdef _FaceLattice lattice = _face_lattice(poly)
+    cdef _FaceIterator it
+    cdef bint dual = max_dim is not None and max_dim < lattice.dim
+    cdef set_type vertices
+    cdef int depth
+    cdef long w
+    cdef dd_SetFamilyPtr dd_setfam
+    it = lattice.dual(max_dim) if dual else lattice.primal()
+    dd_setfam = dd_CreateSetFamily(1, lattice.gens.famsize)
+    if dd_setfam == NULL:
+        raise MemoryError
+    vertices = dd_setfam.set[0]
+    try:
+        while True:
+            depth = it.next()
+            if depth == -1:
+                break
+            elif depth == -2:
+                raise MemoryError
+            if dual and depth == 0:
+                # the empty face, also if there are no facets
+                set_emptyset(vertices)
+            elif dual:
+                lattice.dual_vertices(it.face, vertices)
+            else:
+                for w in range(it.numwords):
+                    vertices[w + 1] = it.face[w]
+            if bitset:
+                face = _face_bitset(vertices)
+            else:
+                face = _face_indices(vertices)
+            yield (depth - 1 if dual else lattice.dim - depth), face
+    finally:
+        dd_FreeSetFamily(dd_setfam)
+
+
+def f_vector(poly: Polyhedron, max_dim: Optional[int] = None) -> Sequence[int]:
+    """Count the faces of the polytope *poly* for each dimension,
+    as by :func:`~cdd.face_lattice`, but without creating them.
+    Returns a list whose element ``k`` is the number of faces
+    of dimension ``k - 1``, from the empty face up to *poly* itself,
+    or up to dimension *max_dim* if it is given.
+
+    .. versionadded:: 3.0.2
+    """
+    cdef _FaceLattice lattice = _face_lattice(poly)
+    cdef _FaceIterator it
+    cdef bint dual = max_dim is not None and max_dim < lattice.dim
+    cdef long top_dim = max_dim if dual else lattice.dim
+    cdef long *counts
+    cdef int depth
+    if top_dim < -1:
+        return []
+    it = lattice.dual(max_dim) if dual else lattice.primal()
+    counts = <long *>cpython.mem.PyMem_Calloc(top_dim + 2, sizeof(long))
+    if counts == NULL:
+        raise MemoryError
+    try:
+        with nogil:
+            depth = it.next()
+            while depth >= 0:
+                counts[depth if dual else lattice.dim - depth + 1] += 1
+                depth = it.next()
+        if depth == -2:
+            raise MemoryError
+        return [counts[i] for i in range(top_dim + 2)]
+    finally:
+        cpython.mem.PyMem_Free(counts)
+
+
+def matrix_to_file(mat: Matrix, path: Union[str, _os.PathLike]) -> None:
+    """Write *mat* to the file at *path*, in cdd's ``.ine`` or ``.ext`` format,
+    i.e. the same text as ``str(mat)``.
+    The text is streamed directly from cddlib into the file,
+    without creating a Python string.
+    The file can be read back with :func:`~cdd.matrix_from_file`.
+
+    .. note::
+        Real numbers are written with 10 significant digits,
+        so for :mod:`cdd` the round trip is not exact in general.
+
+    .. versionadded:: 3.0.2
+    """
+    cdef libc.stdio.FILE *pfile = _fopen_write(path)
+    cdef dd_MatrixPtr dd_mat = mat.dd_mat
+    with nogil:
+        dd_WriteMatrix(pfile, dd_mat)
+    _fclose_write(pfile, path)
+
+
+def linprog_to_file(lp: LinProg, path: Union[str, _os.PathLike]) -> None:
+    """Write the same text as ``str(lp)`` to the file at *path*,
+    streaming it directly from cddlib into the file.
+
+    .. versionadded:: 3.0.2
+    """
+    cdef libc.stdio.FILE *pfile = _fopen_write(path)
+    cdef dd_LPPtr dd_lp = lp.dd_lp
+    with nogil:
+        dd_WriteLPResult(pfile, dd_lp, dd_NoError)
+    _fclose_write(pfile, path)
+
+
+def polyhedron_to_file(poly: Polyhedron, path: Union[str, _os.PathLike]) -> None:
+    """Write the same text as ``str(poly)`` to the file at *path*,
+    streaming it directly from cddlib into the file.
+
+    .. versionadded:: 3.0.2
+    """
+    cdef libc.stdio.FILE *pfile = _fopen_write(path)
+    cdef dd_PolyhedraPtr dd_poly = poly.dd_poly
+    with nogil:
+        dd_WritePolyFile(pfile, dd_poly)
+    _fclose_write(pfile, path)
+
+
+# number of rows that eliminating column j from dd_mat adds
+cdef long _fourier_growth(dd_MatrixPtr dd_mat, dd_colrange j) noexcept nogil:
+    cdef dd_rowrange i
+    cdef long num_pos = 0
+    cdef long num_neg = 0
+    for i in range(dd_mat.rowsize):
+        if dd_Positive(dd_mat.matrix[i][j]):
+            num_pos += 1
+        elif dd_Negative(dd_mat.matrix[i][j]):
+            num_neg += 1
+    return num_pos * num_neg - num_pos - num_neg
+
+
+# dd_FourierElimination on column j of dd_mat, instead of the last one
+cdef dd_MatrixPtr _fourier_elimination(
+    dd_MatrixPtr dd_mat, dd_colrange j, dd_ErrorType *error
+) noexcept nogil:
+    cdef dd_rowrange i
+    cdef dd_colrange k
+    cdef dd_colrange d = dd_mat.colsize
+    cdef dd_MatrixPtr dd_perm = NULL
+    cdef dd_MatrixPtr result = NULL
+    if j == d - 1:
+        return dd_FourierElimination(dd_mat, error)
+    # move column j to the end
+    dd_perm = dd_CreateMatrix(dd_mat.rowsize, d)
+    if dd_perm == NULL:
+        return NULL
+    dd_perm.representation = dd_mat.representation
+    dd_perm.numbtype = dd_mat.numbtype
+    set_copy(dd_perm.linset, dd_mat.linset)
+    for i in range(dd_mat.rowsize):
+        for k in range(d - 1):
+            dd_set(dd_perm.matrix[i][k], dd_mat.matrix[i][k if k < j else k + 1])
+        dd_set(dd_perm.matrix[i][d - 1], dd_mat.matrix[i][j])
+    result = dd_FourierElimination(dd_perm, error)
+    dd_FreeMatrix(dd_perm)
+    return result
+
+
+def fourier_elimination(
+    mat: Matrix, col_set: Optional[Container[int]] = None, prune: str = "none"
+) -> Matrix:
+    """Eliminate the variables *col_set* from the system of linear inequalities *mat*,
+    or only the last variable if *col_set* is not specified.
+    Columns in *col_set* must lie between 1 and the number of columns minus one.
+
+    The variables are eliminated one at a time,
+    each time picking the one whose elimination adds the fewest rows,
+    that is, the one with the smallest number of pairs
+    of rows with positive and negative coefficients,
+    minus the number of such rows.
+    The remaining columns keep their order.
+
+    Without pruning, the number of rows can grow doubly exponentially
+    in the number of eliminated variables.
+    The *prune* argument removes redundant rows after every elimination,
+    as :func:`~cdd.matrix_redundancy_remove` does with ``dedup=True``:
+
+    * ``"none"``: keep all rows.
+    * ``"lp"``: check every row by solving a linear program.
+    * ``"shooting"``: use the ray shooting method,
+      see :func:`~cdd.redundant_rows`.
 
     .. warning::
 
@@ -1158,24 +4857,141 @@ def fourier_elimination(mat: Matrix) -> Matrix:
 
     .. note::
 
-        The output is not guaranteed to be minimal,
+        Unless pruned, the output is not guaranteed to be minimal,
         that is, it can still contain redundancy.
         Use :func:`~cdd.matrix_canonicalize` on the output to remove redundancies.
 
     .. versionadded:: 3.0.0
+
+    .. versionchanged:: 3.0.2
+
+        The *col_set* and *prune* parameters.
     """
     if mat.dd_mat.representation != dd_Inequality:
         raise ValueError("rep_type must be INEQUALITY")
+    if prune not in ("none", "lp", "shooting"):
+        raise ValueError(f"prune must be 'none', 'lp', or 'shooting', not {prune!r}")
     cdef dd_ErrorType error = dd_NoError
-    cdef dd_MatrixPtr dd_mat = dd_FourierElimination(mat.dd_mat, &error)
-    return matrix_from_ptr_with_error(dd_mat, error)
+    cdef dd_MatrixPtr dd_mat = NULL
+    cdef dd_MatrixPtr dd_input = mat.dd_mat
+    cdef dd_colrange j
+    cdef Matrix result = mat
+    if col_set is None:
+        cols = [mat.dd_mat.colsize - 1]
+    else:
+        if 0 in col_set:
+            raise ValueError("cannot eliminate column 0")
+        if isinstance(col_set, Iterable):
+            for col in col_set:
+                if not 1 <= col < mat.dd_mat.colsize:
+                    raise ValueError(
+                        f"column {col!r} out of range 1..{mat.dd_mat.colsize - 1}"
+                    )
+        cols = [j for j in range(1, mat.dd_mat.colsize) if j in col_set]
+    # cols holds the current positions of the columns still to eliminate
+    while cols:
+        dd_input = result.dd_mat
+        best = None
+        for col in cols:
+            key = (_fourier_growth(dd_input, col), -col)
+            if best is None or key < best:
+                best = key
+        j = -best[1]
+        cols = [col if col < j else col - 1 for col in cols if col != j]
+        with nogil:
+            _cddlib_acquire()
+            dd_mat = _fourier_elimination(dd_input, j, &error)
+            _cddlib_release()
+        result = matrix_from_ptr_with_error(dd_mat, error)
+        if prune != "none":
+            matrix_redundancy_remove(result, method=prune, dedup=True)
+    return result if result is not mat else matrix_copy(mat)
+
+
+# dd_BlockElimination, but running the double description method
+# on the dual system with _dd_run, so monitor can interrupt it;
+# returns NULL if interrupted, recording in limit if it hit max_rays
+cdef dd_MatrixPtr _block_elimination(
+    dd_MatrixPtr dd_mat,
+    dd_colset delset,
+    void *monitor,
+    long max_rays,
+    dd_ErrorType *error,
+    _RayLimit *limit,
+) noexcept nogil:
+    cdef dd_rowrange i, h, k
+    cdef dd_colrange j
+    cdef dd_rowrange m = dd_mat.rowsize
+    cdef dd_colrange d = dd_mat.colsize
+    cdef dd_MatrixPtr dual = NULL
+    cdef dd_MatrixPtr dual_gens = NULL
+    cdef dd_MatrixPtr result = NULL
+    cdef dd_PolyhedraPtr dual_poly = NULL
+    cdef dd_Arow tmp = NULL
+    cdef int status
+    # 1. the dual system z1^T B1 + z2^T B2 = 0, z1 >= 0
+    dual = dd_CreateMatrix(set_card(delset) + m - set_card(dd_mat.linset), m + 1)
+    if dual == NULL:
+        return NULL
+    dual.representation = dd_Inequality
+    k = 0
+    for j in range(d):
+        if set_member(j + 1, delset):
+            set_addelem(dual.linset, k + 1)
+            for h in range(m):
+                dd_set(dual.matrix[k][h + 1], dd_mat.matrix[h][j])
+            k += 1
+    for h in range(m):
+        if not set_member(h + 1, dd_mat.linset):
+            dd_set(dual.matrix[k][h + 1], dd_one)
+            k += 1
+    # 2. its generators
+    dual_poly = _dd_start(dual, dd_LexMin, 1, error)
+    dd_FreeMatrix(dual)
+    if dual_poly == NULL:
+        return NULL
+    status = _dd_run(dual_poly, -1, monitor, max_rays, error)
+    if status == 1 and error[0] == dd_NoError:
+        dual_gens = dd_CopyGenerators(dual_poly)
+    elif status == -2:
+        _ray_limit_record(limit, dual_poly.child)
+    _dd_free(dual_poly)
+    if dual_gens == NULL:
+        return NULL
+    # 3. the linear combinations of the original system with each generator
+    result = dd_CreateMatrix(dual_gens.rowsize, d - set_card(delset))
+    if result != NULL:
+        result.representation = dd_Inequality
+        set_copy(result.linset, dual_gens.linset)
+        dd_InitializeArow(1, &tmp)
+        for i in range(dual_gens.rowsize):
+            k = 0
+            for j in range(d):
+                if not set_member(j + 1, delset):
+                    for h in range(m):
+                        dd_mul(tmp[0], dd_mat.matrix[h][j], dual_gens.matrix[i][h + 1])
+                        dd_add(result.matrix[i][k], result.matrix[i][k], tmp[0])
+                    k += 1
+        dd_FreeArow(1, tmp)
+    dd_FreeMatrix(dual_gens)
+    return result
 
 
-def block_elimination(mat: Matrix, col_set: Container[int]) -> Matrix:
+def block_elimination(
+    mat: Matrix,
+    col_set: Container[int],
+    callback: Optional[Callable[[int, int, int, float], object]] = None,
+    time_limit: Optional[Union[int, float]] = None,
+    max_rays: Optional[int] = None,
+) -> Matrix:
     """Eliminate the variables *col_set* from the system of linear inequalities *mat*.
     It does this by using the generators of the dual linear system,
     where the generators are calculated using the double description algorithm.
 
+    The *callback*, *time_limit*, and *max_rays* parameters check the progress
+    of the double description method on the dual system,
+    as for :func:`~cdd.polyhedron_from_matrix`.
+
     .. note::
 
         The output is not guaranteed to be minimal,
@@ -1183,16 +4999,31 @@ def block_elimination(mat: Matrix, col_set: Container[int]) -> Matrix:
         Use :func:`~cdd.matrix_canonicalize` on the output to remove redundancies.
 
     .. versionadded:: 3.0.0
+
+    .. versionchanged:: 3.0.2
+
+        The *callback*, *time_limit*, and *max_rays* parameters.
     """
     if mat.dd_mat.representation != dd_Inequality:
         raise ValueError("rep_type must be INEQUALITY")
     cdef set_type dd_colset = NULL
     cdef dd_MatrixPtr dd_mat = NULL
+    cdef dd_MatrixPtr dd_input = mat.dd_mat
     cdef dd_ErrorType error = dd_NoError
+    cdef _Monitor monitor = _Monitor(callback, time_limit)
+    cdef long dd_max_rays = _max_rays(max_rays)
+    cdef _RayLimit limit = _RayLimit(False, 0, 0, 0)
     set_initialize(&dd_colset, mat.dd_mat.colsize)
     try:
         _set_set(dd_colset, col_set)
-        dd_mat = dd_BlockElimination(mat.dd_mat, dd_colset, &error)
+        with nogil:
+            _cddlib_acquire()
+            dd_mat = _block_elimination(
+                dd_input, dd_colset, <void *>monitor, dd_max_rays, &error, &limit
+            )
+            _cddlib_release()
+        monitor.raise_exc()
+        _ray_limit_raise(&limit, dd_max_rays)
         return matrix_from_ptr_with_error(dd_mat, error)
     finally:
         set_free(dd_colset)
@@ -0,0 +1,112 @@
+# pycddlib is a Python wrapper for Komei Fukuda's cddlib
+# Copyright (c) 2008-2024, Matthias C. M. Troffaes
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+# exceptions, shared by cdd and cdd.gmp
+
+
+class RayLimitError(MemoryError):
+    """Raised when the double description method stops
+    because the number of rays would exceed *max_rays*.
+
+    .. attribute:: iteration
+
+        The number of rows that were added.
+
+    .. attribute:: num_rows
+
+        The total number of rows.
+
+    .. attribute:: num_rays
+
+        The number of rays that adding the next row would have required.
+
+    .. attribute:: max_rays
+
+        The limit.
+
+    .. versionadded:: 3.0.2
+    """
+
+    def __init__(self, iteration: int, num_rows: int, num_rays: int, max_rays: int):
+        super().__init__(iteration, num_rows, num_rays, max_rays)
+        self.iteration = iteration
+        self.num_rows = num_rows
+        self.num_rays = num_rays
+        self.max_rays = max_rays
+
+    def __str__(self) -> str:
+        return (
+            f"{self.num_rays} rays exceed max_rays={self.max_rays} "
+            f"after {self.iteration} of {self.num_rows} rows"
+        )
+
+
+class TimeLimitError(TimeoutError):
+    """Raised when the double description method stops
+    because the elapsed time reached *time_limit*.
+
+    .. attribute:: iteration
+
+        The number of rows that were added.
+
+    .. attribute:: num_rows
+
+        The total number of rows.
+
+    .. attribute:: num_rays
+
+        The current number of rays.
+
+    .. attribute:: elapsed
+
+        The elapsed wall clock time in seconds.
+
+    .. attribute:: time_limit
+
+        The limit.
+
+    .. versionadded:: 3.0.2
+    """
+
+    def __init__(
+        self,
+        iteration: int,
+        num_rows: int,
+        num_rays: int,
+        elapsed: float,
+        time_limit: float,
+    ):
+        # OSError, the base class of TimeoutError, would interpret
+        # several arguments as errno, strerror, and filename
+        super().__init__(
+            f"time limit of {time_limit} seconds reached "
+            f"after {iteration} of {num_rows} rows"
+        )
+        self.iteration = iteration
+        self.num_rows = num_rows
+        self.num_rays = num_rays
+        self.elapsed = elapsed
+        self.time_limit = time_limit
+
+    def __reduce__(self):
+        return type(self), (
+            self.iteration,
+            self.num_rows,
+            self.num_rays,
+            self.elapsed,
+            self.time_limit,
+        )
@@ -10,6 +10,7 @@ setup(
                 "cython/mytype.pxi",
                 "cython/pycddlib.pxi",
                 "cython/pyenums.pxi",
+                "cython/pyerrors.pxi",
                 "cython/setoper.pxi",
             ],
             libraries=["cdd"],
@@ -19,6 +20,7 @@ setup(
             sources=["cython/_cddgmp.pyx"],
             depends=[
                 "cython/cdd.pxi",
+                "cython/mixed.pxi",
                 "cython/mytype_gmp.pxi",
                 "cython/pycddlib.pxi",
                 "cython/setoper.pxi",
@@ -1,8 +1,13 @@
 import enum
-from collections.abc import Container, Sequence, Set
-from typing import ClassVar, Optional, SupportsFloat
+import os
+from collections.abc import Callable, Container, Iterable, Iterator, Sequence, Set
+from typing import ClassVar, Optional, SupportsFloat, Union
+
+import numpy as np
+import numpy.typing as npt
 
 NumberType = float
+NumberArray = npt.NDArray[np.float64]
 SupportsNumberType = SupportsFloat
 
 class LPObjType(enum.IntEnum):
@@ -30,6 +35,10 @@ class LinProg:
     @property
     def dual_solution(self) -> Sequence[tuple[int, NumberType]]: ...
     @property
+    def obj_func(self) -> Sequence[NumberType]: ...
+    @obj_func.setter
+    def obj_func(self, value: Sequence[NumberType]) -> None: ...
+    @property
     def obj_type(self) -> LPObjType: ...
     @obj_type.setter
     def obj_type(self, value: LPObjType) -> None: ...
@@ -63,8 +72,35 @@ class Matrix:
     def rep_type(self, value: RepType) -> None: ...
 
 class Polyhedron:
+    @property
+    def adjacency(self) -> Sequence[Set[int]]: ...
+    @property
+    def generators(self) -> Sequence[Sequence[NumberType]]: ...
+    @property
+    def generators_lin_set(self) -> Set[int]: ...
+    @property
+    def incidence(self) -> Sequence[Set[int]]: ...
+    @property
+    def inequalities(self) -> Sequence[Sequence[NumberType]]: ...
+    @property
+    def inequalities_lin_set(self) -> Set[int]: ...
+    @property
+    def input_adjacency(self) -> Sequence[Set[int]]: ...
+    @property
+    def input_incidence(self) -> Sequence[Set[int]]: ...
     @property
     def rep_type(self) -> RepType: ...
+    @property
+    def row_order(self) -> RowOrderType: ...
+
+class RayLimitError(MemoryError):
+    iteration: int
+    num_rows: int
+    num_rays: int
+    max_rays: int
+    def __init__(
+        self, iteration: int, num_rows: int, num_rays: int, max_rays: int
+    ) -> None: ...
 
 class RepType(enum.IntEnum):
     GENERATOR: ClassVar[RepType] = ...
@@ -81,52 +117,134 @@ class RowOrderType(enum.IntEnum):
     MIX_CUTOFF: ClassVar[RowOrderType] = ...
     RANDOM_ROW: ClassVar[RowOrderType] = ...
 
-def block_elimination(mat: Matrix, col_set: Container[int]) -> Matrix: ...
+class TimeLimitError(TimeoutError):
+    iteration: int
+    num_rows: int
+    num_rays: int
+    elapsed: float
+    time_limit: float
+    def __init__(
+        self,
+        iteration: int,
+        num_rows: int,
+        num_rays: int,
+        elapsed: float,
+        time_limit: float,
+    ) -> None: ...
+
+def block_elimination(
+    mat: Matrix,
+    col_set: Container[int],
+    callback: Optional[Callable[[int, int, int, float], object]] = None,
+    time_limit: Optional[float] = None,
+    max_rays: Optional[int] = None,
+) -> Matrix: ...
 def copy_adjacency(poly: Polyhedron) -> Sequence[Set[int]]: ...
+def copy_adjacency_bitset(poly: Polyhedron) -> npt.NDArray[np.uint64]: ...
 def copy_generators(poly: Polyhedron) -> Matrix: ...
 def copy_incidence(poly: Polyhedron) -> Sequence[Set[int]]: ...
+def copy_incidence_bitset(poly: Polyhedron) -> npt.NDArray[np.uint64]: ...
 def copy_inequalities(poly: Polyhedron) -> Matrix: ...
 def copy_input(poly: Polyhedron) -> Matrix: ...
 def copy_input_adjacency(poly: Polyhedron) -> Sequence[Set[int]]: ...
+def copy_input_adjacency_bitset(poly: Polyhedron) -> npt.NDArray[np.uint64]: ...
 def copy_input_incidence(poly: Polyhedron) -> Sequence[Set[int]]: ...
+def copy_input_incidence_bitset(poly: Polyhedron) -> npt.NDArray[np.uint64]: ...
 def copy_output(poly: Polyhedron) -> Matrix: ...
-def fourier_elimination(mat: Matrix) -> Matrix: ...
+def f_vector(poly: Polyhedron, max_dim: Optional[int] = None) -> Sequence[int]: ...
+def face_lattice(
+    poly: Polyhedron, max_dim: Optional[int] = None, bitset: bool = False
+) -> Iterator[tuple[int, npt.NDArray[Union[np.intp, np.uint64]]]]: ...
+def fourier_elimination(
+    mat: Matrix, col_set: Optional[Container[int]] = None, prune: str = "none"
+) -> Matrix: ...
 def implicit_linearity(mat: Matrix, row: int) -> Optional[Sequence[NumberType]]: ...
-def implicit_linearity_rows(mat: Matrix) -> Set[int]: ...
+def implicit_linearity_rows(
+    mat: Matrix, max_workers: Optional[int] = 1
+) -> Set[int]: ...
 def linprog_from_array(
-    array: Sequence[Sequence[SupportsNumberType]], obj_type: LPObjType
+    array: Sequence[Sequence[SupportsNumberType]],
+    obj_type: LPObjType,
+    max_denominator: Optional[int] = None,
+    tolerance: Optional[float] = None,
 ) -> LinProg: ...
 def linprog_from_matrix(mat: Matrix) -> LinProg: ...
+def linprog_dual_solution_to_numpy(
+    lp: LinProg, out: Optional[NumberArray] = None
+) -> NumberArray: ...
+def linprog_primal_solution_to_numpy(
+    lp: LinProg, out: Optional[NumberArray] = None
+) -> NumberArray: ...
 def linprog_solve(
     lp: LinProg, solver: LPSolverType = LPSolverType.DUAL_SIMPLEX
 ) -> None: ...
+def linprog_solve_many(
+    arrays: Iterable[Sequence[Sequence[SupportsNumberType]]],
+    obj_type: LPObjType,
+    solver: LPSolverType = LPSolverType.DUAL_SIMPLEX,
+) -> tuple[npt.NDArray[np.int64], NumberArray, NumberArray]: ...
+def linprog_to_file(lp: LinProg, path: Union[str, os.PathLike[str]]) -> None: ...
+def linprog_to_numpy(lp: LinProg, out: Optional[NumberArray] = None) -> NumberArray: ...
 def matrix_adjacency(mat: Matrix) -> Sequence[Set[int]]: ...
+def matrix_adjacency_bitset(mat: Matrix) -> npt.NDArray[np.uint64]: ...
 def matrix_append_to(mat1: Matrix, mat2: Matrix) -> None: ...
 def matrix_canonicalize(
-    mat: Matrix,
+    mat: Matrix, dedup: bool = False
 ) -> tuple[Set[int], Set[int], Sequence[Optional[int]]]: ...
 def matrix_canonicalize_linearity(
     mat: Matrix,
 ) -> tuple[Set[int], Sequence[Optional[int]]]: ...
 def matrix_copy(mat: Matrix) -> Matrix: ...
+def matrix_dedup(mat: Matrix) -> tuple[Set[int], Sequence[Optional[int]]]: ...
 def matrix_from_array(
     array: Sequence[Sequence[SupportsNumberType]],
     lin_set: Container[int] = (),
     rep_type: RepType = RepType.UNSPECIFIED,
     obj_type: LPObjType = LPObjType.NONE,
     obj_func: Optional[Sequence[SupportsNumberType]] = None,
+    max_denominator: Optional[int] = None,
+    tolerance: Optional[float] = None,
 ) -> Matrix: ...
+def matrix_from_file(path: Union[str, os.PathLike[str]]) -> Matrix: ...
 def matrix_rank(
     mat: Matrix, ignored_rows: Container[int] = (), ignored_cols: Container[int] = ()
 ) -> tuple[Set[int], Set[int], int]: ...
 def matrix_redundancy_remove(
     mat: Matrix,
+    method: str = "lp",
+    interior_point: Optional[Sequence[SupportsNumberType]] = None,
+    dedup: bool = False,
 ) -> tuple[Set[int], Sequence[Optional[int]]]: ...
+def matrix_to_file(mat: Matrix, path: Union[str, os.PathLike[str]]) -> None: ...
+def matrix_to_numpy(mat: Matrix, out: Optional[NumberArray] = None) -> NumberArray: ...
 def matrix_weak_adjacency(mat: Matrix) -> Sequence[Set[int]]: ...
+def matrix_weak_adjacency_bitset(mat: Matrix) -> npt.NDArray[np.uint64]: ...
+def output_size_bound(num_rows: int, num_cols: int, rep_type: RepType) -> int: ...
+def polyhedron_append_rows(poly: Polyhedron, mat: Matrix) -> None: ...
+def polyhedron_clear_cache(poly: Polyhedron) -> None: ...
+def polyhedron_facet_graph(
+    poly: Polyhedron,
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]: ...
 def polyhedron_from_matrix(
-    mat: Matrix, row_order: Optional[RowOrderType] = None
+    mat: Matrix,
+    row_order: Optional[Union[RowOrderType, str]] = None,
+    seed: Optional[int] = None,
+    callback: Optional[Callable[[int, int, int, float], object]] = None,
+    time_limit: Optional[float] = None,
+    max_rays: Optional[int] = None,
 ) -> Polyhedron: ...
+def polyhedron_to_file(
+    poly: Polyhedron, path: Union[str, os.PathLike[str]]
+) -> None: ...
+def polyhedron_vertex_graph(
+    poly: Polyhedron,
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]: ...
 def redundant(mat: Matrix, row: int) -> Sequence[NumberType] | None: ...
-def redundant_rows(mat: Matrix) -> Set[int]: ...
+def redundant_rows(
+    mat: Matrix,
+    method: str = "lp",
+    interior_point: Optional[Sequence[SupportsNumberType]] = None,
+    max_workers: Optional[int] = 1,
+) -> Set[int]: ...
 def s_redundant(mat: Matrix, row: int) -> Optional[Sequence[NumberType]]: ...
-def s_redundant_rows(mat: Matrix) -> Set[int]: ...
+def s_redundant_rows(mat: Matrix, max_workers: Optional[int] = 1) -> Set[int]: ...
@@ -4,6 +4,8 @@ from typing import Union
 
 import pytest
 
+import cdd
+
 # https://peps.python.org/pep-0484/#the-numeric-tower
 # numbers.Real and numbers.Rational are broken with mypy
 Real = Union[float, Fraction]
@@ -23,3 +25,9 @@ def assert_matrix_almost_equal(
     assert len(mat1) == len(mat2)
     for row1, row2 in zip(mat1, mat2):
         assert_vector_almost_equal(row1, row2)
+
+
+# cyclic polytope, its points on the moment curve
+def cyclic_polytope(num_points: int) -> cdd.Matrix:
+    array = [[1, t, t * t, t**3, t**4] for t in range(num_points)]
+    return cdd.matrix_from_array(array, rep_type=cdd.RepType.GENERATOR)
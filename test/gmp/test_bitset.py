@@ -0,0 +1,28 @@
+from fractions import Fraction
+
+import numpy as np
+
+import cdd
+import cdd.gmp
+
+
+def test_bitset_gmp() -> None:
+    # square with a redundant point in the middle
+    mat = cdd.gmp.matrix_from_array(
+        [[1, 0, 0], [1, 1, 0], [1, 1, 1], [1, 0, 1], [1, Fraction(1, 2), 0]],
+        rep_type=cdd.RepType.GENERATOR,
+    )
+    poly = cdd.gmp.polyhedron_from_matrix(mat)
+    for bitset_func, set_func in [
+        (cdd.gmp.copy_adjacency_bitset, cdd.gmp.copy_adjacency),
+        (cdd.gmp.copy_input_adjacency_bitset, cdd.gmp.copy_input_adjacency),
+        (cdd.gmp.copy_incidence_bitset, cdd.gmp.copy_incidence),
+        (cdd.gmp.copy_input_incidence_bitset, cdd.gmp.copy_input_incidence),
+    ]:
+        bits = bitset_func(poly)
+        assert bits.dtype == np.dtype("<u8")
+        assert bits.tolist() == [[sum(1 << j for j in s)] for s in set_func(poly)]
+    bits = cdd.gmp.matrix_weak_adjacency_bitset(mat)
+    assert bits.tolist() == [
+        [sum(1 << j for j in s)] for s in cdd.gmp.matrix_weak_adjacency(mat)
+    ]
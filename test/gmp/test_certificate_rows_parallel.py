@@ -0,0 +1,32 @@
+import random
+from collections.abc import Callable, Set
+
+import cdd
+import cdd.gmp
+
+
+def test_certificate_rows_parallel_random() -> None:
+    rng = random.Random(0)
+    for rep_type in [cdd.RepType.INEQUALITY, cdd.RepType.GENERATOR]:
+        array: list[list[int]] = []
+        for _ in range(30):
+            if array and rng.random() < 0.2:
+                # duplicate or scaled copy of an earlier row
+                array.append([rng.randint(1, 2) * x for x in rng.choice(array)])
+            else:
+                array.append(
+                    [rng.randint(0, 6)] + [rng.randint(-3, 3) for _ in range(3)]
+                )
+        mat = cdd.gmp.matrix_from_array(array, rep_type=rep_type)
+        funcs: list[Callable[..., Set[int]]] = [
+            cdd.gmp.redundant_rows,
+            cdd.gmp.s_redundant_rows,
+            cdd.gmp.implicit_linearity_rows,
+        ]
+        for func in funcs:
+            assert func(mat, max_workers=None) == func(mat)
+
+
+def test_certificate_rows_parallel_no_module_leak() -> None:
+    for name in ["itertools", "math", "multiprocessing", "operator", "cdd"]:
+        assert not hasattr(cdd.gmp, name)
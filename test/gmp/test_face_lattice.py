@@ -0,0 +1,37 @@
+from fractions import Fraction
+
+import cdd
+import cdd.gmp
+
+
+def test_face_lattice_gmp() -> None:
+    # square with a redundant point on an edge
+    mat = cdd.gmp.matrix_from_array(
+        [[1, 0, 0], [1, 1, 0], [1, 1, 1], [1, 0, 1], [1, Fraction(1, 2), 0]],
+        rep_type=cdd.RepType.GENERATOR,
+    )
+    poly = cdd.gmp.polyhedron_from_matrix(mat)
+    assert cdd.gmp.f_vector(poly) == [1, 4, 4, 1]
+    assert cdd.gmp.f_vector(poly, max_dim=0) == [1, 4]
+    faces = sorted(
+        (dim, vertices.tolist()) for dim, vertices in cdd.gmp.face_lattice(poly)
+    )
+    assert faces == [
+        (-1, []),
+        (0, [0]),
+        (0, [1]),
+        (0, [2]),
+        (0, [3]),
+        (1, [0, 1]),
+        (1, [0, 3]),
+        (1, [1, 2]),
+        (1, [2, 3]),
+        (2, [0, 1, 2, 3]),
+    ]
+    assert (
+        sorted(
+            (dim, vertices.tolist())
+            for dim, vertices in cdd.gmp.face_lattice(poly, max_dim=1)
+        )
+        == faces[:-1]
+    )
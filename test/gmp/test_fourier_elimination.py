@@ -0,0 +1,39 @@
+import random
+from fractions import Fraction
+
+import pytest
+
+import cdd
+import cdd.gmp
+
+
+def canonical_rows(mat: cdd.gmp.Matrix) -> list[list[Fraction]]:
+    mat = cdd.gmp.matrix_copy(mat)
+    cdd.gmp.matrix_canonicalize(mat)
+    assert not mat.lin_set
+    return sorted(
+        [Fraction(x) / max(abs(y) for y in row[1:]) for x in row] for row in mat.array
+    )
+
+
+@pytest.mark.parametrize("prune", ["none", "lp", "shooting"])
+def test_fourier_elimination_col_set_random(prune: str) -> None:
+    # projections of random polytopes agree with block elimination
+    rng = random.Random(0)
+    for _ in range(30):
+        n = rng.randint(2, 5)
+        array = [
+            [5] + [sign if j == i else 0 for j in range(n)]
+            for i in range(n)
+            for sign in (-1, 1)
+        ] + [
+            [rng.randint(0, 6)] + [rng.randint(-3, 3) for _ in range(n)]
+            for _ in range(rng.randint(0, 6))
+        ]
+        mat = cdd.gmp.matrix_from_array(array, rep_type=cdd.RepType.INEQUALITY)
+        col_set = set(rng.sample(range(1, n + 1), rng.randint(1, n - 1)))
+        mat1 = cdd.gmp.fourier_elimination(mat, col_set, prune=prune)
+        mat2 = cdd.gmp.block_elimination(mat, col_set)
+        assert canonical_rows(mat1) == canonical_rows(mat2)
+        if prune != "none":
+            assert not cdd.gmp.redundant_rows(mat1)
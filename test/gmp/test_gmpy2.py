@@ -1,6 +1,10 @@
+import contextvars
+import threading
 from collections.abc import Sequence
+from fractions import Fraction
 from test.gmp import assert_matrix_exactly_equal
 
+import pytest
 from gmpy2 import mpq
 
 import cdd
@@ -17,3 +21,48 @@ def test_numpy() -> None:
     cdd_poly = cdd.gmp.polyhedron_from_matrix(mat)
     ineq = cdd.gmp.copy_inequalities(cdd_poly).array
     assert_matrix_exactly_equal(ref_ineq, ineq)
+
+
+def test_output_type() -> None:
+    mat = cdd.gmp.matrix_from_array([[1, Fraction(-2, 3), Fraction(-(10**100), 7**90)]])
+    assert cdd.gmp.get_output_type() is Fraction
+    try:
+        cdd.gmp.set_output_type(mpq)
+        assert cdd.gmp.get_output_type() is mpq
+        array = mat.array
+        assert all(type(x) is mpq for x in array[0])
+        assert array == [[mpq(1), mpq(-2, 3), mpq(-(10**100), 7**90)]]
+    finally:
+        cdd.gmp.set_output_type(Fraction)
+    assert all(type(x) is Fraction for x in mat.array[0])
+
+
+def test_output_type_invalid() -> None:
+    with pytest.raises(ValueError, match="output type"):
+        cdd.gmp.set_output_type(float)
+    assert cdd.gmp.get_output_type() is Fraction
+
+
+def test_output_type_context() -> None:
+    mat = cdd.gmp.matrix_from_array([[1, Fraction(-2, 3)]])
+
+    def array_types() -> list[type]:
+        cdd.gmp.set_output_type(mpq)
+        return [type(x) for x in mat.array[0]]
+
+    # the setting does not leak out of its context
+    assert contextvars.copy_context().run(array_types) == [mpq, mpq]
+    assert cdd.gmp.get_output_type() is Fraction
+    assert all(type(x) is Fraction for x in mat.array[0])
+    # nor into other threads
+    try:
+        cdd.gmp.set_output_type(mpq)
+        types: list[type] = []
+        thread = threading.Thread(
+            target=lambda: types.extend(type(x) for x in mat.array[0])
+        )
+        thread.start()
+        thread.join()
+        assert types == [Fraction, Fraction]
+    finally:
+        cdd.gmp.set_output_type(Fraction)
@@ -0,0 +1,25 @@
+from fractions import Fraction
+
+import cdd
+import cdd.gmp
+
+
+def test_graph_gmp() -> None:
+    # square with a redundant point on an edge
+    mat = cdd.gmp.matrix_from_array(
+        [[1, 0, 0], [1, 1, 0], [1, 1, 1], [1, 0, 1], [1, Fraction(1, 2), 0]],
+        rep_type=cdd.RepType.GENERATOR,
+    )
+    poly = cdd.gmp.polyhedron_from_matrix(mat)
+    indptr, indices = cdd.gmp.polyhedron_vertex_graph(poly)
+    assert indptr.tolist() == [0, 2, 4, 6, 8, 8]
+    assert indices.tolist() == [1, 3, 0, 2, 1, 3, 0, 2]
+    # same as linear programming for the non-redundant points
+    graph = [set(indices[i:j].tolist()) for i, j in zip(indptr[:-1], indptr[1:])]
+    assert graph[:4] == cdd.gmp.matrix_adjacency(mat)[:4]
+    indptr, indices = cdd.gmp.polyhedron_facet_graph(poly)
+    graph = [set(indices[i:j].tolist()) for i, j in zip(indptr[:-1], indptr[1:])]
+    assert graph == [{1, 3}, {0, 2}, {1, 3}, {0, 2}]
+    assert graph == [
+        set(adj) - {k} for k, adj in enumerate(cdd.gmp.copy_adjacency(poly))
+    ]
@@ -1,5 +1,7 @@
 from fractions import Fraction
 
+import pytest
+
 import cdd.gmp
 
 from . import assert_matrix_exactly_equal
@@ -8,3 +10,37 @@ from . import assert_matrix_exactly_equal
 def test_gmp_large_number() -> None:
     mat = cdd.gmp.matrix_from_array([[10**100, Fraction(10**100, 13**90)]])
     assert_matrix_exactly_equal(mat.array, [[10**100, Fraction(10**100, 13**90)]])
+
+
+def test_gmp_large_number_sign() -> None:
+    array: list[list[Fraction]] = [
+        [
+            Fraction(-(2**64)),
+            Fraction(2**64 - 1),
+            Fraction(-(3**200), 2**63),
+            Fraction(1, -(5**50)),
+        ]
+    ]
+    mat = cdd.gmp.matrix_from_array(array)
+    assert_matrix_exactly_equal(mat.array, array)
+
+
+class Rational:
+    def __init__(self, numerator: int, denominator: int) -> None:
+        self.numerator = numerator
+        self.denominator = denominator
+
+
+@pytest.mark.parametrize(
+    "numerator,denominator",
+    [(3, -6), (-(2**70), -3), (2**70, 3**50), (-1, -(2**70))],
+)
+def test_gmp_large_number_denominator(numerator: int, denominator: int) -> None:
+    mat = cdd.gmp.matrix_from_array([[Rational(numerator, denominator)]])
+    assert mat.array == [[Fraction(numerator, denominator)]]
+
+
+@pytest.mark.parametrize("numerator", [1, 2**70])
+def test_gmp_large_number_zero_denominator(numerator: int) -> None:
+    with pytest.raises(ZeroDivisionError):
+        cdd.gmp.matrix_from_array([[Rational(numerator, 0)]])
@@ -0,0 +1,34 @@
+from fractions import Fraction
+
+import pytest
+
+from cdd import LPObjType, LPStatusType
+from cdd.gmp import linprog_from_array, linprog_solve
+
+
+@pytest.mark.parametrize("obj_type", [LPObjType.MAX, LPObjType.MIN])
+def test_linprog_obj_func_warm_start(obj_type: LPObjType) -> None:
+    # triangle x >= 0, y >= 0, x + 2y <= 1
+    array: list[list[Fraction]] = [
+        [Fraction(x) for x in row]
+        for row in [[0, 1, 0], [0, 0, 1], [1, -1, -2], [0, 1, 1]]
+    ]
+    lp = linprog_from_array(array, obj_type=obj_type)
+    linprog_solve(lp)
+    assert lp.status == LPStatusType.OPTIMAL
+    obj_funcs: list[list[Fraction]] = [
+        [Fraction(0), Fraction(1), Fraction(0)],
+        [Fraction(0), Fraction(-1), Fraction(3)],
+        [Fraction(1, 3), Fraction(1), Fraction(1)],
+        [Fraction(0), Fraction(-1), Fraction(-1)],
+    ]
+    for obj_func in obj_funcs:
+        lp.obj_func = obj_func
+        assert lp.obj_func == obj_func
+        linprog_solve(lp)
+        lp_cold = linprog_from_array(array[:-1] + [obj_func], obj_type=obj_type)
+        linprog_solve(lp_cold)
+        assert lp.status == LPStatusType.OPTIMAL
+        assert lp.obj_value == lp_cold.obj_value
+        x = [1] + list(lp.primal_solution)
+        assert sum(c * v for c, v in zip(obj_func, x)) == lp.obj_value
@@ -0,0 +1,43 @@
+from collections.abc import Sequence
+from fractions import Fraction
+
+import numpy as np
+import numpy.typing as npt
+
+import cdd
+import cdd.gmp
+
+# max 2 - x subject to -1/2 + x >= 0,  2 - x >= 0, and variations
+ARRAYS: Sequence[Sequence[Sequence[Fraction]]] = [
+    [[Fraction(-1, 2), Fraction(1)], [Fraction(2), Fraction(-1)]] * 2,
+    [[Fraction(-3), Fraction(1)], [Fraction(2), Fraction(-1)]] * 2,  # inconsistent
+]
+
+
+def test_linprog_solve_many() -> None:
+    statuses, obj_values, primal_solutions = cdd.gmp.linprog_solve_many(
+        ARRAYS, cdd.LPObjType.MAX
+    )
+    assert obj_values.dtype == object
+    assert primal_solutions.dtype == object
+    for i, array in enumerate(ARRAYS):
+        lp = cdd.gmp.linprog_from_array(array, obj_type=cdd.LPObjType.MAX)
+        cdd.gmp.linprog_solve(lp)
+        assert statuses[i] == lp.status
+        assert obj_values[i] == lp.obj_value
+        assert list(primal_solutions[i]) == lp.primal_solution
+    assert statuses[0] == cdd.LPStatusType.OPTIMAL
+    assert obj_values[0] == Fraction(3, 2)
+    assert list(primal_solutions[0]) == [Fraction(1, 2)]
+
+
+def test_linprog_solve_many_int64() -> None:
+    arrays: npt.NDArray[np.int64] = np.array(
+        [[[-1, 1], [2, -1], [0, 1]], [[-1, 2], [3, -1], [0, 1]]], dtype=np.int64
+    )
+    statuses, obj_values, primal_solutions = cdd.gmp.linprog_solve_many(
+        arrays, cdd.LPObjType.MIN  # type: ignore
+    )
+    assert list(statuses) == [cdd.LPStatusType.OPTIMAL] * 2
+    assert list(obj_values) == [Fraction(1), Fraction(1, 2)]
+    assert primal_solutions.tolist() == [[Fraction(1)], [Fraction(1, 2)]]
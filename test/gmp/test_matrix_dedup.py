@@ -0,0 +1,44 @@
+import random
+from fractions import Fraction
+from typing import Union
+
+import cdd
+import cdd.gmp
+
+
+def test_matrix_dedup() -> None:
+    array: list[list[Union[int, Fraction]]] = [
+        [Fraction(1, 3), Fraction(2, 3), 1],
+        [1, 2, 3],
+        [2, 4, 6],
+        [-1, -2, -3],
+        [1, 2, 4],
+    ]
+    mat = cdd.gmp.matrix_from_array(array, rep_type=cdd.RepType.GENERATOR)
+    assert cdd.gmp.matrix_dedup(mat) == ({1, 2}, [0, None, None, 1, 2])
+    assert mat.array == [array[0], array[3], array[4]]
+
+
+def test_matrix_canonicalize_dedup_random() -> None:
+    rng = random.Random(0)
+    for _ in range(20):
+        array: list[list[int]] = []
+        for _ in range(rng.randint(1, 20)):
+            if array and rng.random() < 0.5:
+                array.append([rng.randint(1, 3) * x for x in rng.choice(array)])
+            else:
+                array.append(
+                    [rng.randint(0, 5)] + [rng.randint(-2, 2) for _ in range(3)]
+                )
+        mat1 = cdd.gmp.matrix_from_array(array, rep_type=cdd.RepType.INEQUALITY)
+        mat2 = cdd.gmp.matrix_from_array(array, rep_type=cdd.RepType.INEQUALITY)
+        removed, _ = cdd.gmp.matrix_dedup(cdd.gmp.matrix_copy(mat1))
+        cdd.gmp.matrix_canonicalize(mat1)
+        _, red, newpos = cdd.gmp.matrix_canonicalize(mat2, dedup=True)
+        assert removed <= red
+        for i, pos in enumerate(newpos):
+            if pos is not None:
+                assert mat2.array[pos] == array[i]
+        cdd.gmp.matrix_normalize(mat1)
+        cdd.gmp.matrix_normalize(mat2)
+        assert sorted(map(list, mat1.array)) == sorted(map(list, mat2.array))
@@ -0,0 +1,73 @@
+from fractions import Fraction
+from pathlib import Path
+
+import pytest
+
+import cdd
+import cdd.gmp
+
+
+def test_matrix_from_file(tmp_path: Path) -> None:
+    mat = cdd.gmp.matrix_from_array(
+        [[1, Fraction(1, 3), -2], [0, Fraction(-7, 2), 10**30]],
+        lin_set=[0],
+        rep_type=cdd.RepType.GENERATOR,
+    )
+    path = tmp_path / "test.ext"
+    path.write_text(str(mat))
+    mat2 = cdd.gmp.matrix_from_file(path)
+    assert mat2.array == mat.array
+    assert mat2.lin_set == {0}
+    assert mat2.rep_type == cdd.RepType.GENERATOR
+
+
+@pytest.mark.parametrize(
+    "number,value",
+    [
+        ("3", Fraction(3)),
+        ("+3", Fraction(3)),
+        ("-6/4", Fraction(-3, 2)),
+        ("0.1", Fraction(1, 10)),
+        ("-.25", Fraction(-1, 4)),
+        ("2.", Fraction(2)),
+        ("1.5e3", Fraction(1500)),
+        ("-15E-1", Fraction(-3, 2)),
+        ("123456789012345678901234567890", Fraction(123456789012345678901234567890)),
+        ("1e1000", Fraction(10**1000)),
+        ("-2.5e-1000", Fraction(-25, 10**1001)),
+    ],
+)
+def test_matrix_from_file_number(tmp_path: Path, number: str, value: Fraction) -> None:
+    path = tmp_path / "test.ine"
+    path.write_text(f"begin\n1 2 real\n1 {number}\nend\n")
+    assert cdd.gmp.matrix_from_file(path).array == [[1, value]]
+
+
+@pytest.mark.parametrize("number", ["x", "1/0", "1/+2", "1e", ".", "-", "1.5.2", "nan"])
+def test_matrix_from_file_bad_number(tmp_path: Path, number: str) -> None:
+    path = tmp_path / "test.ine"
+    path.write_text(f"begin\n1 2 rational\n1 {number}\nend\n")
+    with pytest.raises(ValueError, match="line 3: invalid number"):
+        cdd.gmp.matrix_from_file(path)
+
+
+# exponents are bounded, as huge powers of ten would exhaust time and memory
+@pytest.mark.parametrize(
+    "number", ["1e1001", "1e-1001", "1e9999999999", "1e99999999999999999999999"]
+)
+def test_matrix_from_file_bad_exponent(tmp_path: Path, number: str) -> None:
+    path = tmp_path / "test.ine"
+    path.write_text(f"begin\n1 2 rational\n1 {number}\nend\n")
+    with pytest.raises(ValueError, match="line 3: invalid number"):
+        cdd.gmp.matrix_from_file(path)
+
+
+def test_matrix_to_file(tmp_path: Path) -> None:
+    mat = cdd.gmp.matrix_from_array(
+        [[1, Fraction(1, 3), -2], [0, Fraction(-7, 2), 10**30]],
+        rep_type=cdd.RepType.INEQUALITY,
+    )
+    path = tmp_path / "test.ine"
+    cdd.gmp.matrix_to_file(mat, path)
+    assert path.read_text() == str(mat) + "\n"
+    assert cdd.gmp.matrix_from_file(path).array == mat.array
@@ -0,0 +1,36 @@
+import random
+
+import pytest
+
+import cdd
+import cdd.gmp
+
+
+def test_polyhedron_max_rays() -> None:
+    array = [[1, t, t * t, t**3] for t in range(10)]
+    mat = cdd.gmp.matrix_from_array(array, rep_type=cdd.RepType.GENERATOR)
+    with pytest.raises(cdd.gmp.RayLimitError):
+        cdd.gmp.polyhedron_from_matrix(mat, max_rays=8)
+    assert cdd.gmp.RayLimitError is cdd.RayLimitError
+    bound = cdd.gmp.output_size_bound(10, 4, cdd.RepType.GENERATOR)
+    assert bound == 16  # 2 * 10 - 4
+    poly = cdd.gmp.polyhedron_from_matrix(mat, max_rays=2 * bound)
+    assert poly.inequalities == cdd.gmp.polyhedron_from_matrix(mat).inequalities
+    assert len(poly.inequalities) == bound
+
+
+def test_output_size_bound_random() -> None:
+    # the bound holds for the output of random matrices
+    rng = random.Random(0)
+    for _ in range(100):
+        numrows = rng.randint(1, 8)
+        numcols = rng.randint(2, 5)
+        rep_type = rng.choice([cdd.RepType.INEQUALITY, cdd.RepType.GENERATOR])
+        array = [
+            [rng.randint(0, 1)] + [rng.randint(-3, 3) for _ in range(numcols - 1)]
+            for _ in range(numrows)
+        ]
+        mat = cdd.gmp.matrix_from_array(array, rep_type=rep_type)
+        bound = cdd.gmp.output_size_bound(numrows, numcols, rep_type)
+        poly = cdd.gmp.polyhedron_from_matrix(mat, max_rays=2 * bound)
+        assert len(cdd.gmp.copy_output(poly).array) <= bound
@@ -0,0 +1,105 @@
+import itertools
+import random
+from collections.abc import Sequence
+from fractions import Fraction
+
+import pytest
+
+import cdd
+import cdd.gmp
+
+
+def assert_output_equal(mat: cdd.gmp.Matrix, mixed: cdd.gmp.Matrix) -> None:
+    exact = cdd.gmp.copy_output(cdd.gmp.polyhedron_from_matrix(mat))
+    assert sorted(map(tuple, mixed.array)) == sorted(map(tuple, exact.array))
+    assert mixed.lin_set == exact.lin_set
+    assert mixed.rep_type == exact.rep_type
+
+
+def cube(dim: int) -> list[list[int]]:
+    return [[1, *point] for point in itertools.product([0, 1], repeat=dim)]
+
+
+def cross_polytope(dim: int) -> list[list[int]]:
+    return [[1, *point] for point in itertools.product([-1, 1], repeat=dim)]
+
+
+@pytest.mark.parametrize(
+    "array,rep_type",
+    [
+        (cube(3), cdd.RepType.GENERATOR),
+        (cross_polytope(3), cdd.RepType.INEQUALITY),
+        # degenerate vertices
+        (cube(3), cdd.RepType.INEQUALITY),
+        (cross_polytope(3), cdd.RepType.GENERATOR),
+        # unbounded
+        ([[0, 1, 0], [0, 0, 1], [-1, 1, 1]], cdd.RepType.INEQUALITY),
+        (
+            [[1, 0, 0], [1, 3, 0], [1, 0, 3], [0, Fraction(2, 3), Fraction(4, 3)]],
+            cdd.RepType.GENERATOR,
+        ),
+    ],
+)
+def test_mixed_certified(
+    array: Sequence[Sequence[Fraction]], rep_type: cdd.RepType
+) -> None:
+    mat = cdd.gmp.matrix_from_array(array, rep_type=rep_type)
+    mixed, certified = cdd.gmp.polyhedron_output_mixed(mat)
+    assert certified
+    assert_output_equal(mat, mixed)
+
+
+@pytest.mark.parametrize(
+    "array,rep_type",
+    [
+        # empty
+        ([[-1, 1], [-1, -1]], cdd.RepType.INEQUALITY),
+        # contains a line
+        ([[0, 1, 0]], cdd.RepType.INEQUALITY),
+        # not full dimensional
+        ([[1, 0, 0], [1, 1, 0]], cdd.RepType.GENERATOR),
+        # floating point drops the last inequality
+        (
+            [
+                [1, -1, 0],
+                [1, 0, -1],
+                [0, 1, 0],
+                [0, 0, 1],
+                [2 - Fraction(1, 10**30), -1, -1],
+            ],
+            cdd.RepType.INEQUALITY,
+        ),
+    ],
+)
+def test_mixed_not_certified(
+    array: Sequence[Sequence[Fraction]], rep_type: cdd.RepType
+) -> None:
+    mat = cdd.gmp.matrix_from_array(array, rep_type=rep_type)
+    mixed, certified = cdd.gmp.polyhedron_output_mixed(mat)
+    assert not certified
+    assert_output_equal(mat, mixed)
+
+
+def test_mixed_lin_set() -> None:
+    array = [[1, -1, 0, 0], [0, 1, 0, 0], [1, 0, -1, 0], [0, 0, 1, 0], [0, 1, 1, -1]]
+    mat = cdd.gmp.matrix_from_array(array, lin_set={4}, rep_type=cdd.RepType.INEQUALITY)
+    mixed, certified = cdd.gmp.polyhedron_output_mixed(mat)
+    assert certified
+    assert_output_equal(mat, mixed)
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("rep_type", [cdd.RepType.INEQUALITY, cdd.RepType.GENERATOR])
+def test_mixed_random(seed: int, rep_type: cdd.RepType) -> None:
+    rng = random.Random(seed)
+    dim = rng.randint(2, 4)
+    array = [
+        [Fraction(1)]
+        + [Fraction(rng.randint(-9, 9), rng.randint(1, 3)) for _ in range(dim)]
+        for _ in range(rng.randint(dim + 1, 12))
+    ]
+    mat = cdd.gmp.matrix_from_array(array, rep_type=rep_type)
+    mixed = cdd.gmp.polyhedron_output_mixed(mat, row_order=cdd.RowOrderType.MAX_INDEX)[
+        0
+    ]
+    assert_output_equal(mat, mixed)
@@ -0,0 +1,76 @@
+from fractions import Fraction
+
+import pytest
+
+import cdd
+import cdd.gmp
+
+
+def test_matrix_normalize_primitive_integer() -> None:
+    mat = cdd.gmp.matrix_from_array(
+        [
+            [Fraction(1, 2), Fraction(-3, 4), 0],
+            [0, 0, 0],
+            [0, Fraction(-6, 5), Fraction(2, 5)],
+            [6, -4, 2 * 10**30],
+        ],
+        obj_func=[Fraction(1, 2), 1, 1],
+    )
+    cdd.gmp.matrix_normalize(mat)
+    assert mat.array == [[2, -3, 0], [0, 0, 0], [0, -3, 1], [3, -2, 10**30]]
+    assert mat.obj_func == [Fraction(1, 2), 1, 1]
+
+
+def test_matrix_normalize_leading_unit() -> None:
+    mat = cdd.gmp.matrix_from_array(
+        [[Fraction(1, 2), Fraction(-3, 4), 0], [0, 0, 0], [0, -6, 2]]
+    )
+    cdd.gmp.matrix_normalize(mat, mode="leading_unit")
+    assert mat.array == [
+        [1, Fraction(-3, 2), 0],
+        [0, 0, 0],
+        [0, -1, Fraction(1, 3)],
+    ]
+
+
+def test_matrix_normalize_invalid_mode() -> None:
+    mat = cdd.gmp.matrix_from_array([[1, 2]])
+    with pytest.raises(ValueError, match="mode"):
+        cdd.gmp.matrix_normalize(mat, mode="integer")
+
+
+@pytest.mark.parametrize("mode", ["primitive_integer", "leading_unit"])
+def test_copy_normalize(mode: str) -> None:
+    # triangle with vertices that have large denominators
+    array: list[list[Fraction]] = [
+        [Fraction(1), Fraction(1, 7), Fraction(2, 11)],
+        [Fraction(1), Fraction(5, 3), Fraction(1, 13)],
+        [Fraction(1), Fraction(3, 17), Fraction(7, 5)],
+    ]
+    mat = cdd.gmp.matrix_from_array(array, rep_type=cdd.RepType.GENERATOR)
+    poly = cdd.gmp.polyhedron_from_matrix(mat)
+    for copy in [
+        cdd.gmp.copy_inequalities,
+        cdd.gmp.copy_output,
+        cdd.gmp.copy_generators,
+        cdd.gmp.copy_input,
+    ]:
+        mat1 = copy(poly)
+        mat2 = copy(poly, normalize=mode)
+        assert mat1.rep_type == mat2.rep_type
+        assert mat1.lin_set == mat2.lin_set
+        for row1, row2 in zip(mat1.array, mat2.array):
+            factor = next(x / y for x, y in zip(row2, row1) if y)
+            assert factor > 0
+            assert row2 == [factor * x for x in row1]
+            if mode == "primitive_integer":
+                assert all(x.denominator == 1 for x in row2)
+            else:
+                assert abs(next(x for x in row2 if x)) == 1
+
+
+def test_copy_normalize_float() -> None:
+    mat = cdd.matrix_from_array([[1, 0], [1, 1]], rep_type=cdd.RepType.GENERATOR)
+    poly = cdd.polyhedron_from_matrix(mat)
+    with pytest.raises(ValueError, match="cdd.gmp"):
+        cdd.copy_output(poly, normalize="leading_unit")  # type: ignore
@@ -1,8 +1,13 @@
+from collections.abc import Sequence
+from fractions import Fraction
+
 import numpy as np
 import numpy.typing as npt
+import pytest
 
 import cdd
 import cdd.gmp
+from cdd.gmp import SupportsNumberType
 
 
 def test_numpy() -> None:
@@ -17,3 +22,63 @@ def test_numpy() -> None:
     cdd_poly = cdd.gmp.polyhedron_from_matrix(mat)
     ineq = np.array(cdd.gmp.copy_inequalities(cdd_poly).array)
     assert ((ref_ineq - ineq) == 0).all()
+
+
+def test_matrix_from_numpy_int64() -> None:
+    big = np.iinfo(np.int64).max
+    small = np.iinfo(np.int64).min
+    arr: npt.NDArray[np.int64] = np.array([[1, -2, 3], [big, small, 0]], dtype=np.int64)
+    mat = cdd.gmp.matrix_from_array(arr)  # type: ignore
+    assert mat.array == [
+        [Fraction(1), Fraction(-2), Fraction(3)],
+        [Fraction(big), Fraction(small), Fraction(0)],
+    ]
+    mat = cdd.gmp.matrix_from_array(arr[:, ::2])  # type: ignore
+    assert mat.array == [[1, 3], [big, 0]]
+
+
+def test_linprog_from_numpy_int64() -> None:
+    arr: npt.NDArray[np.int64] = np.array([[-2, 1], [3, -1], [0, 1]], dtype=np.int64)
+    lp = cdd.gmp.linprog_from_array(arr, obj_type=cdd.LPObjType.MAX)  # type: ignore
+    assert lp.array == arr.tolist()
+    cdd.gmp.linprog_solve(lp)
+    assert lp.obj_value == 3
+
+
+def test_matrix_from_numpy_float64() -> None:
+    with pytest.raises(AttributeError):
+        cdd.gmp.matrix_from_array(np.array([[1.5]]))  # type: ignore
+
+
+def test_matrix_to_numpy() -> None:
+    array: Sequence[Sequence[Fraction]] = [
+        [Fraction(1, 2), Fraction(2)],
+        [Fraction(-3), Fraction(4, 3)],
+    ]
+    mat = cdd.gmp.matrix_from_array(array)
+    arr = cdd.gmp.matrix_to_numpy(mat)
+    assert arr.dtype == object
+    assert arr.tolist() == array
+    assert all(isinstance(x, Fraction) for x in arr.flat)
+    out = np.empty((2, 2), dtype=object)
+    assert cdd.gmp.matrix_to_numpy(mat, out=out) is out
+    assert out.tolist() == array
+    with pytest.raises(ValueError, match="object"):
+        cdd.gmp.matrix_to_numpy(mat, out=np.zeros((2, 2)))  # type: ignore
+
+
+def test_linprog_to_numpy() -> None:
+    array: Sequence[Sequence[SupportsNumberType]] = [
+        [Fraction(4, 3), -2, -1],
+        [Fraction(2, 3), 0, -1],
+        [0, 1, 0],
+        [0, 0, 1],
+        [0, 3, 4],
+    ]
+    lp = cdd.gmp.linprog_from_array(array, obj_type=cdd.LPObjType.MAX)
+    assert cdd.gmp.linprog_to_numpy(lp).tolist() == array
+    cdd.gmp.linprog_solve(lp)
+    primal = cdd.gmp.linprog_primal_solution_to_numpy(lp)
+    assert primal.tolist() == [Fraction(1, 3), Fraction(2, 3)]
+    dual = cdd.gmp.linprog_dual_solution_to_numpy(lp)
+    assert dual.tolist() == [Fraction(3, 2), Fraction(5, 2), 0, 0]
@@ -0,0 +1,60 @@
+import pickle
+from fractions import Fraction
+
+import pytest
+
+import cdd
+import cdd.gmp
+
+
+@pytest.mark.parametrize("protocol", range(2, pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_matrix(protocol: int) -> None:
+    array = [
+        [Fraction(1, 3), Fraction(-2, 7), Fraction(0)],
+        [Fraction(10**40, 3**30), Fraction(-1), Fraction(5)],
+    ]
+    mat = pickle.loads(
+        pickle.dumps(
+            cdd.gmp.matrix_from_array(
+                array,
+                lin_set={1},
+                rep_type=cdd.RepType.INEQUALITY,
+                obj_type=cdd.LPObjType.MAX,
+                obj_func=[Fraction(1, 2), 0, 1],
+            ),
+            protocol=protocol,
+        )
+    )
+    assert mat.array == array
+    assert mat.lin_set == {1}
+    assert mat.rep_type == cdd.RepType.INEQUALITY
+    assert mat.obj_type == cdd.LPObjType.MAX
+    assert mat.obj_func == [Fraction(1, 2), 0, 1]
+
+
+@pytest.mark.parametrize("protocol", range(2, pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_linprog(protocol: int) -> None:
+    array = [[Fraction(1, 3), Fraction(2)], [Fraction(-5, 4), Fraction(0)]]
+    lp = pickle.loads(
+        pickle.dumps(
+            cdd.gmp.linprog_from_array(array, obj_type=cdd.LPObjType.MIN),
+            protocol=protocol,
+        )
+    )
+    assert lp.array == array
+    assert lp.obj_type == cdd.LPObjType.MIN
+
+
+@pytest.mark.parametrize(
+    "data", [b"1 2 ", b"1 ", b"1 2 3 ", b"1 2", b"1 1/0 ", b"1 x "]
+)
+def test_pickle_invalid(data: bytes) -> None:
+    mat = cdd.gmp.matrix_from_array([[1, 2]])
+    reduced = mat.__reduce_ex__(2)
+    assert isinstance(reduced, tuple)
+    func, args = reduced[:2]
+    if data == b"1 2 ":
+        assert func(data, *args[1:]).array == [[1, 2]]
+    else:
+        with pytest.raises(ValueError):
+            func(data, *args[1:])
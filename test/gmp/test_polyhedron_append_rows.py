@@ -0,0 +1,61 @@
+import random
+from fractions import Fraction
+
+import pytest
+
+import cdd
+import cdd.gmp
+
+
+def canonical_rows(mat: cdd.gmp.Matrix) -> list[tuple[bool, list[Fraction]]]:
+    mat = cdd.gmp.matrix_copy(mat)
+    cdd.gmp.matrix_canonicalize(mat)
+    cdd.gmp.matrix_normalize(mat)
+    return sorted((i in mat.lin_set, list(row)) for i, row in enumerate(mat.array))
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("rep_type", [cdd.RepType.INEQUALITY, cdd.RepType.GENERATOR])
+def test_polyhedron_append_rows_random(seed: int, rep_type: cdd.RepType) -> None:
+    rng = random.Random(seed)
+    dim = rng.randint(2, 4)
+
+    def row() -> list[int]:
+        return [1] + [rng.randint(-5, 5) for _ in range(dim)]
+
+    array1 = [row() for _ in range(rng.randint(dim + 1, 10))]
+    array2 = [row() for _ in range(rng.randint(1, 5))]
+    poly = cdd.gmp.polyhedron_from_matrix(
+        cdd.gmp.matrix_from_array(array1, rep_type=rep_type)
+    )
+    cdd.gmp.polyhedron_append_rows(poly, cdd.gmp.matrix_from_array(array2))
+    full = cdd.gmp.polyhedron_from_matrix(
+        cdd.gmp.matrix_from_array(array1 + array2, rep_type=rep_type)
+    )
+    assert cdd.gmp.copy_input(poly).array == array1 + array2
+    assert canonical_rows(cdd.gmp.copy_output(poly)) == canonical_rows(
+        cdd.gmp.copy_output(full)
+    )
+    assert len(cdd.gmp.copy_incidence(poly)) == len(cdd.gmp.copy_output(poly).array)
+
+
+def test_polyhedron_append_rows_repeated() -> None:
+    # cut the square [-1, 1]^2 one plane at a time
+    array: list[list[Fraction]] = [
+        [Fraction(x) for x in row]
+        for row in [[1, 1, 0], [1, -1, 0], [1, 0, 1], [1, 0, -1]]
+    ]
+    poly = cdd.gmp.polyhedron_from_matrix(
+        cdd.gmp.matrix_from_array(array, rep_type=cdd.RepType.INEQUALITY)
+    )
+    for k in range(1, 8):
+        # x * k / 8 + y * (1 - (k / 8) ** 2) <= 1
+        row = [Fraction(1), -Fraction(k, 8), Fraction(k, 8) ** 2 - 1]
+        cdd.gmp.polyhedron_append_rows(poly, cdd.gmp.matrix_from_array([row]))
+        array.append(row)
+    full = cdd.gmp.polyhedron_from_matrix(
+        cdd.gmp.matrix_from_array(array, rep_type=cdd.RepType.INEQUALITY)
+    )
+    assert canonical_rows(cdd.gmp.copy_generators(poly)) == canonical_rows(
+        cdd.gmp.copy_generators(full)
+    )
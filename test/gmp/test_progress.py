@@ -0,0 +1,37 @@
+import random
+
+import pytest
+
+import cdd
+import cdd.gmp
+
+
+def test_block_elimination_time_limit() -> None:
+    # the double description method with progress checks
+    # gives the same result as cddlib's block elimination
+    rng = random.Random(0)
+    for _ in range(50):
+        numcols = rng.randint(2, 6)
+        array = [
+            [rng.randint(0, 3)] + [rng.randint(-3, 3) for _ in range(numcols - 1)]
+            for _ in range(rng.randint(1, 8))
+        ]
+        lin_set = {i for i in range(len(array)) if rng.random() < 0.2}
+        mat = cdd.gmp.matrix_from_array(
+            array, rep_type=cdd.RepType.INEQUALITY, lin_set=lin_set
+        )
+        col_set = set(rng.sample(range(1, numcols), rng.randint(1, numcols - 1)))
+        mat1 = cdd.gmp.block_elimination(mat, col_set)
+        mat2 = cdd.gmp.block_elimination(mat, col_set, time_limit=100)
+        assert mat1.array == mat2.array
+        assert mat1.lin_set == mat2.lin_set
+
+
+def test_polyhedron_time_limit() -> None:
+    array = [[1, t, t * t, t**3] for t in range(10)]
+    mat = cdd.gmp.matrix_from_array(array, rep_type=cdd.RepType.GENERATOR)
+    with pytest.raises(cdd.gmp.TimeLimitError):
+        cdd.gmp.polyhedron_from_matrix(mat, time_limit=0)
+    assert cdd.gmp.TimeLimitError is cdd.TimeLimitError
+    poly = cdd.gmp.polyhedron_from_matrix(mat, time_limit=100)
+    assert poly.inequalities == cdd.gmp.polyhedron_from_matrix(mat).inequalities
@@ -0,0 +1,95 @@
+import random
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+import cdd
+import cdd.gmp
+
+VALUES = [
+    0.0,
+    -0.0,
+    0.1,
+    -1 / 3,
+    2.5,
+    123456789.123,
+    -3e18,
+    2.0**62,
+    2.0**70,
+    1e-30,
+    -5e-324,
+] + [random.Random(0).uniform(-10, 10) for _ in range(100)]
+
+
+@pytest.mark.parametrize("max_denominator", [1, 7, 1000, 10**12, 2**70])
+def test_max_denominator(max_denominator: int) -> None:
+    expected = [Fraction(x).limit_denominator(max_denominator) for x in VALUES]
+    mat = cdd.gmp.matrix_from_array([VALUES], max_denominator=max_denominator)
+    assert mat.array == [expected]
+    arr = np.array([VALUES])
+    mat = cdd.gmp.matrix_from_array(
+        arr, max_denominator=max_denominator  # type: ignore
+    )
+    assert mat.array == [expected]
+
+
+@pytest.mark.parametrize("tolerance", [0.5, 1e-3, 1e-9, 0.0])
+def test_tolerance(tolerance: float) -> None:
+    mat = cdd.gmp.matrix_from_array([VALUES], tolerance=tolerance)
+    for x, y in zip(VALUES, mat.array[0]):
+        assert abs(x - y) <= tolerance
+    arr = np.array([VALUES])
+    mat2 = cdd.gmp.matrix_from_array(arr, tolerance=tolerance)  # type: ignore
+    assert mat.array == mat2.array
+
+
+def test_tolerance_convergent() -> None:
+    mat = cdd.gmp.matrix_from_array(
+        [[3.14159, 0.33334]], tolerance=2e-3, max_denominator=100
+    )
+    assert mat.array == [[Fraction(22, 7), Fraction(1, 3)]]
+    mat = cdd.gmp.matrix_from_array([[3.14159]], tolerance=1e-5, max_denominator=100)
+    assert mat.array == [[Fraction(311, 99)]]
+
+
+def test_rationalize_mixed_types() -> None:
+    mat = cdd.gmp.matrix_from_array(
+        [[Fraction(1, 3), 5, 0.25]], obj_func=[0.5, Fraction(2, 7), 1], tolerance=0.0
+    )
+    assert mat.array == [[Fraction(1, 3), 5, Fraction(1, 4)]]
+    assert mat.obj_func == [Fraction(1, 2), Fraction(2, 7), 1]
+
+
+@pytest.mark.parametrize("value", [float("inf"), float("nan")])
+def test_rationalize_not_finite(value: float) -> None:
+    with pytest.raises((ValueError, OverflowError)):
+        cdd.gmp.matrix_from_array([[value]], max_denominator=10)
+
+
+def test_rationalize_invalid() -> None:
+    with pytest.raises(ValueError, match="max_denominator"):
+        cdd.gmp.matrix_from_array([[1.0]], max_denominator=0)
+    with pytest.raises(ValueError, match="tolerance"):
+        cdd.gmp.matrix_from_array([[1.0]], tolerance=-1.0)
+
+
+def test_scale_rows() -> None:
+    mat = cdd.gmp.matrix_from_array(
+        [[0.5, 0.25, -1.5], [0, 0, 0], [Fraction(2, 3), 4, Fraction(-10, 9)]],
+        max_denominator=1000,
+        scale_rows=True,
+    )
+    assert mat.array == [[2, 1, -6], [0, 0, 0], [3, 18, -5]]
+    mat = cdd.gmp.matrix_from_array([[6, -4, 2 * 10**30]], scale_rows=True)
+    assert mat.array == [[3, -2, 10**30]]
+
+
+def test_scale_rows_linprog() -> None:
+    lp = cdd.gmp.linprog_from_array(
+        [[2, 4], [Fraction(1, 2), 0.25]],
+        obj_type=cdd.LPObjType.MAX,
+        max_denominator=10,
+        scale_rows=True,
+    )
+    assert lp.array == [[1, 2], [Fraction(1, 2), Fraction(1, 4)]]
@@ -0,0 +1,54 @@
+import random
+from fractions import Fraction
+
+import pytest
+
+import cdd
+import cdd.gmp
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_redundant_rows_shooting_random(seed: int) -> None:
+    rng = random.Random(seed)
+    dim = rng.randint(1, 4)
+    array: list[list[int]] = []
+    for _ in range(rng.randint(1, 40)):
+        if array and rng.random() < 0.2:
+            # duplicate or scaled copy of an earlier row
+            array.append([rng.randint(1, 2) * x for x in rng.choice(array)])
+        else:
+            array.append([rng.randint(0, 8)] + [rng.randint(-3, 3) for _ in range(dim)])
+    mat = cdd.gmp.matrix_from_array(array, rep_type=cdd.RepType.INEQUALITY)
+    assert cdd.gmp.redundant_rows(mat, method="shooting") == cdd.gmp.redundant_rows(mat)
+
+
+def test_redundant_rows_shooting_duplicates() -> None:
+    # square, with every facet repeated, keeps the first of each
+    array = [[1, 1, 0], [1, 0, 1], [1, -1, 0], [1, 0, -1]]
+    mat = cdd.gmp.matrix_from_array(
+        array + [[2 * x for x in row] for row in array] + array,
+        rep_type=cdd.RepType.INEQUALITY,
+    )
+    red = set(range(4, 12))
+    assert cdd.gmp.redundant_rows(mat) == red
+    assert cdd.gmp.redundant_rows(mat, method="shooting") == red
+    assert (
+        cdd.gmp.redundant_rows(
+            mat, method="shooting", interior_point=[Fraction(1, 3), Fraction(-1, 2)]
+        )
+        == red
+    )
+
+
+def test_matrix_redundancy_remove_shooting() -> None:
+    # triangle, with a redundant row in between
+    mat = cdd.gmp.matrix_from_array(
+        [[0, 1, 0], [5, -1, -1], [0, 0, 1], [3, 1, 1]],
+        rep_type=cdd.RepType.INEQUALITY,
+    )
+    red, pos = cdd.gmp.matrix_redundancy_remove(
+        mat, method="shooting", interior_point=[1, 1]
+    )
+    assert red == {3}
+    assert pos == [0, 1, 2, None]
+    assert mat.array == [[0, 1, 0], [5, -1, -1], [0, 0, 1]]
@@ -0,0 +1,58 @@
+import random
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+import cdd
+import cdd.gmp
+from cdd.gmp import SupportsNumberType
+
+
+def _random_points(seed: int) -> Sequence[Sequence[int]]:
+    rnd = random.Random(seed)
+    return [[1] + [rnd.randint(-20, 20) for _ in range(3)] for _ in range(15)]
+
+
+def _solve(seed: int) -> tuple[object, ...]:
+    mat = cdd.gmp.matrix_from_array(
+        _random_points(seed), rep_type=cdd.RepType.GENERATOR
+    )
+    poly = cdd.gmp.polyhedron_from_matrix(mat)
+    ineqs = cdd.gmp.copy_inequalities(poly)
+    array: list[Sequence[SupportsNumberType]] = [[1, -1, -1, -1]]
+    array.extend(ineqs.array)
+    array.append([0, 1, 2, 3])
+    lp = cdd.gmp.linprog_from_array(array, obj_type=cdd.LPObjType.MAX)
+    cdd.gmp.linprog_solve(lp)
+    return (
+        ineqs.array,
+        cdd.gmp.matrix_canonicalize(mat),
+        lp.status,
+        lp.obj_value,
+        lp.primal_solution,
+    )
+
+
+def _solve_float(seed: int) -> tuple[object, ...]:
+    mat = cdd.matrix_from_array(_random_points(seed), rep_type=cdd.RepType.GENERATOR)
+    poly = cdd.polyhedron_from_matrix(mat)
+    return cdd.copy_inequalities(poly).array, cdd.copy_incidence(poly)
+
+
+def test_threads() -> None:
+    seeds = list(range(16))
+    expected = [_solve(seed) for seed in seeds]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for _ in range(3):
+            assert list(executor.map(_solve, seeds)) == expected
+
+
+def test_threads_mixed() -> None:
+    # cdd and cdd.gmp link against separate libraries, and may run concurrently
+    seeds = list(range(16))
+    expected = [_solve(seed) for seed in seeds]
+    expected_float = [_solve_float(seed) for seed in seeds]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(_solve, seed) for seed in seeds]
+        futures_float = [executor.submit(_solve_float, seed) for seed in seeds]
+        assert [future.result() for future in futures] == expected
+        assert [future.result() for future in futures_float] == expected_float
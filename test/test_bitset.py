@@ -0,0 +1,73 @@
+import math
+from collections.abc import Sequence, Set
+
+import numpy as np
+import numpy.typing as npt
+
+import cdd
+
+
+def bitset_to_sets(bits: npt.NDArray[np.uint64], size: int) -> Sequence[Set[int]]:
+    bools = np.unpackbits(bits.view(np.uint8), axis=1, count=size, bitorder="little")
+    return [set(np.flatnonzero(row).tolist()) for row in bools]
+
+
+def test_bitset_cube() -> None:
+    mat = cdd.matrix_from_array(
+        [
+            [1, 1, 0, 0],
+            [1, 0, 1, 0],
+            [1, 0, 0, 1],
+            [1, -1, 0, 0],
+            [1, 0, -1, 0],
+            [1, 0, 0, -1],
+        ],
+        rep_type=cdd.RepType.INEQUALITY,
+    )
+    poly = cdd.polyhedron_from_matrix(mat)
+    bits = cdd.copy_incidence_bitset(poly)
+    assert bits.dtype == np.dtype("<u8")
+    assert bits.shape == (8, 1)
+    assert bits.tolist() == [
+        [sum(1 << j for j in inc)] for inc in cdd.copy_incidence(poly)
+    ]
+    for bitset_func, set_func in [
+        (cdd.copy_adjacency_bitset, cdd.copy_adjacency),
+        (cdd.copy_input_adjacency_bitset, cdd.copy_input_adjacency),
+        (cdd.copy_incidence_bitset, cdd.copy_incidence),
+        (cdd.copy_input_incidence_bitset, cdd.copy_input_incidence),
+    ]:
+        assert bitset_to_sets(bitset_func(poly), 64) == set_func(poly)
+    for mat_bitset_func, mat_set_func in [
+        (cdd.matrix_adjacency_bitset, cdd.matrix_adjacency),
+        (cdd.matrix_weak_adjacency_bitset, cdd.matrix_weak_adjacency),
+    ]:
+        assert bitset_to_sets(mat_bitset_func(mat), 64) == mat_set_func(mat)
+
+
+def test_bitset_polygon() -> None:
+    # polygon with more vertices than bits in a word
+    n = 150
+    mat = cdd.matrix_from_array(
+        [
+            [1, math.cos(2 * math.pi * k / n), math.sin(2 * math.pi * k / n)]
+            for k in range(n)
+        ],
+        rep_type=cdd.RepType.GENERATOR,
+    )
+    poly = cdd.polyhedron_from_matrix(mat)
+    bits = cdd.copy_input_adjacency_bitset(poly)
+    assert bits.shape == (n, 3)
+    sets = bitset_to_sets(bits, 3 * 64)
+    assert sets == cdd.copy_input_adjacency(poly)
+    assert sets[0] == {1, n - 1}
+    assert bitset_to_sets(cdd.matrix_adjacency_bitset(mat), 3 * 64) == [
+        {(k - 1) % n, (k + 1) % n} for k in range(n)
+    ]
+    incidence = cdd.copy_incidence_bitset(poly)
+    assert bitset_to_sets(incidence, 3 * 64) == cdd.copy_incidence(poly)
+
+
+def test_bitset_empty() -> None:
+    mat = cdd.matrix_from_array([[1, 1]], rep_type=cdd.RepType.INEQUALITY)
+    assert cdd.matrix_adjacency_bitset(mat).tolist() == [[0]]
@@ -0,0 +1,43 @@
+from collections.abc import Callable, Set
+
+import pytest
+
+import cdd
+
+
+def test_certificate_rows_parallel() -> None:
+    # 0 <= x, 0 <= -x (implicit linearities), 0 <= 1 + y, 0 <= 1 - y,
+    # 0 <= 2 + y (strongly redundant), 0 <= 1 + y (duplicate),
+    # 0 <= 1 + y + x (redundant)
+    mat = cdd.matrix_from_array(
+        [
+            [0, 1, 0],
+            [0, -1, 0],
+            [1, 0, 1],
+            [1, 0, -1],
+            [2, 0, 1],
+            [1, 0, 1],
+            [1, 1, 1],
+        ],
+        rep_type=cdd.RepType.INEQUALITY,
+    )
+    funcs: list[Callable[..., Set[int]]] = [
+        cdd.redundant_rows,
+        cdd.s_redundant_rows,
+        cdd.implicit_linearity_rows,
+    ]
+    for func in funcs:
+        assert func(mat, max_workers=2) == func(mat)
+
+
+def test_certificate_rows_parallel_errors() -> None:
+    mat = cdd.matrix_from_array([[1, 1], [2, 1]], rep_type=cdd.RepType.INEQUALITY)
+    with pytest.raises(ValueError, match="max_workers"):
+        cdd.redundant_rows(mat, max_workers=0)
+    with pytest.raises(ValueError, match="requires the lp method"):
+        cdd.redundant_rows(mat, method="shooting", max_workers=2)
+
+
+def test_certificate_rows_parallel_no_module_leak() -> None:
+    for name in ["itertools", "math", "multiprocessing", "ProcessPoolExecutor"]:
+        assert not hasattr(cdd, name)
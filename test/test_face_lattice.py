@@ -0,0 +1,156 @@
+import random
+
+import numpy as np
+import pytest
+
+import cdd
+
+
+def cube() -> cdd.Polyhedron:
+    mat = cdd.matrix_from_array(
+        [
+            [1, 1, 0, 0],
+            [1, 0, 1, 0],
+            [1, 0, 0, 1],
+            [1, -1, 0, 0],
+            [1, 0, -1, 0],
+            [1, 0, 0, -1],
+        ],
+        rep_type=cdd.RepType.INEQUALITY,
+    )
+    return cdd.polyhedron_from_matrix(mat)
+
+
+def closure_faces(poly: cdd.Polyhedron) -> dict[frozenset[int], int]:
+    # faces as all intersections of facets, with their dimension
+    num_vertices = len(cdd.copy_output(poly).array)
+    top = frozenset(range(num_vertices))
+    facets = [frozenset(inc) for inc in cdd.copy_input_incidence(poly)]
+    faces = {top}
+    new_faces = set(faces)
+    while new_faces:
+        new_faces = {face & facet for face in new_faces for facet in facets} - faces
+        faces |= new_faces
+    faces.add(frozenset())
+    # dimension is one less than the longest chain from the empty face
+    dims: dict[frozenset[int], int] = {}
+    for face in sorted(faces, key=len):
+        dims[face] = max((dims[sub] + 1 for sub in dims if sub < face), default=-1)
+    return dims
+
+
+def test_face_lattice_cube() -> None:
+    poly = cube()
+    assert cdd.f_vector(poly) == [1, 8, 12, 6, 1]
+    faces = list(cdd.face_lattice(poly))
+    assert len(faces) == 28
+    for dim, vertices in faces:
+        assert vertices.dtype == np.intp
+        assert vertices.tolist() == sorted(vertices.tolist())
+        assert len(vertices) == {-1: 0, 0: 1, 1: 2, 2: 4, 3: 8}[dim]
+    assert {frozenset(vertices.tolist()): dim for dim, vertices in faces} == (
+        closure_faces(poly)
+    )
+
+
+def test_face_lattice_bitset() -> None:
+    poly = cube()
+    for (dim, vertices), (dim2, bitset) in zip(
+        cdd.face_lattice(poly), cdd.face_lattice(poly, bitset=True)
+    ):
+        assert dim == dim2
+        assert bitset.dtype == np.dtype("<u8")
+        assert bitset.shape == (1,)
+        bits = np.unpackbits(bitset.view(np.uint8), bitorder="little")
+        assert np.flatnonzero(bits).tolist() == vertices.tolist()
+
+
+def test_face_lattice_max_dim() -> None:
+    poly = cube()
+    assert cdd.f_vector(poly, max_dim=1) == [1, 8, 12]
+    assert cdd.f_vector(poly, max_dim=5) == [1, 8, 12, 6, 1]
+    assert cdd.f_vector(poly, max_dim=-1) == [1]
+    assert cdd.f_vector(poly, max_dim=-2) == []
+    faces = list(cdd.face_lattice(poly, max_dim=1))
+    assert sorted(dim for dim, _ in faces) == [-1] + [0] * 8 + [1] * 12
+    assert list(cdd.face_lattice(poly, max_dim=-2)) == []
+
+
+def test_face_lattice_redundant() -> None:
+    # square with a redundant point on an edge, and a duplicate vertex
+    mat = cdd.matrix_from_array(
+        [[1, 0, 0], [1, 1, 0], [1, 1, 1], [1, 0, 1], [1, 0.5, 0], [1, 1, 1]],
+        rep_type=cdd.RepType.GENERATOR,
+    )
+    poly = cdd.polyhedron_from_matrix(mat)
+    assert cdd.f_vector(poly) == [1, 4, 4, 1]
+    faces = {frozenset(vertices.tolist()) for _, vertices in cdd.face_lattice(poly)}
+    assert frozenset({0, 1, 2, 3}) in faces
+    assert all(4 not in face and 5 not in face for face in faces)
+
+
+def test_face_lattice_point() -> None:
+    mat = cdd.matrix_from_array([[1, 2, 3]], rep_type=cdd.RepType.GENERATOR)
+    poly = cdd.polyhedron_from_matrix(mat)
+    assert cdd.f_vector(poly) == [1, 1]
+    assert [(dim, vertices.tolist()) for dim, vertices in cdd.face_lattice(poly)] == [
+        (0, [0]),
+        (-1, []),
+    ]
+
+
+def test_face_lattice_empty() -> None:
+    mat = cdd.matrix_from_array([[-1, 0]], rep_type=cdd.RepType.INEQUALITY)
+    poly = cdd.polyhedron_from_matrix(mat)
+    assert cdd.f_vector(poly) == [1]
+    assert [(dim, vertices.tolist()) for dim, vertices in cdd.face_lattice(poly)] == [
+        (-1, [])
+    ]
+
+
+@pytest.mark.parametrize(
+    "array,rep_type",
+    [
+        ([[0, 1, 0], [0, 0, 1]], cdd.RepType.INEQUALITY),
+        ([[1, 0], [0, 1]], cdd.RepType.GENERATOR),
+    ],
+)
+def test_face_lattice_unbounded(
+    array: list[list[float]], rep_type: cdd.RepType
+) -> None:
+    poly = cdd.polyhedron_from_matrix(cdd.matrix_from_array(array, rep_type=rep_type))
+    with pytest.raises(ValueError, match="bounded"):
+        cdd.f_vector(poly)
+    with pytest.raises(ValueError, match="bounded"):
+        list(cdd.face_lattice(poly))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_face_lattice_random(seed: int) -> None:
+    rng = random.Random(seed)
+    dim = rng.randint(1, 4)
+    array = [
+        [1] + [rng.randint(-3, 3) for _ in range(dim)]
+        for _ in range(rng.randint(1, 12))
+    ]
+    gen = cdd.copy_output(
+        cdd.polyhedron_from_matrix(
+            cdd.matrix_from_array(array, rep_type=cdd.RepType.GENERATOR)
+        )
+    )
+    poly = cdd.polyhedron_from_matrix(gen)
+    dims = closure_faces(poly)
+    faces = list(cdd.face_lattice(poly))
+    assert len(faces) == len(dims)
+    assert {frozenset(vertices.tolist()): d for d, vertices in faces} == dims
+    f_vector = [0] * (max(dims.values()) + 2)
+    for d in dims.values():
+        f_vector[d + 1] += 1
+    assert cdd.f_vector(poly) == f_vector
+    for num_dims in range(len(f_vector) + 1):
+        max_dim = num_dims - 2
+        assert cdd.f_vector(poly, max_dim) == f_vector[:num_dims]
+        assert {
+            (d, frozenset(vertices.tolist()))
+            for d, vertices in cdd.face_lattice(poly, max_dim)
+        } == {(d, face) for face, d in dims.items() if d <= max_dim}
@@ -40,3 +40,51 @@ def test_fourier_elimination_3() -> None:
     mat = cdd.matrix_from_array(array, rep_type=cdd.RepType.INEQUALITY, lin_set=[0])
     with pytest.raises(RuntimeError, match="cannot handle linearity"):
         cdd.fourier_elimination(mat)
+
+
+@pytest.mark.parametrize("prune", ["none", "lp", "shooting"])
+def test_fourier_elimination_col_set(prune: str) -> None:
+    # cube -1 <= x, y, z <= 1 with a cut x + y + z <= 2
+    array = [
+        [1, 1, 0, 0],
+        [1, -1, 0, 0],
+        [1, 0, 1, 0],
+        [1, 0, -1, 0],
+        [1, 0, 0, 1],
+        [1, 0, 0, -1],
+        [2, -1, -1, -1],
+    ]
+    mat1 = cdd.matrix_from_array(array, rep_type=cdd.RepType.INEQUALITY)
+    mat2 = cdd.fourier_elimination(mat1, {1, 3}, prune=prune)
+    # -1 <= y <= 1
+    rows = sorted(map(list, mat2.array))
+    if prune == "none":
+        assert len(rows) > 2
+        cdd.matrix_canonicalize(mat2)
+        rows = sorted(map(list, mat2.array))
+    assert_matrix_almost_equal(rows, [[1, -1], [1, 1]])
+    assert mat1.array == array  # input is not modified
+
+
+def test_fourier_elimination_col_set_last() -> None:
+    # without pruning, eliminating the last column is as before
+    array = [[10, -2, 5, -4], [9, -3, 6, -3], [-7, 1, -5, 2], [12, 3, -2, -6]]
+    mat1 = cdd.matrix_from_array(array, rep_type=cdd.RepType.INEQUALITY)
+    assert cdd.fourier_elimination(mat1, {3}).array == (
+        cdd.fourier_elimination(mat1).array
+    )
+    assert cdd.fourier_elimination(mat1, set()).array == array
+
+
+def test_fourier_elimination_col_set_errors() -> None:
+    mat = cdd.matrix_from_array([[1, 1, 1]], rep_type=cdd.RepType.INEQUALITY)
+    with pytest.raises(ValueError, match="cannot eliminate column 0"):
+        cdd.fourier_elimination(mat, {0})
+    with pytest.raises(ValueError, match="prune must be"):
+        cdd.fourier_elimination(mat, {1}, prune="fast")
+    with pytest.raises(ValueError, match="out of range"):
+        cdd.fourier_elimination(mat, {3})
+    with pytest.raises(ValueError, match="out of range"):
+        cdd.fourier_elimination(mat, [1, 7])
+    with pytest.raises(ValueError, match="out of range"):
+        cdd.fourier_elimination(mat, {-1})
@@ -0,0 +1,126 @@
+from collections.abc import Sequence, Set
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+import cdd
+
+
+def graph_sets(
+    graph: tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]],
+) -> list[set[int]]:
+    indptr, indices = graph
+    assert indptr.dtype == np.intp
+    assert indices.dtype == np.intp
+    assert indptr[0] == 0
+    assert indptr[-1] == len(indices)
+    neighbours = [
+        indices[start:end].tolist() for start, end in zip(indptr[:-1], indptr[1:])
+    ]
+    assert all(nbs == sorted(set(nbs)) for nbs in neighbours)
+    return [set(nbs) for nbs in neighbours]
+
+
+def without_loops(adjacency: Sequence[Set[int]]) -> list[set[int]]:
+    return [set(adj) - {i} for i, adj in enumerate(adjacency)]
+
+
+def test_graph_cube() -> None:
+    mat = cdd.matrix_from_array(
+        [
+            [1, 1, 0, 0],
+            [1, 0, 1, 0],
+            [1, 0, 0, 1],
+            [1, -1, 0, 0],
+            [1, 0, -1, 0],
+            [1, 0, 0, -1],
+        ],
+        rep_type=cdd.RepType.INEQUALITY,
+    )
+    poly = cdd.polyhedron_from_matrix(mat)
+    assert graph_sets(cdd.polyhedron_vertex_graph(poly)) == [
+        {1, 3, 7},
+        {0, 2, 6},
+        {1, 3, 4},
+        {0, 2, 5},
+        {2, 5, 6},
+        {3, 4, 7},
+        {1, 4, 7},
+        {0, 5, 6},
+    ]
+    # last row is the infinity inequality, adjacent to nothing for a polytope
+    assert graph_sets(cdd.polyhedron_facet_graph(poly)) == [
+        {1, 2, 4, 5},
+        {0, 2, 3, 5},
+        {0, 1, 3, 4},
+        {1, 2, 4, 5},
+        {0, 2, 3, 5},
+        {0, 1, 3, 4},
+        set(),
+    ]
+
+
+def test_graph_redundant_generator() -> None:
+    # square with a redundant point on an edge
+    mat = cdd.matrix_from_array(
+        [[1, 0, 0], [1, 1, 0], [1, 1, 1], [1, 0, 1], [1, 0.5, 0]],
+        rep_type=cdd.RepType.GENERATOR,
+    )
+    poly = cdd.polyhedron_from_matrix(mat)
+    assert graph_sets(cdd.polyhedron_vertex_graph(poly)) == [
+        {1, 3},
+        {0, 2},
+        {1, 3},
+        {0, 2},
+        set(),
+    ]
+    assert graph_sets(cdd.polyhedron_vertex_graph(poly)) == without_loops(
+        cdd.copy_input_adjacency(poly)
+    )
+    facet_graph = graph_sets(cdd.polyhedron_facet_graph(poly))
+    assert facet_graph == without_loops(cdd.copy_adjacency(poly))
+    assert [len(nbs) for nbs in facet_graph] == [2, 2, 2, 2]
+
+
+def test_graph_lineality() -> None:
+    # half plane x >= -1, with vertex (-1, 0), ray (1, 0), and line (0, 1)
+    mat = cdd.matrix_from_array([[1, 1, 0]], rep_type=cdd.RepType.INEQUALITY)
+    poly = cdd.polyhedron_from_matrix(mat)
+    assert cdd.copy_generators(poly).lin_set == {2}
+    assert graph_sets(cdd.polyhedron_vertex_graph(poly)) == [
+        {1, 2},
+        {0, 2},
+        {0, 1},
+    ]
+    assert graph_sets(cdd.polyhedron_facet_graph(poly)) == [{1}, {0}]
+
+
+def test_graph_empty() -> None:
+    mat = cdd.matrix_from_array([[-1, 1], [-1, -1]], rep_type=cdd.RepType.INEQUALITY)
+    poly = cdd.polyhedron_from_matrix(mat)
+    indptr, indices = cdd.polyhedron_vertex_graph(poly)
+    assert indptr.tolist() == [0]
+    assert indices.tolist() == []
+
+
+@pytest.mark.parametrize("num_points,dim", [(30, 3), (40, 4), (20, 5)])
+def test_graph_random(num_points: int, dim: int) -> None:
+    rng = np.random.default_rng(num_points)
+    points = rng.integers(-100, 100, size=(num_points, dim)).tolist()
+    array = [[1, *point] for point in points]
+    mat = cdd.matrix_from_array(array, rep_type=cdd.RepType.GENERATOR)
+    poly = cdd.polyhedron_from_matrix(mat)
+    vertex_graph = graph_sets(cdd.polyhedron_vertex_graph(poly))
+    assert vertex_graph == without_loops(cdd.copy_input_adjacency(poly))
+    assert graph_sets(cdd.polyhedron_facet_graph(poly)) == without_loops(
+        cdd.copy_adjacency(poly)
+    )
+    # same graph as from the H-representation
+    poly2 = cdd.polyhedron_from_matrix(cdd.copy_output(poly))
+    assert graph_sets(cdd.polyhedron_vertex_graph(poly2)) == without_loops(
+        cdd.copy_adjacency(poly2)
+    )
+    assert graph_sets(cdd.polyhedron_facet_graph(poly2)) == without_loops(
+        cdd.copy_input_adjacency(poly2)
+    )
@@ -137,3 +137,68 @@ def test_linprog_1(
     assert lp.status == status
     if primal_solution is not None:
         assert_vector_almost_equal(lp.primal_solution, primal_solution)
+
+
+def test_linprog_obj_func() -> None:
+    # max x + y subject to 0 <= x <= 1, 0 <= y <= 1
+    array = [[0, 1, 0], [1, -1, 0], [0, 0, 1], [1, 0, -1], [0, 1, 1]]
+    lp = linprog_from_array(array, obj_type=LPObjType.MAX)
+    assert_vector_almost_equal(lp.obj_func, [0, 1, 1])
+    lp.obj_func = [0.5, 2, -1]
+    assert_vector_almost_equal(lp.obj_func, [0.5, 2, -1])
+    assert_matrix_almost_equal(lp.array, array[:-1] + [[0.5, 2, -1]])
+    with pytest.raises(ValueError, match="objective function does not match"):
+        lp.obj_func = [1, 2]
+
+
+@pytest.mark.parametrize("obj_type", [LPObjType.MAX, LPObjType.MIN])
+def test_linprog_obj_func_warm_start(obj_type: LPObjType) -> None:
+    # octagon around the origin
+    array: list[list[float]] = [
+        [1, 1, 0],
+        [1, -1, 0],
+        [1, 0, 1],
+        [1, 0, -1],
+        [1.5, 1, 1],
+        [1.5, 1, -1],
+        [1.5, -1, 1],
+        [1.5, -1, -1],
+        [0, 1, 0],
+    ]
+    lp = linprog_from_array(array, obj_type=obj_type)
+    linprog_solve(lp)
+    assert lp.status == LPStatusType.OPTIMAL
+    obj_funcs: list[list[float]] = [
+        [0, 0, 1],
+        [2, -1, 0],
+        [0, 1, 3],
+        [0, -1, -1],
+        [1, 0.5, -2],
+    ]
+    for obj_func in obj_funcs:
+        lp.obj_func = obj_func
+        linprog_solve(lp)
+        lp_cold = linprog_from_array(array[:-1] + [obj_func], obj_type=obj_type)
+        linprog_solve(lp_cold)
+        assert lp.status == LPStatusType.OPTIMAL
+        assert_almost_equal(lp.obj_value, lp_cold.obj_value)
+        x = [1] + list(lp.primal_solution)
+        assert_almost_equal(sum(c * v for c, v in zip(obj_func, x)), lp.obj_value)
+        for row in array[:-1]:
+            assert sum(c * v for c, v in zip(row, x)) >= -1e-9
+
+
+def test_linprog_obj_func_warm_start_unbounded() -> None:
+    # min over the quadrant 0 <= x, 0 <= y
+    lp = linprog_from_array([[0, 1, 0], [0, 0, 1], [0, 1, 1]], obj_type=LPObjType.MIN)
+    linprog_solve(lp)
+    assert lp.status == LPStatusType.OPTIMAL
+    assert_almost_equal(lp.obj_value, 0)
+    lp.obj_func = [0, 1, -1]
+    linprog_solve(lp)
+    assert lp.status == LPStatusType.DUAL_INCONSISTENT
+    lp.obj_func = [3, 2, 1]
+    linprog_solve(lp)
+    assert lp.status == LPStatusType.OPTIMAL
+    assert_almost_equal(lp.obj_value, 3)
+    assert_vector_almost_equal(lp.primal_solution, [0, 0])
@@ -0,0 +1,60 @@
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+import cdd
+
+from . import assert_matrix_almost_equal, assert_vector_almost_equal
+
+# max 2 - x subject to -0.5 + x >= 0,  2 - x >= 0, and variations
+ARRAYS: Sequence[Sequence[Sequence[float]]] = [
+    [[-0.5, 1], [2, -1], [2, -1]],
+    [[-3, 1], [2, -1], [2, -1]],  # inconsistent
+    [[-0.5, 1], [2, 0], [2, 1]],  # unbounded
+    [[-1.5, 1], [2, -1], [2, -1]],
+]
+
+
+@pytest.mark.parametrize("solver", list(cdd.LPSolverType))
+@pytest.mark.parametrize("obj_type", [cdd.LPObjType.MAX, cdd.LPObjType.MIN])
+def test_linprog_solve_many(obj_type: cdd.LPObjType, solver: cdd.LPSolverType) -> None:
+    statuses, obj_values, primal_solutions = cdd.linprog_solve_many(
+        ARRAYS, obj_type, solver=solver
+    )
+    assert statuses.shape == (4,)
+    assert obj_values.shape == (4,)
+    assert primal_solutions.shape == (4, 1)
+    for i, array in enumerate(ARRAYS):
+        lp = cdd.linprog_from_array(array, obj_type=obj_type)
+        cdd.linprog_solve(lp, solver=solver)
+        assert statuses[i] == lp.status
+        assert_vector_almost_equal([obj_values[i]], [lp.obj_value])
+        assert_vector_almost_equal(primal_solutions[i], lp.primal_solution)
+
+
+def test_linprog_solve_many_3d() -> None:
+    arrays: npt.NDArray[np.float64] = np.array([ARRAYS[0], ARRAYS[3]], dtype=np.float64)
+    statuses, obj_values, primal_solutions = cdd.linprog_solve_many(
+        arrays, cdd.LPObjType.MAX  # type: ignore
+    )
+    assert list(statuses) == [cdd.LPStatusType.OPTIMAL] * 2
+    assert_vector_almost_equal(obj_values.tolist(), [1.5, 0.5])
+    assert_matrix_almost_equal(primal_solutions.tolist(), [[0.5], [1.5]])
+
+
+def test_linprog_solve_many_empty() -> None:
+    statuses, obj_values, primal_solutions = cdd.linprog_solve_many(
+        np.empty((0, 3, 4)), cdd.LPObjType.MAX  # type: ignore
+    )
+    assert statuses.shape == (0,)
+    assert obj_values.shape == (0,)
+    assert primal_solutions.shape == (0, 3)
+
+
+def test_linprog_solve_many_errors() -> None:
+    with pytest.raises(ValueError, match="same number of columns"):
+        cdd.linprog_solve_many([[[1, 2]], [[1, 2, 3]]], cdd.LPObjType.MAX)
+    with pytest.raises(ValueError, match="obj_type"):
+        cdd.linprog_solve_many(ARRAYS, cdd.LPObjType.NONE)
@@ -0,0 +1,49 @@
+import cdd
+
+from . import assert_matrix_almost_equal
+
+
+def test_matrix_dedup() -> None:
+    # 0 <= 1 + x, 0 <= 2 + 2x (duplicate), 0 <= -1 - x (not a duplicate),
+    # 0 <= 0 (kept), 0 <= 0, 0 <= 3 + 3x (duplicate)
+    array = [[1, 1], [2, 2], [-1, -1], [0, 0], [0, 0], [3, 3]]
+    mat = cdd.matrix_from_array(array, rep_type=cdd.RepType.INEQUALITY)
+    assert cdd.matrix_dedup(mat) == ({1, 5}, [0, None, 1, 2, 3, None])
+    assert_matrix_almost_equal(mat.array, [[1, 1], [-1, -1], [0, 0], [0, 0]])
+
+
+def test_matrix_dedup_linearity() -> None:
+    # 0 <= 1 + x, 0 = -2 - 2x, 0 = 1 + x (duplicate), 0 <= -3 - 3x (implied)
+    array = [[1, 1], [-2, -2], [1, 1], [-3, -3]]
+    mat = cdd.matrix_from_array(array, rep_type=cdd.RepType.INEQUALITY, lin_set={1, 2})
+    assert cdd.matrix_dedup(mat) == ({0, 2, 3}, [None, 0, None, None])
+    assert_matrix_almost_equal(mat.array, [[-2, -2]])
+    assert mat.lin_set == {0}
+
+
+def test_matrix_dedup_float() -> None:
+    # only rows that are equal after scaling are detected
+    array = [[0.1, 0.3], [0.2, 0.6], [-0.0, 1.0], [0.0, 2.0]]
+    mat = cdd.matrix_from_array(array, rep_type=cdd.RepType.INEQUALITY)
+    assert cdd.matrix_dedup(mat) == ({1, 3}, [0, None, 1, None])
+
+
+def test_matrix_canonicalize_dedup() -> None:
+    array = [[2, 1, 2, 3], [0, 1, 2, 3], [3, 0, 1, 2], [0, -2, -4, -6], [6, 0, 2, 4]]
+    mat1 = cdd.matrix_from_array(array, rep_type=cdd.RepType.INEQUALITY)
+    mat2 = cdd.matrix_from_array(array, rep_type=cdd.RepType.INEQUALITY)
+    assert cdd.matrix_canonicalize(mat1) == ({1, 3}, {0, 4}, [None, 0, 1, None, None])
+    assert cdd.matrix_canonicalize(mat2, dedup=True) == (
+        {1, 3},
+        {0, 4},
+        [None, 0, 1, None, None],
+    )
+    assert_matrix_almost_equal(mat1.array, mat2.array)
+    assert mat1.lin_set == mat2.lin_set
+
+
+def test_matrix_redundancy_remove_dedup() -> None:
+    array = [[2, 1, 2, 3], [0, 1, 2, 3], [4, 2, 4, 6], [3, 0, 1, 2]]
+    mat = cdd.matrix_from_array(array, rep_type=cdd.RepType.INEQUALITY)
+    assert cdd.matrix_redundancy_remove(mat, dedup=True) == ({0, 2}, [None, 0, None, 1])
+    assert_matrix_almost_equal(mat.array, [[0, 1, 2, 3], [3, 0, 1, 2]])
@@ -0,0 +1,87 @@
+from pathlib import Path
+
+import pytest
+
+import cdd
+
+from . import assert_matrix_almost_equal, assert_vector_almost_equal
+
+
+def test_matrix_from_file(tmp_path: Path) -> None:
+    mat = cdd.matrix_from_array(
+        [[1, 2, 3], [4, 5.5, 6], [0, -1, 0.25]],
+        lin_set=[1],
+        rep_type=cdd.RepType.INEQUALITY,
+        obj_type=cdd.LPObjType.MAX,
+        obj_func=[0, 1, 2],
+    )
+    path = tmp_path / "test.ine"
+    path.write_text(str(mat))
+    mat2 = cdd.matrix_from_file(path)
+    assert_matrix_almost_equal(mat2.array, mat.array)
+    assert mat2.lin_set == {1}
+    assert mat2.rep_type == cdd.RepType.INEQUALITY
+    assert mat2.obj_type == cdd.LPObjType.MAX
+    assert_vector_almost_equal(mat2.obj_func, [0, 1, 2])
+
+
+def test_matrix_from_file_format(tmp_path: Path) -> None:
+    path = tmp_path / "test.ext"
+    path.write_text(
+        "* a comment mentioning begin\n"
+        "name of the polytope\n"
+        "V-representation\n"
+        "linearity 2 2 3\n"
+        "begin\n"
+        "  3  3  rational\n"
+        "  1  1/4  -2\n"
+        "  0  1.5e1  -.5\n"
+        "  0  0  1\n"
+        "end\n"
+        "incidence\n"
+        "minimize\n"
+        "  0  1  1/2\n"
+    )
+    mat = cdd.matrix_from_file(str(path))
+    assert_matrix_almost_equal(mat.array, [[1, 0.25, -2], [0, 15, -0.5], [0, 0, 1]])
+    assert mat.lin_set == {1, 2}
+    assert mat.rep_type == cdd.RepType.GENERATOR
+    assert mat.obj_type == cdd.LPObjType.MIN
+    assert_vector_almost_equal(mat.obj_func, [0, 1, 0.5])
+
+
+def test_matrix_from_file_default_rep_type(tmp_path: Path) -> None:
+    path = tmp_path / "test.ine"
+    path.write_text("begin\n0 2 integer\nend\n")
+    mat = cdd.matrix_from_file(path)
+    assert mat.array == []
+    assert mat.rep_type == cdd.RepType.INEQUALITY
+
+
+@pytest.mark.parametrize(
+    "text,message",
+    [
+        ("", "line 1: begin missing"),
+        ("begin\n1 2 real\n1 x\nend\n", "line 3: invalid number at 'x'"),
+        ("begin\n1 2 real\n1 1/0\nend\n", "line 3: invalid number at '1/0'"),
+        ("begin\n1 2 real\n1 2\n", "line 3: end missing"),
+        ("begin\n2 2 real\n1 2\n3\n", "line 4: unexpected end of file"),
+        ("begin\n1 2 foo\n1 2\nend\n", "line 2: unknown number type at 'foo'"),
+        ("begin\n-1 2 real\nend\n", "line 2: invalid matrix size"),
+        ("begin\n1.5 2 real\nend\n", "line 2: invalid integer at '1.5'"),
+        (
+            "linearity 1 5\nbegin\n1 2 real\n1 2\nend\n",
+            "line 1: linearity row index out of range at '5'",
+        ),
+    ],
+)
+def test_matrix_from_file_error(tmp_path: Path, text: str, message: str) -> None:
+    path = tmp_path / "test.ine"
+    path.write_text(text)
+    with pytest.raises(ValueError, match=f"^{message}$"):
+        cdd.matrix_from_file(path)
+
+
+def test_matrix_from_file_missing(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        cdd.matrix_from_file(tmp_path / "missing.ine")
@@ -0,0 +1,81 @@
+import pickle
+from typing import Optional, Union
+
+import pytest
+
+import cdd
+
+from . import assert_matrix_almost_equal, cyclic_polytope
+
+
+@pytest.mark.parametrize(
+    "row_order", [None, cdd.RowOrderType.MIN_INDEX, cdd.RowOrderType.MAX_CUTOFF, "auto"]
+)
+def test_polyhedron_max_rays(row_order: Optional[Union[cdd.RowOrderType, str]]) -> None:
+    mat = cyclic_polytope(12)
+    with pytest.raises(cdd.RayLimitError) as excinfo:
+        cdd.polyhedron_from_matrix(mat, row_order=row_order, max_rays=20)
+    exc = excinfo.value
+    assert isinstance(exc, MemoryError)
+    assert exc.num_rows == 12
+    assert 0 < exc.iteration < 12
+    assert exc.num_rays > exc.max_rays == 20
+    assert str(exc) == (
+        f"{exc.num_rays} rays exceed max_rays=20 after {exc.iteration} of 12 rows"
+    )
+    exc2 = pickle.loads(pickle.dumps(exc))
+    assert (exc2.iteration, exc2.num_rays) == (exc.iteration, exc.num_rays)
+    bound = cdd.output_size_bound(12, 5, cdd.RepType.GENERATOR)
+    assert bound == 54  # 12 * (12 - 3) / 2
+    poly = cdd.polyhedron_from_matrix(mat, row_order=row_order, max_rays=2 * bound)
+    assert_matrix_almost_equal(
+        sorted(map(list, poly.inequalities)),
+        sorted(map(list, cdd.polyhedron_from_matrix(mat).inequalities)),
+    )
+    with pytest.raises(ValueError, match="max_rays must be non-negative"):
+        cdd.polyhedron_from_matrix(mat, max_rays=-1)
+
+
+def test_polyhedron_max_rays_stops_early() -> None:
+    # the rays of the next row are counted before they are created
+    mat = cyclic_polytope(12)
+    progress: list[tuple[int, int]] = []
+    with pytest.raises(cdd.RayLimitError) as excinfo:
+        cdd.polyhedron_from_matrix(
+            mat, max_rays=30, callback=lambda i, m, rays, t: progress.append((i, rays))
+        )
+    assert all(rays <= 30 for _, rays in progress)
+    assert excinfo.value.iteration == progress[-1][0]
+
+
+def test_block_elimination_max_rays() -> None:
+    # 0 <= 1 + a + b + c + d,  0 <= 1 + 2a - b - c - d
+    array = [[1, 1, 1, 1, 1], [1, 2, -1, -1, -1]]
+    mat1 = cdd.matrix_from_array(array, rep_type=cdd.RepType.INEQUALITY)
+    mat2 = cdd.block_elimination(mat1, {2, 3, 4}, max_rays=100)
+    assert_matrix_almost_equal(mat2.array, [[2, 3]])
+    with pytest.raises(cdd.RayLimitError):
+        cdd.block_elimination(mat1, {2, 3, 4}, max_rays=0)
+
+
+@pytest.mark.parametrize(
+    "num_rows,num_cols,rep_type,bound",
+    [
+        (6, 4, cdd.RepType.INEQUALITY, 10),  # cube has 8 vertices
+        (8, 4, cdd.RepType.GENERATOR, 12),  # cube has 6 facets
+        (12, 5, cdd.RepType.GENERATOR, 54),
+        (0, 3, cdd.RepType.INEQUALITY, 3),  # whole space, 3 lines
+        (2, 3, cdd.RepType.GENERATOR, 3),
+    ],
+)
+def test_output_size_bound(
+    num_rows: int, num_cols: int, rep_type: cdd.RepType, bound: int
+) -> None:
+    assert cdd.output_size_bound(num_rows, num_cols, rep_type) == bound
+
+
+def test_output_size_bound_errors() -> None:
+    with pytest.raises(ValueError, match="must be non-negative"):
+        cdd.output_size_bound(-1, 3, cdd.RepType.INEQUALITY)
+    with pytest.raises(ValueError, match="rep_type"):
+        cdd.output_size_bound(1, 3, cdd.RepType.UNSPECIFIED)
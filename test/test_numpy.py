@@ -0,0 +1,78 @@
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+import cdd
+
+from . import assert_matrix_almost_equal
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32, np.int64, np.int32])
+def test_matrix_from_numpy(dtype: npt.DTypeLike) -> None:
+    arr = np.array([[1, 2, 3], [4, 5, 6]], dtype=dtype)
+    mat = cdd.matrix_from_array(arr)  # type: ignore
+    assert_matrix_almost_equal(mat.array, arr.tolist())
+
+
+def test_matrix_from_numpy_non_contiguous() -> None:
+    arr: npt.NDArray[np.float64] = np.arange(12, dtype=np.float64).reshape(3, 4)
+    mat = cdd.matrix_from_array(arr[:, ::2])  # type: ignore
+    assert_matrix_almost_equal(mat.array, arr[:, ::2].tolist())
+    mat = cdd.matrix_from_array(arr.T)  # type: ignore
+    assert_matrix_almost_equal(mat.array, arr.T.tolist())
+
+
+def test_matrix_from_numpy_empty() -> None:
+    mat = cdd.matrix_from_array(np.zeros((3, 0)))  # type: ignore
+    assert mat.array == [[], [], []]
+
+
+def test_linprog_from_numpy() -> None:
+    arr: npt.NDArray[np.float64] = np.array(
+        [[4 / 3, -2, -1], [2 / 3, 0, -1], [0, 1, 0], [0, 0, 1], [0, 3, 4]]
+    )
+    lp = cdd.linprog_from_array(arr, obj_type=cdd.LPObjType.MAX)  # type: ignore
+    assert_matrix_almost_equal(lp.array, arr.tolist())
+    cdd.linprog_solve(lp)
+    assert lp.obj_value == pytest.approx(11 / 3)
+
+
+def test_matrix_to_numpy() -> None:
+    array: Sequence[Sequence[float]] = [[1.5, 2, 3], [4, 5, 6]]
+    mat = cdd.matrix_from_array(array)
+    arr = cdd.matrix_to_numpy(mat)
+    assert arr.dtype == np.float64
+    assert arr.tolist() == array
+    out = np.zeros((3, 2)).T
+    assert cdd.matrix_to_numpy(mat, out=out) is out
+    assert out.tolist() == array
+    with pytest.raises(ValueError, match="shape"):
+        cdd.matrix_to_numpy(mat, out=np.zeros((3, 2)))
+    with pytest.raises(ValueError, match="float64"):
+        cdd.matrix_to_numpy(mat, out=np.zeros((2, 3), dtype=np.int64))
+    readonly = np.zeros((2, 3))
+    readonly.flags.writeable = False
+    with pytest.raises(ValueError, match="writable"):
+        cdd.matrix_to_numpy(mat, out=readonly)
+
+
+def test_linprog_to_numpy() -> None:
+    array: Sequence[Sequence[float]] = [
+        [4 / 3, -2, -1],
+        [2 / 3, 0, -1],
+        [0, 1, 0],
+        [0, 0, 1],
+        [0, 3, 4],
+    ]
+    lp = cdd.linprog_from_array(array, obj_type=cdd.LPObjType.MAX)
+    assert_matrix_almost_equal(cdd.linprog_to_numpy(lp).tolist(), array)
+    cdd.linprog_solve(lp)
+    primal = cdd.linprog_primal_solution_to_numpy(lp)
+    assert primal.tolist() == lp.primal_solution
+    dual = cdd.linprog_dual_solution_to_numpy(lp)
+    assert dual.shape == (4,)
+    assert dual.tolist() == pytest.approx([3 / 2, 5 / 2, 0, 0])
+    for i, x in lp.dual_solution:
+        assert dual[i] == x
@@ -1,5 +1,8 @@
+import pickle
 from pickle import dumps, loads
 
+import pytest
+
 import cdd
 
 from . import assert_matrix_almost_equal
@@ -39,3 +42,31 @@ def test_pickle_linprog() -> None:
     assert isinstance(lp, cdd.LinProg)
     assert_matrix_almost_equal(lp.array, array)
     assert lp.obj_type == cdd.LPObjType.MIN
+
+
+@pytest.mark.parametrize("protocol", range(2, pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_matrix_protocol(protocol: int) -> None:
+    array = [[1.1, 2.2, -3.3], [1e300, -1e-300, 0.0]]
+    mat = loads(dumps(cdd.matrix_from_array(array), protocol=protocol))
+    assert mat.array == array
+
+
+def test_pickle_out_of_band() -> None:
+    array = [[1.1, 2.2], [3.3, 4.4], [5.5, 6.6]]
+    buffers: list[pickle.PickleBuffer] = []
+    mat = cdd.matrix_from_array(array)
+    lp = cdd.linprog_from_array(array, obj_type=cdd.LPObjType.MAX)
+    data = dumps((mat, lp), protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 2
+    mat2, lp2 = loads(data, buffers=buffers)
+    assert mat2.array == array
+    assert lp2.array == array
+
+
+def test_pickle_invalid() -> None:
+    mat = cdd.matrix_from_array([[1, 2]])
+    reduced = mat.__reduce_ex__(2)
+    assert isinstance(reduced, tuple)
+    func, args = reduced[:2]
+    with pytest.raises(ValueError, match="does not match"):
+        func(args[0][:-1], *args[1:])
@@ -1,6 +1,6 @@
 from collections.abc import Sequence, Set
 from fractions import Fraction
-from typing import Optional
+from typing import Optional, Union
 
 import pytest
 
@@ -102,11 +102,59 @@ def test_polyhedron_row_order(
     inequalities = [[0, 0, 1], [0, 1, 0], [1, 0, -1], [1, -1, 0]]
     mat = cdd.matrix_from_array(inequalities, rep_type=cdd.RepType.INEQUALITY)
     poly = cdd.polyhedron_from_matrix(mat, row_order=row_order)
+    assert poly.row_order == row_order
     assert_matrix_almost_equal(
         cdd.copy_generators(poly).array, [generators[i] for i in order]
     )
 
 
+def test_polyhedron_row_order_auto() -> None:
+    inequalities = [[0, 0, 1], [0, 1, 0], [1, 0, -1], [1, -1, 0]]
+    mat = cdd.matrix_from_array(inequalities, rep_type=cdd.RepType.INEQUALITY)
+    poly = cdd.polyhedron_from_matrix(mat, row_order="auto")
+    # small problems finish with the first order that is tried
+    assert poly.row_order == cdd.RowOrderType.LEX_MIN
+    assert_matrix_almost_equal(
+        cdd.copy_generators(poly).array, [[1, 1, 0], [1, 0, 0], [1, 0, 1], [1, 1, 1]]
+    )
+    with pytest.raises(ValueError, match="row_order must be"):
+        cdd.polyhedron_from_matrix(mat, row_order="fastest")
+
+
+def test_polyhedron_row_order_seed() -> None:
+    array = [[1, i % 3, i % 5, i % 7] for i in range(20)]
+    mat = cdd.matrix_from_array(array, rep_type=cdd.RepType.GENERATOR)
+
+    def inequalities(seed: Optional[int]) -> list[list[float]]:
+        poly = cdd.polyhedron_from_matrix(
+            mat, row_order=cdd.RowOrderType.RANDOM_ROW, seed=seed
+        )
+        return [list(row) for row in cdd.copy_inequalities(poly).array]
+
+    # default seed is 1
+    assert inequalities(1) == inequalities(None)
+    assert inequalities(2) == inequalities(2)
+    assert inequalities(1) != inequalities(2)
+    assert_matrix_almost_equal(sorted(inequalities(1)), sorted(inequalities(2)))
+    for seed in [-1, 2**32]:
+        with pytest.raises(ValueError, match="seed must be"):
+            cdd.polyhedron_from_matrix(mat, seed=seed)
+
+
+def test_polyhedron_cutoff_no_rays() -> None:
+    # dd_AddNewHalfspace1 would crash once the cone has no rays left
+    mat = cdd.matrix_from_array(
+        [[0, -3], [0, 3]], rep_type=cdd.RepType.GENERATOR, lin_set={1}
+    )
+    row_orders: list[Union[cdd.RowOrderType, str]] = [
+        cdd.RowOrderType.MIN_CUTOFF,
+        "auto",
+    ]
+    for row_order in row_orders:
+        poly = cdd.polyhedron_from_matrix(mat, row_order=row_order, seed=1)
+        assert poly.inequalities == ()
+
+
 def test_polyhedron_nonstandard_v_rep_1() -> None:
     # conv((0.5, 0), (0, 0)) + span_ge((0, 2))
     generators: Sequence[Sequence[float]] = [[2, 1, 0], [0.5, 0, 0], [0, 0, 2]]
@@ -139,3 +187,56 @@ def test_polyhedron_nonstandard_v_rep_2() -> None:
     mat3 = cdd.copy_output(poly2)
     assert not mat3.lin_set
     assert_matrix_almost_equal(mat3.array, [[0, 2, 1], [1, 0.5, 0.5]])
+
+
+def test_polyhedron_cache() -> None:
+    # square
+    array = [[1, 1, 0], [1, 0, 1], [1, -1, 0], [1, 0, -1]]
+    mat = cdd.matrix_from_array(array, rep_type=cdd.RepType.INEQUALITY)
+    poly = cdd.polyhedron_from_matrix(mat)
+    gen = poly.generators
+    assert_matrix_almost_equal(gen, cdd.copy_generators(poly).array)
+    assert_matrix_almost_equal(poly.inequalities, cdd.copy_inequalities(poly).array)
+    for cached, copy in [
+        (lambda: poly.generators, lambda poly: cdd.copy_generators(poly).array),
+        (lambda: poly.inequalities, lambda poly: cdd.copy_inequalities(poly).array),
+        (lambda: poly.adjacency, cdd.copy_adjacency),
+        (lambda: poly.input_adjacency, cdd.copy_input_adjacency),
+        (lambda: poly.incidence, cdd.copy_incidence),
+        (lambda: poly.input_incidence, cdd.copy_input_incidence),
+    ]:
+        xss = cached()
+        assert xss is cached()
+        assert isinstance(xss, tuple)
+        assert [list(xs) for xs in xss] == [list(xs) for xs in copy(poly)]
+    assert poly.generators_lin_set is poly.generators_lin_set
+    assert poly.generators_lin_set == cdd.copy_generators(poly).lin_set
+    assert poly.inequalities_lin_set == cdd.copy_inequalities(poly).lin_set
+    cdd.polyhedron_clear_cache(poly)
+    assert poly.generators is not gen
+    assert_matrix_almost_equal(poly.generators, gen)
+
+
+def test_polyhedron_cache_immutable() -> None:
+    # square
+    array = [[1, 1, 0], [1, 0, 1], [1, -1, 0], [1, 0, -1]]
+    mat = cdd.matrix_from_array(array, rep_type=cdd.RepType.INEQUALITY)
+    poly = cdd.polyhedron_from_matrix(mat)
+    for rows in [poly.generators, poly.inequalities]:
+        assert all(isinstance(row, tuple) for row in rows)
+        with pytest.raises(TypeError):
+            rows[0] = rows[1]  # type: ignore
+    for lin_set in [poly.generators_lin_set, poly.inequalities_lin_set]:
+        assert isinstance(lin_set, frozenset)
+        assert not lin_set
+
+
+def test_polyhedron_cache_lin_set() -> None:
+    # line through the origin
+    mat = cdd.matrix_from_array(
+        [[0, 1, 0], [1, 0, 0]], rep_type=cdd.RepType.GENERATOR, lin_set={0}
+    )
+    poly = cdd.polyhedron_from_matrix(mat)
+    assert poly.generators_lin_set == cdd.copy_generators(poly).lin_set
+    assert poly.inequalities_lin_set == cdd.copy_inequalities(poly).lin_set
+    assert poly.inequalities_lin_set
@@ -0,0 +1,102 @@
+from collections.abc import Sequence
+
+import pytest
+
+import cdd
+
+
+def sorted_rows(rows: Sequence[Sequence[float]]) -> list[list[float]]:
+    return sorted(list(row) for row in rows)
+
+
+def test_polyhedron_append_rows() -> None:
+    # unit square, cut by x + y <= 1
+    mat = cdd.matrix_from_array(
+        [[0, 1, 0], [0, 0, 1], [1, -1, 0], [1, 0, -1]],
+        rep_type=cdd.RepType.INEQUALITY,
+    )
+    poly = cdd.polyhedron_from_matrix(mat)
+    assert len(poly.generators) == 4
+    cdd.polyhedron_append_rows(poly, cdd.matrix_from_array([[1, -1, -1]]))
+    assert sorted_rows(poly.generators) == [[1, 0, 0], [1, 0, 1], [1, 1, 0]]
+    assert cdd.copy_input(poly).array == [*mat.array, [1, -1, -1]]
+    assert len(poly.incidence) == 3
+    generators = poly.generators
+    assert {tuple(generators[i]) for i in poly.input_incidence[4]} == {
+        (1, 0, 1),
+        (1, 1, 0),
+    }
+
+
+def test_polyhedron_append_rows_generators() -> None:
+    mat = cdd.matrix_from_array(
+        [[1, 0, 0], [1, 1, 0], [1, 0, 1]], rep_type=cdd.RepType.GENERATOR
+    )
+    poly = cdd.polyhedron_from_matrix(mat)
+    cdd.polyhedron_append_rows(
+        poly, cdd.matrix_from_array([[1, 1, 1]], rep_type=cdd.RepType.GENERATOR)
+    )
+    assert sorted_rows(poly.inequalities) == [
+        [0, 0, 1],
+        [0, 1, 0],
+        [1, -1, 0],
+        [1, 0, -1],
+    ]
+
+
+def test_polyhedron_append_rows_linearity() -> None:
+    # a cone, and an equality that cuts it to a segment
+    mat = cdd.matrix_from_array([[0, 1, -1]], rep_type=cdd.RepType.INEQUALITY)
+    poly = cdd.polyhedron_from_matrix(mat)
+    cdd.polyhedron_append_rows(
+        poly, cdd.matrix_from_array([[0, 1, 1], [-2, 1, 0]], lin_set={1})
+    )
+    assert sorted_rows(poly.generators) == [[1, 2, -2], [1, 2, 2]]
+    assert cdd.copy_input(poly).lin_set == {2}
+
+
+@pytest.mark.parametrize("lin_set", [set(), {1}])
+def test_polyhedron_append_rows_row_order(lin_set: set[int]) -> None:
+    # the row order and seed are kept, also when starting from scratch
+    mat = cdd.matrix_from_array(
+        [[0, 1, 0], [0, 0, 1], [1, -1, 0]], rep_type=cdd.RepType.INEQUALITY
+    )
+    poly = cdd.polyhedron_from_matrix(
+        mat, row_order=cdd.RowOrderType.RANDOM_ROW, seed=7
+    )
+    rows = cdd.matrix_from_array([[1, 0, -1], [2, -1, -1]], lin_set=lin_set)
+    cdd.polyhedron_append_rows(poly, rows)
+    assert poly.row_order == cdd.RowOrderType.RANDOM_ROW
+    cdd.matrix_append_to(mat, rows)
+    poly2 = cdd.polyhedron_from_matrix(
+        mat, row_order=cdd.RowOrderType.RANDOM_ROW, seed=7
+    )
+    assert sorted_rows(poly.generators) == sorted_rows(poly2.generators)
+    if lin_set:
+        assert poly.generators == poly2.generators
+
+
+def test_polyhedron_append_rows_empty() -> None:
+    mat = cdd.matrix_from_array([[0, 1], [1, -1]], rep_type=cdd.RepType.INEQUALITY)
+    poly = cdd.polyhedron_from_matrix(mat)
+    cdd.polyhedron_append_rows(poly, cdd.matrix_from_array([[-2, 1]]))
+    assert poly.generators == ()
+
+
+def test_polyhedron_append_rows_no_rows() -> None:
+    mat = cdd.matrix_from_array([[0, 1], [1, -1]], rep_type=cdd.RepType.INEQUALITY)
+    poly = cdd.polyhedron_from_matrix(mat)
+    generators = poly.generators
+    cdd.polyhedron_append_rows(poly, cdd.matrix_from_array([]))
+    assert poly.generators == generators
+
+
+def test_polyhedron_append_rows_invalid() -> None:
+    mat = cdd.matrix_from_array([[0, 1], [1, -1]], rep_type=cdd.RepType.INEQUALITY)
+    poly = cdd.polyhedron_from_matrix(mat)
+    with pytest.raises(ValueError, match="column sizes"):
+        cdd.polyhedron_append_rows(poly, cdd.matrix_from_array([[1, 2, 3]]))
+    with pytest.raises(ValueError, match="representation types"):
+        cdd.polyhedron_append_rows(
+            poly, cdd.matrix_from_array([[1, 2]], rep_type=cdd.RepType.GENERATOR)
+        )
@@ -0,0 +1,118 @@
+import _thread
+import pickle
+import random
+import threading
+from typing import Optional
+
+import pytest
+
+import cdd
+
+from . import assert_matrix_almost_equal, cyclic_polytope
+
+
+@pytest.mark.parametrize("row_order", [None, cdd.RowOrderType.MAX_CUTOFF, "auto"])
+def test_polyhedron_callback(row_order: Optional[cdd.RowOrderType]) -> None:
+    mat = cyclic_polytope(12)
+    progress: list[tuple[int, int, int, float]] = []
+
+    def callback(iteration: int, num_rows: int, num_rays: int, elapsed: float) -> None:
+        progress.append((iteration, num_rows, num_rays, elapsed))
+
+    poly = cdd.polyhedron_from_matrix(mat, row_order=row_order, callback=callback)
+    assert progress
+    assert all(num_rows == 12 for _, num_rows, _, _ in progress)
+    iterations = [iteration for iteration, _, _, _ in progress]
+    assert iterations == sorted(iterations)
+    assert iterations[-1] < 12
+    assert all(elapsed >= 0 for _, _, _, elapsed in progress)
+    assert_matrix_almost_equal(
+        sorted(map(list, poly.inequalities)),
+        sorted(map(list, cdd.polyhedron_from_matrix(mat).inequalities)),
+    )
+
+
+def test_polyhedron_callback_exception() -> None:
+    class Stop(Exception):
+        pass
+
+    def callback(iteration: int, num_rows: int, num_rays: int, elapsed: float) -> None:
+        if iteration >= 8:
+            raise Stop
+
+    with pytest.raises(Stop):
+        cdd.polyhedron_from_matrix(cyclic_polytope(12), callback=callback)
+    with pytest.raises(Stop):
+        cdd.polyhedron_from_matrix(
+            cyclic_polytope(12), row_order="auto", callback=callback
+        )
+
+
+@pytest.mark.parametrize("row_order", [None, "auto"])
+def test_polyhedron_callback_reentry(row_order: Optional[str]) -> None:
+    mat = cyclic_polytope(12)
+
+    def callback(iteration: int, num_rows: int, num_rays: int, elapsed: float) -> None:
+        cdd.matrix_rank(mat)
+
+    with pytest.raises(RuntimeError, match="already in use"):
+        cdd.polyhedron_from_matrix(mat, row_order=row_order, callback=callback)
+    # cddlib is released again
+    poly = cdd.polyhedron_from_matrix(mat)
+    assert len(cdd.copy_inequalities(poly).array) == 54
+
+
+@pytest.mark.parametrize("row_order", [None, "auto"])
+def test_polyhedron_time_limit(row_order: Optional[str]) -> None:
+    mat = cyclic_polytope(12)
+    with pytest.raises(cdd.TimeLimitError) as excinfo:
+        cdd.polyhedron_from_matrix(mat, row_order=row_order, time_limit=0)
+    exc = excinfo.value
+    assert isinstance(exc, TimeoutError)
+    assert exc.num_rows == 12
+    assert 0 <= exc.iteration < 12
+    assert exc.num_rays > 0
+    assert exc.elapsed >= exc.time_limit == 0
+    assert str(exc) == (
+        f"time limit of 0.0 seconds reached after {exc.iteration} of 12 rows"
+    )
+    exc2 = pickle.loads(pickle.dumps(exc))
+    assert (exc2.iteration, exc2.elapsed) == (exc.iteration, exc.elapsed)
+    poly = cdd.polyhedron_from_matrix(mat, row_order=row_order, time_limit=100)
+    assert len(poly.inequalities) == 54  # 12 * (12 - 3) / 2
+    with pytest.raises(ValueError, match="time_limit must be non-negative"):
+        cdd.polyhedron_from_matrix(mat, time_limit=-1)
+
+
+def test_block_elimination_progress() -> None:
+    # 0 <= 1 + a + b + c + d,  0 <= 1 + 2a - b - c - d
+    array = [[1, 1, 1, 1, 1], [1, 2, -1, -1, -1]]
+    mat1 = cdd.matrix_from_array(array, rep_type=cdd.RepType.INEQUALITY)
+    progress = []
+    mat2 = cdd.block_elimination(
+        mat1, {2, 3, 4}, callback=lambda *args: progress.append(args), time_limit=100
+    )
+    assert_matrix_almost_equal(mat2.array, [[2, 3]])
+    assert mat2.lin_set == set()
+    assert progress
+    with pytest.raises(cdd.TimeLimitError):
+        cdd.block_elimination(mat1, {2, 3, 4}, time_limit=0)
+
+
+def test_polyhedron_keyboard_interrupt() -> None:
+    # signals are checked also without callback and time_limit
+    rng = random.Random(0)
+    array = [[1] + [rng.gauss(0, 1) for _ in range(5)] for _ in range(200)]
+    mat = cdd.matrix_from_array(array, rep_type=cdd.RepType.GENERATOR)
+    timer = threading.Timer(0.05, _thread.interrupt_main)
+    timer.start()
+    try:
+        with pytest.raises(KeyboardInterrupt) as excinfo:
+            for _ in range(1000):
+                cdd.polyhedron_from_matrix(mat)
+    finally:
+        timer.cancel()
+    # raised from within cdd, not between calls
+    assert str(excinfo.traceback[-1].path).endswith("pycddlib.pxi")
+    # cddlib is released again
+    assert cdd.matrix_rank(mat)[2] == 6
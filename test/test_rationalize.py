@@ -0,0 +1,17 @@
+import pytest
+
+import cdd
+
+
+def test_max_denominator() -> None:
+    mat = cdd.matrix_from_array([[0.3333, 2.5]], max_denominator=10)
+    assert mat.array == [[1 / 3, 2.5]]
+    lp = cdd.linprog_from_array(
+        [[0.3333, 2.5]], obj_type=cdd.LPObjType.MAX, tolerance=1e-3
+    )
+    assert lp.array == [[1 / 3, 2.5]]
+
+
+def test_scale_rows() -> None:
+    with pytest.raises(ValueError, match="cdd.gmp"):
+        cdd.matrix_from_array([[1.0]], scale_rows=True)  # type: ignore
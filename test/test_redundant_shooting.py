@@ -0,0 +1,90 @@
+import math
+import random
+
+import pytest
+
+import cdd
+
+
+def random_polytope(rng: random.Random, dim: int, num_rows: int) -> list[list[float]]:
+    # halfspaces tangent to the unit sphere, or further away (often redundant)
+    array = []
+    for _ in range(num_rows):
+        a = [rng.gauss(0, 1) for _ in range(dim)]
+        norm = math.sqrt(sum(x * x for x in a))
+        b = 1.0 if rng.random() < 0.2 else 1.0 + rng.random()
+        array.append([b] + [-x / norm for x in a])
+    return array
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_redundant_rows_shooting_random(seed: int) -> None:
+    rng = random.Random(seed)
+    dim = rng.randint(2, 4)
+    mat = cdd.matrix_from_array(
+        random_polytope(rng, dim, rng.randint(dim + 1, 50)),
+        rep_type=cdd.RepType.INEQUALITY,
+    )
+    red = cdd.redundant_rows(mat)
+    assert cdd.redundant_rows(mat, method="shooting") == red
+    assert cdd.redundant_rows(mat, method="auto") == red
+    assert cdd.redundant_rows(mat, interior_point=[0] * dim, method="shooting") == red
+
+
+def test_redundant_rows_shooting_unbounded() -> None:
+    # 0 <= x, 0 <= 1 + x (redundant), 0 <= y
+    mat = cdd.matrix_from_array(
+        [[0, 1, 0], [1, 1, 0], [0, 0, 1]], rep_type=cdd.RepType.INEQUALITY
+    )
+    assert cdd.redundant_rows(mat, method="shooting") == {1}
+    assert cdd.redundant_rows(mat, method="shooting", interior_point=[1, 1]) == {1}
+
+
+def test_redundant_rows_shooting_no_interior() -> None:
+    # 0 <= x, 0 <= -x, 0 <= 1 + y, 0 <= 2 + y (redundant)
+    # no interior point, so the lp method is used
+    mat = cdd.matrix_from_array(
+        [[0, 1, 0], [0, -1, 0], [1, 0, 1], [2, 0, 1]],
+        rep_type=cdd.RepType.INEQUALITY,
+    )
+    assert cdd.redundant_rows(mat, method="shooting") == {3}
+
+
+def test_redundant_rows_shooting_generator() -> None:
+    mat = cdd.matrix_from_array(
+        [[1, 0], [1, 1], [1, 2]], rep_type=cdd.RepType.GENERATOR
+    )
+    assert cdd.redundant_rows(mat, method="auto") == {1}
+    with pytest.raises(ValueError, match="rep_type INEQUALITY"):
+        cdd.redundant_rows(mat, method="shooting")
+
+
+def test_redundant_rows_shooting_errors() -> None:
+    mat = cdd.matrix_from_array(
+        [[1, 1], [1, -1], [2, 1]], rep_type=cdd.RepType.INEQUALITY
+    )
+    with pytest.raises(ValueError, match="method must be"):
+        cdd.redundant_rows(mat, method="simplex")
+    with pytest.raises(ValueError, match="requires the shooting method"):
+        cdd.redundant_rows(mat, interior_point=[0])
+    with pytest.raises(ValueError, match="length 1"):
+        cdd.redundant_rows(mat, method="shooting", interior_point=[0, 0])
+    with pytest.raises(ValueError, match="strictly"):
+        cdd.redundant_rows(mat, method="shooting", interior_point=[1])
+    mat.lin_set = {0}
+    with pytest.raises(ValueError, match="empty lin_set"):
+        cdd.redundant_rows(mat, method="shooting")
+    assert cdd.redundant_rows(mat, method="auto") == cdd.redundant_rows(mat)
+
+
+def test_matrix_redundancy_remove_shooting() -> None:
+    # 0 <= 2 + x (redundant), 0 <= 1 + x, 0 <= 1 - x, 0 <= 3 - x (redundant)
+    mat = cdd.matrix_from_array(
+        [[2, 1], [1, 1], [1, -1], [3, -1]], rep_type=cdd.RepType.INEQUALITY
+    )
+    red, pos = cdd.matrix_redundancy_remove(
+        mat, method="shooting", interior_point=[0.5]
+    )
+    assert red == {0, 3}
+    assert pos == [None, 0, 1, None]
+    assert mat.array == [[1, 1], [1, -1]]
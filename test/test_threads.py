@@ -0,0 +1,39 @@
+import random
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+import cdd
+
+
+def _random_points(seed: int) -> Sequence[Sequence[float]]:
+    rnd = random.Random(seed)
+    return [[1] + [rnd.randint(-20, 20) for _ in range(4)] for _ in range(25)]
+
+
+def _solve(seed: int) -> tuple[object, ...]:
+    mat = cdd.matrix_from_array(_random_points(seed), rep_type=cdd.RepType.GENERATOR)
+    poly = cdd.polyhedron_from_matrix(mat)
+    ineqs = cdd.copy_inequalities(poly)
+    redundant = cdd.redundant_rows(mat)
+    lp = cdd.linprog_from_array(
+        [[1] + [-1] * 4] + [list(row) for row in ineqs.array] + [[0, 1, 2, 3, 4]],
+        obj_type=cdd.LPObjType.MAX,
+    )
+    cdd.linprog_solve(lp)
+    return (
+        ineqs.array,
+        cdd.copy_adjacency(poly),
+        cdd.copy_input_incidence(poly),
+        redundant,
+        lp.status,
+        lp.obj_value,
+        lp.primal_solution,
+    )
+
+
+def test_threads() -> None:
+    seeds = list(range(32))
+    expected = [_solve(seed) for seed in seeds]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for _ in range(3):
+            assert list(executor.map(_solve, seeds)) == expected
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import pytest
+
+import cdd
+
+from . import assert_matrix_almost_equal
+
+
+def test_matrix_to_file(tmp_path: Path) -> None:
+    mat = cdd.matrix_from_array(
+        [[1, 2, 3], [4, 5.5, 6]],
+        lin_set=[0],
+        rep_type=cdd.RepType.GENERATOR,
+        obj_type=cdd.LPObjType.MIN,
+        obj_func=[1, 1, 1],
+    )
+    path = tmp_path / "test.ext"
+    cdd.matrix_to_file(mat, path)
+    assert path.read_text() == str(mat) + "\n"
+    mat2 = cdd.matrix_from_file(path)
+    assert_matrix_almost_equal(mat2.array, mat.array)
+    assert mat2.lin_set == mat.lin_set
+    assert mat2.rep_type == mat.rep_type
+    assert mat2.obj_type == mat.obj_type
+
+
+def test_linprog_to_file(tmp_path: Path) -> None:
+    lp = cdd.linprog_from_array([[1, -1], [0, 1]], obj_type=cdd.LPObjType.MAX)
+    cdd.linprog_solve(lp)
+    path = tmp_path / "test.txt"
+    cdd.linprog_to_file(lp, str(path))
+    assert path.read_text() == str(lp) + "\n"
+
+
+def test_polyhedron_to_file(tmp_path: Path) -> None:
+    mat = cdd.matrix_from_array(
+        [[1, 1, 0], [1, 0, 1], [1, -1, 0], [1, 0, -1]],
+        rep_type=cdd.RepType.INEQUALITY,
+    )
+    poly = cdd.polyhedron_from_matrix(mat)
+    path = tmp_path / "test.txt"
+    cdd.polyhedron_to_file(poly, path)
+    assert path.read_text() == str(poly) + "\n"
+
+
+def test_to_file_error(tmp_path: Path) -> None:
+    mat = cdd.matrix_from_array([[1, 1]])
+    with pytest.raises(FileNotFoundError):
+        cdd.matrix_to_file(mat, tmp_path / "missing" / "test.ine")
+    with pytest.raises(OSError):
+        cdd.matrix_to_file(mat, tmp_path)